@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Conversation, QAPair
+from .models import Conversation, QAPair, BugReport
 
 
 @admin.register(Conversation)
@@ -10,5 +10,13 @@ class ConversationAdmin(admin.ModelAdmin):
 
 @admin.register(QAPair)
 class QAPairAdmin(admin.ModelAdmin):
-    list_display = ('id', 'conversation', 'question_text', 'created_at')
+    list_display = ('id', 'conversation', 'question_text', 'status', 'created_at')
+    list_filter = ('status',)
     search_fields = ('question_text', 'answer_text')
+
+
+@admin.register(BugReport)
+class BugReportAdmin(admin.ModelAdmin):
+    list_display = ('id', 'member_id', 'answer_id', 'status', 'attempts', 'next_attempt_at', 'created_at')
+    list_filter = ('status',)
+    search_fields = ('member_id', 'answer_id', 'query')
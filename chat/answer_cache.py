@@ -0,0 +1,49 @@
+"""
+GPT 답변 캐시
+
+같은 시리즈의 같은 시청 범위에서 거의 같은 질문이 반복되면 GPT를 다시 호출하지 않고
+이전 답변을 재사용합니다. 키는 (정규화된 질문, 시리즈 ID, 에피소드 상한, 대화 메모리, 프롬프트 버전)이며,
+프로세스 메모리에 TTL + LRU 방식으로 저장합니다.
+"""
+import re
+import unicodedata
+from typing import Optional
+
+from django.conf import settings
+
+from config.cache import TTLCache
+from .services import PROMPT_VERSION
+
+_PUNCT_RE = re.compile(r"[^\w\s]", re.UNICODE)
+_SPACE_RE = re.compile(r"\s+")
+
+
+def normalize_question(question: str) -> str:
+    """
+    캐시 키용 질문 정규화: 유니코드 NFKC, 소문자, 문장부호 제거, 공백 정리
+    ("나루토 1화 줄거리?" 와 " 나루토  1화 줄거리 " 는 같은 키가 됨)
+    """
+    text = unicodedata.normalize("NFKC", question or "").lower()
+    text = _PUNCT_RE.sub(" ", text)
+    return _SPACE_RE.sub(" ", text).strip()
+
+
+def answer_key(question: str, series_id: Optional[int], bound: Optional[int], memory: Optional[str] = None) -> tuple:
+    """
+    답변 캐시 키 (bound가 None이면 시청 범위 제한 없음)
+
+    memory는 ConversationMemory.fingerprint()로, 이전 대화에 따라 달라지는 후속 질문은
+    같은 대화 맥락에서만 재사용됩니다. (첫 질문은 None이라 대화 간에 공유)
+    """
+    return ("answer", normalize_question(question), series_id, bound, memory, PROMPT_VERSION)
+
+
+def summary_key(question: str) -> tuple:
+    """대화 요약 캐시 키"""
+    return ("summary", normalize_question(question), PROMPT_VERSION)
+
+
+answer_cache = TTLCache(
+    max_entries=getattr(settings, "CHAT_ANSWER_CACHE_SIZE", 1024),
+    ttl=getattr(settings, "CHAT_ANSWER_CACHE_TTL", 3600),
+)
@@ -0,0 +1,86 @@
+"""
+질문 답변 생성 공통 로직
+
+동기/비동기 API 뷰와 백그라운드 답변 워커(run_answer_worker)가 같은 방식으로
+요약, 대화 메모리, 답변 캐시, 컨텍스트 수집, GPT 호출을 수행하도록 모아둔 모듈입니다.
+"""
+
+from .answer_cache import answer_cache, answer_key, summary_key
+from .context import collect_context, get_spoiler_bound
+from .memory import load_memory, update_memory
+from .models import QAPair
+from .services import GPTService, AsyncGPTService, FALLBACK_RESPONSE, fallback_summary
+
+gpt_service = GPTService()
+async_gpt_service = AsyncGPTService()
+
+
+def remember_answer(cache_key, answer):
+    """정상 생성된 답변만 캐시에 저장 (에러 기본 메시지는 저장하지 않음)"""
+    if answer and answer != FALLBACK_RESPONSE:
+        answer_cache.set(cache_key, answer)
+
+
+def remember_summary(question, summary):
+    """정상 생성된 질문 요약만 캐시에 저장 (실패 시 대신 쓴 요약은 저장하지 않음)"""
+    if summary and summary != fallback_summary(question):
+        answer_cache.set(summary_key(question), summary)
+
+
+def answer_status(answer):
+    """답변을 저장할 때의 QAPair 상태 (에러 기본 메시지면 failed)"""
+    return QAPair.STATUS_DONE if answer != FALLBACK_RESPONSE else QAPair.STATUS_FAILED
+
+
+def summarize(question):
+    """질문 요약 (같은 질문이면 캐시된 요약 재사용)"""
+    key = summary_key(question)
+    summary = answer_cache.get(key)
+    if summary is None:
+        summary = gpt_service.summarize_question(question)
+        remember_summary(question, summary)
+    return summary
+
+
+async def asummarize(question):
+    """summarize의 비동기 버전"""
+    key = summary_key(question)
+    summary = answer_cache.get(key)
+    if summary is None:
+        summary = await async_gpt_service.summarize_question(question)
+        remember_summary(question, summary)
+    return summary
+
+
+def answer_qapair(qa: QAPair) -> str:
+    """
+    백그라운드 모드로 생성된 QAPair의 답변을 생성해 저장합니다.
+
+    질문한 사용자는 Conversation.user로 보고 스포일러 경계를 계산합니다.
+    대화의 첫 질문이고 요약이 비어 있으면 요약도 함께 채우고, 답변 뒤에 대화 메모리를 갱신합니다.
+
+    Returns:
+        str: 저장한 답변 (GPT 호출 실패 시 FALLBACK_RESPONSE)
+    """
+    conv = qa.conversation
+    question = qa.question_text
+
+    if not conv.summary and not conv.qapairs.filter(id__lt=qa.id).exists():
+        conv.summary = summarize(question)
+        conv.save(update_fields=['summary'])
+
+    bound = get_spoiler_bound(conv.user, conv.series_id) if conv.series_id else None
+    memory = load_memory(conv, before_id=qa.id)
+    cache_key = answer_key(question, conv.series_id, bound, memory.fingerprint())
+    answer = answer_cache.get(cache_key)
+    if answer is None:
+        additional_context = collect_context(conv, question, conv.user, bound=bound)
+        answer = gpt_service.generate_response(question, additional_context, memory.messages())
+        remember_answer(cache_key, answer)
+
+    qa.answer_text = answer
+    qa.status = answer_status(answer)
+    qa.save(update_fields=['answer_text', 'status'])
+    if qa.status == QAPair.STATUS_DONE:
+        update_memory(conv, gpt_service)
+    return answer
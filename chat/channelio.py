@@ -7,9 +7,25 @@ from typing import Optional
 import requests
 from django.conf import settings
 
+from config.cache import TTLCache
+from config.http import http_client
+
 logger = logging.getLogger(__name__)
 
 BASE_URL = getattr(settings, "CHANNEL_OPEN_BASE_URL", "https://api.channel.io/open/v5")
+# (연결, 읽기) timeout(초)
+TIMEOUT = (3.05, 5)
+
+# memberId -> userId, userId -> userChatId 매핑은 거의 바뀌지 않으므로 TTL 캐시에 보관
+# (404/422 응답을 받으면 해당 매핑을 지우고 다시 조회)
+_user_id_cache = TTLCache(
+    max_entries=getattr(settings, "CHANNEL_IO_ID_CACHE_SIZE", 10000),
+    ttl=getattr(settings, "CHANNEL_IO_ID_CACHE_TTL", 86400),
+)
+_user_chat_id_cache = TTLCache(
+    max_entries=getattr(settings, "CHANNEL_IO_ID_CACHE_SIZE", 10000),
+    ttl=getattr(settings, "CHANNEL_IO_ID_CACHE_TTL", 86400),
+)
 
 
 class ChannelIoError(Exception):
@@ -20,13 +36,33 @@ class ChannelIoUserNotFound(ChannelIoError):
     """memberId로 유저를 찾지 못했을 때"""
 
 
+class ChannelIoUserChatNotFound(ChannelIoError):
+    """userChatId(또는 그 유저)가 더 이상 없을 때 (캐시된 ID가 오래된 경우)"""
+
+
+def _request(method: str, url: str, **kwargs) -> requests.Response:
+    """공유 HTTP 클라이언트로 호출하고 네트워크 오류는 ChannelIoError로 바꿉니다."""
+    try:
+        return http_client.request(method, url, timeout=TIMEOUT, **kwargs)
+    except requests.RequestException as e:
+        raise ChannelIoError(f"Channel.io request failed: {e}") from e
+
+
+def clear_id_cache() -> None:
+    """memberId/userId 매핑 캐시 비우기"""
+    _user_id_cache.clear()
+    _user_chat_id_cache.clear()
+
+
 def _auth_headers() -> dict:
-    if not settings.CHANNEL_OPEN_ACCESS_KEY or not settings.CHANNEL_IO_ACCESS_SECRET:
-        raise ChannelIoError("CHANNEL_IO_ACCESS_KEY / SECRET 이 설정되지 않았습니다.")
+    access_key = getattr(settings, "CHANNEL_OPEN_API_KEY", None)
+    access_secret = getattr(settings, "CHANNEL_OPEN_API_SECRET", None)
+    if not access_key or not access_secret:
+        raise ChannelIoError("CHANNEL_ACCESS_KEY / SECRET 이 설정되지 않았습니다.")
 
     return {
-        "x-access-key": settings.CHANNEL_OPEN_ACCESS_KEY,
-        "x-access-secret": settings.CHANNEL_OPEN_ACCESS_SECRET,
+        "x-access-key": access_key,
+        "x-access-secret": access_secret,
         "accept": "application/json",
         "Content-Type": "application/json",
     }
@@ -36,12 +72,16 @@ def _auth_headers() -> dict:
 def get_channel_user_id(member_id: str) -> str:
     """
     GET /open/v5/users/{memberId}
-    응답의 user.id 가 channel userId
+    응답의 user.id 가 channel userId (TTL 캐시)
     """
+    cached = _user_id_cache.get(member_id)
+    if cached is not None:
+        return cached
+
     url = f"{BASE_URL}/users/{member_id}"
     headers = _auth_headers()
 
-    resp = requests.get(url, headers=headers, timeout=5)
+    resp = _request("GET", url, headers=headers)
 
     # memberId 를 못 찾으면 422 notFoundError
     if resp.status_code == 422:
@@ -60,6 +100,7 @@ def get_channel_user_id(member_id: str) -> str:
     if not user_id:
         raise ChannelIoError(f"user.id 가 응답에 없습니다: {data}")
 
+    _user_id_cache.set(member_id, user_id)
     return user_id
 
 
@@ -68,12 +109,19 @@ def get_or_create_user_chat_id(user_id: str) -> str:
     """
     1) GET /open/v5/users/{userId}/user-chats 로 목록 조회
     2) 없으면 POST /open/v5/users/{userId}/user-chats 로 새 채팅 생성
+    결과는 TTL 캐시에 보관합니다.
     """
+    cached = _user_chat_id_cache.get(user_id)
+    if cached is not None:
+        return cached
+
     headers = _auth_headers()
 
     # 2-1. 기존 user chat 목록 조회
     list_url = f"{BASE_URL}/users/{user_id}/user-chats"
-    resp = requests.get(list_url, headers=headers, timeout=5)
+    resp = _request("GET", list_url, headers=headers)
+    if resp.status_code in (404, 422):
+        raise ChannelIoUserChatNotFound(f"Channel user not found for userId={user_id}")
     try:
         resp.raise_for_status()
     except requests.RequestException as e:
@@ -91,10 +139,11 @@ def get_or_create_user_chat_id(user_id: str) -> str:
             (c for c in chats if c.get("state") != "closed"),
             chats[0],
         )
+        _user_chat_id_cache.set(user_id, open_chat["id"])
         return open_chat["id"]
 
     # 2-2. 없으면 새 user chat 생성
-    create_resp = requests.post(list_url, headers=headers, json={}, timeout=5)
+    create_resp = _request("POST", list_url, headers=headers, json={})
     try:
         create_resp.raise_for_status()
     except requests.RequestException as e:
@@ -108,6 +157,7 @@ def get_or_create_user_chat_id(user_id: str) -> str:
     if not user_chat_id:
         raise ChannelIoError(f"userChat.id 를 찾을 수 없습니다: {created}")
 
+    _user_chat_id_cache.set(user_id, user_chat_id)
     return user_chat_id
 
 
@@ -151,7 +201,9 @@ def send_bug_report_message(
         ]
     }
 
-    resp = requests.post(url, headers=headers, json=payload, timeout=5)
+    resp = _request("POST", url, headers=headers, json=payload)
+    if resp.status_code in (404, 422):
+        raise ChannelIoUserChatNotFound(f"Channel user chat not found: {user_chat_id}")
     try:
         resp.raise_for_status()
     except requests.RequestException as e:
@@ -174,13 +226,24 @@ def report_bug_with_member_id(
     - memberId -> userId
     - userId -> userChatId (get_or_create)
     - userChatId 로 버그 리포트 메시지 전송
+
+    두 매핑은 캐시되므로 같은 사용자가 다시 신고하면 메시지 전송 한 번만 호출합니다.
+    캐시된 userId/userChatId가 더 이상 유효하지 않으면(404/422) 캐시를 지우고 한 번 다시 조회합니다.
     """
-    user_id = get_channel_user_id(member_id)
-    user_chat_id = get_or_create_user_chat_id(user_id)
-    return send_bug_report_message(
-        user_chat_id=user_chat_id,
-        query=query,
-        answer_text=answer_text,
-        answer_id=answer_id,
-        extra_info=extra_info,
-    )
+    for attempt in range(2):
+        user_id = get_channel_user_id(member_id)
+        try:
+            user_chat_id = get_or_create_user_chat_id(user_id)
+            return send_bug_report_message(
+                user_chat_id=user_chat_id,
+                query=query,
+                answer_text=answer_text,
+                answer_id=answer_id,
+                extra_info=extra_info,
+            )
+        except ChannelIoUserChatNotFound:
+            _user_id_cache.delete(member_id)
+            _user_chat_id_cache.delete(user_id)
+            if attempt:
+                raise
+            logger.info("Cached channel ids for memberId=%s are stale, resolving again", member_id)
@@ -0,0 +1,205 @@
+"""
+GPT 프롬프트에 넣을 시리즈 컨텍스트 구성
+
+시리즈 기본 정보와 함께, 사용자의 시청 진행도(WatchingStatus) 이내의 에피소드 내용만
+검색해서 넣어 스포일러 없는 답변을 유도합니다.
+
+컨텍스트는 토큰 예산(CHAT_CONTEXT_TOKEN_BUDGET) 안에 들어가도록 잘라내며,
+시리즈 정보처럼 요청마다 같은 내용을 앞에 두어 LLM 제공자의 prefix 캐시가 적중하도록 합니다.
+"""
+import logging
+import math
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from django.conf import settings
+
+from episode.retrieval import search_passages
+from episode.vector_index import search_vectors
+from user.models import WatchingStatus
+
+logger = logging.getLogger(__name__)
+
+# 잘라서라도 넣을 최소 남은 예산 (이보다 적으면 snippet을 버림)
+MIN_TRUNCATE_TOKENS = 32
+
+
+def _char_tokens(ch: str) -> float:
+    # 영문/숫자는 약 4글자당 1토큰, 한글 등 비ASCII 문자는 글자당 약 1토큰으로 추정
+    return 0.25 if ord(ch) < 128 else 1.0
+
+
+def estimate_tokens(text: str) -> int:
+    """토크나이저 없이 빠르게 계산하는 토큰 수 추정치"""
+    return math.ceil(sum(_char_tokens(ch) for ch in text or ""))
+
+
+def truncate_to_tokens(text: str, max_tokens: int, suffix: str = "…") -> str:
+    """추정 토큰 수가 max_tokens 이하가 되도록 뒤를 잘라냅니다."""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    budget = max_tokens - estimate_tokens(suffix)
+    used = 0.0
+    for i, ch in enumerate(text):
+        used += _char_tokens(ch)
+        if used > budget:
+            return text[:i] + suffix
+    return text
+
+
+@dataclass
+class ContextSnippet:
+    """
+    컨텍스트 한 조각
+
+    - stable: 같은 시리즈면 요청마다 동일한 내용 (앞쪽에 배치해 prefix 캐시 적중)
+    - required: 예산이 부족해도 반드시 포함 (스포일러 방지 안내 등)
+    - priority: 예산이 부족할 때 높은 것부터 포함 (검색 순위 등)
+    """
+    text: str
+    stable: bool = False
+    required: bool = False
+    priority: float = 0.0
+
+
+@dataclass
+class PackedContext:
+    """토큰 예산에 맞춰 구성된 컨텍스트와 요청별 지표"""
+    snippets: List[str] = field(default_factory=list)
+    budget: int = 0
+    used_tokens: int = 0
+    dropped: int = 0
+    truncated: int = 0
+
+    def metrics(self) -> dict:
+        return {
+            "budget": self.budget,
+            "used_tokens": self.used_tokens,
+            "snippets": len(self.snippets),
+            "dropped": self.dropped,
+            "truncated": self.truncated,
+        }
+
+
+def pack_context(snippets: List[ContextSnippet], budget: int = None) -> PackedContext:
+    """
+    snippet 목록을 토큰 예산 안에 들어가도록 정렬/절삭합니다.
+
+    1. required snippet의 토큰을 먼저 예약합니다.
+    2. stable snippet을 주어진 순서대로, 나머지는 priority 내림차순으로 배치합니다.
+    3. 예산을 넘는 snippet은 남은 예산이 MIN_TRUNCATE_TOKENS 이상이면 잘라서 넣고, 아니면 버립니다.
+    """
+    budget = budget if budget is not None else getattr(settings, "CHAT_CONTEXT_TOKEN_BUDGET", 1500)
+    ordered = [s for s in snippets if s.stable] + sorted(
+        (s for s in snippets if not s.stable), key=lambda s: -s.priority
+    )
+
+    packed = PackedContext(budget=budget)
+    reserved = sum(estimate_tokens(s.text) for s in ordered if s.required)
+    for snippet in ordered:
+        cost = estimate_tokens(snippet.text)
+        if snippet.required:
+            reserved -= cost
+            packed.snippets.append(snippet.text)
+            packed.used_tokens += cost
+            continue
+
+        remaining = budget - packed.used_tokens - reserved
+        if cost <= remaining:
+            packed.snippets.append(snippet.text)
+            packed.used_tokens += cost
+        elif remaining >= MIN_TRUNCATE_TOKENS:
+            text = truncate_to_tokens(snippet.text, remaining)
+            packed.snippets.append(text)
+            packed.used_tokens += estimate_tokens(text)
+            packed.truncated += 1
+        else:
+            packed.dropped += 1
+
+    return packed
+
+
+def get_spoiler_bound(user, series_id: int) -> Optional[int]:
+    """
+    사용자가 스포일러 없이 볼 수 있는 에피소드 순번(시리즈 내 1부터) 상한을 반환합니다.
+
+    - 시청완료(completed): None (제한 없음)
+    - 그 외 시청 기록: WatchingStatus.current_episode
+    - 시청 기록이 없거나 익명 사용자: 0 (에피소드 내용 사용 안 함)
+    """
+    if user is None or not user.is_authenticated:
+        return 0
+    status = (
+        WatchingStatus.objects
+        .filter(user=user, series_id=series_id)
+        .values('status', 'current_episode')
+        .first()
+    )
+    if not status:
+        return 0
+    if status['status'] == 'completed':
+        return None
+    return max(status['current_episode'], 0)
+
+
+def search_episode_passages(series_id: int, question: str, bound: Optional[int]):
+    """
+    CHAT_RETRIEVAL_BACKEND 설정에 따라 관련 에피소드 passage를 검색합니다.
+    'vector'인데 임베딩 색인이 없으면 BM25 검색으로 대체합니다.
+    """
+    if getattr(settings, 'CHAT_RETRIEVAL_BACKEND', 'bm25') == 'vector':
+        passages = search_vectors(series_id, question, max_ordinal=bound)
+        if passages is not None:
+            return passages
+    return search_passages(series_id, question, max_ordinal=bound)
+
+
+_UNSET = object()
+
+
+def collect_context(conv, question: str, user=None, bound=_UNSET) -> List[str]:
+    """
+    Conversation의 시리즈에 대해 GPT 컨텍스트 목록을 수집합니다.
+
+    Args:
+        conv (Conversation): 질문이 속한 대화
+        question (str): 사용자 질문 (관련 에피소드 검색에 사용)
+        user (User): 질문한 사용자 (스포일러 경계 계산에 사용)
+        bound (Optional[int]): 이미 계산한 스포일러 경계 (생략 시 user로 계산)
+
+    Returns:
+        List[str]: 토큰 예산 안에 들어가는 시리즈 정보, 시청 범위 안내, 관련 에피소드 내용
+    """
+    if not conv.series_id:
+        return []
+
+    series = conv.series
+    # 시리즈 정보는 요청마다 같으므로 가장 앞에 둠 (prefix 캐시)
+    snippets = [
+        ContextSnippet(f"시리즈 제목: {series.title}", stable=True, required=True),
+        ContextSnippet(f"시리즈 설명: {series.description}", stable=True),
+    ]
+
+    if bound is _UNSET:
+        bound = get_spoiler_bound(user, series.id)
+    if bound is None:
+        snippets.append(ContextSnippet("사용자는 이 시리즈를 모두 시청했습니다.", stable=True, required=True))
+    elif bound == 0:
+        snippets.append(ContextSnippet(
+            "사용자는 아직 에피소드를 시청하지 않았습니다. 시리즈 소개 이외의 줄거리는 절대 언급하지 마세요.",
+            stable=True, required=True,
+        ))
+    else:
+        snippets.append(ContextSnippet(
+            f"사용자는 {bound}번째 에피소드까지 시청했습니다. 그 이후 내용은 절대 언급하지 마세요.",
+            stable=True, required=True,
+        ))
+
+    if bound != 0:
+        passages = search_episode_passages(series.id, question, bound)
+        for rank, passage in enumerate(passages):
+            snippets.append(ContextSnippet(f"[{passage.label}] {passage.text}", priority=-rank))
+
+    packed = pack_context(snippets)
+    logger.info("chat context packed (conversation=%s): %s", conv.id, packed.metrics())
+    return packed.snippets
@@ -0,0 +1,149 @@
+"""
+백그라운드 답변 작업 (DB 기반 작업 큐)
+
+background 모드로 등록된 질문은 status=pending인 QAPair로 저장되고,
+run_answer_worker 명령이 띄운 워커 스레드들이 이를 가져가 답변을 채웁니다.
+
+작업 점유는 조건부 UPDATE(status=pending → running)로 하므로 여러 워커 프로세스가
+동시에 떠 있어도 같은 작업을 두 번 처리하지 않습니다.
+"""
+import logging
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import List
+
+from django.db import close_old_connections
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .answering import answer_qapair
+from .models import QAPair
+from .services import FALLBACK_RESPONSE
+
+logger = logging.getLogger(__name__)
+
+
+def retry_delay(attempts: int, base: float = 30.0, cap: float = 3600.0) -> float:
+    """attempts번 실패한 뒤 다음 시도까지 기다릴 시간(초): base * 2^(attempts-1), cap 이하, ±20% jitter"""
+    delay = min(cap, base * (2 ** max(attempts - 1, 0)))
+    return delay * random.uniform(0.8, 1.2)
+
+
+def claim_jobs(limit: int, stale_after: float = 300) -> List[int]:
+    """
+    대기 중이고 재시도 시각(next_attempt_at)이 지난 작업을 오래된 순으로 최대 limit개 점유하고 ID 목록을 반환합니다.
+    워커가 죽어 stale_after초 넘게 running으로 남은 작업도 다시 가져옵니다.
+    """
+    if limit <= 0:
+        return []
+    now = timezone.now()
+    due = Q(status=QAPair.STATUS_PENDING) & (Q(next_attempt_at__isnull=True) | Q(next_attempt_at__lte=now))
+    stale = Q(status=QAPair.STATUS_RUNNING, claimed_at__lt=now - timedelta(seconds=stale_after))
+    candidates = (
+        QAPair.objects
+        .filter(due | stale)
+        .order_by('id')
+        .values_list('id', 'status', 'claimed_at')[:limit * 2]
+    )
+
+    claimed = []
+    for pk, status, claimed_at in candidates:
+        updated = (
+            QAPair.objects
+            .filter(pk=pk, status=status, claimed_at=claimed_at)
+            .update(status=QAPair.STATUS_RUNNING, claimed_at=now, attempts=F('attempts') + 1)
+        )
+        if updated:
+            claimed.append(pk)
+            if len(claimed) >= limit:
+                break
+    return claimed
+
+
+def process_job(pk: int, max_attempts: int = 3, backoff_base: float = 5.0, backoff_max: float = 300.0) -> str:
+    """
+    점유한 작업 하나를 처리하고 최종 상태를 반환합니다.
+    GPT 호출이 실패하면 max_attempts까지 백오프 후 pending으로 되돌려 재시도합니다.
+    (바로 되돌리면 장애나 circuit breaker가 열린 동안 시도 횟수를 순식간에 다 써버림)
+    """
+    try:
+        qa = QAPair.objects.select_related('conversation__series', 'conversation__user').get(pk=pk)
+        try:
+            answer = answer_qapair(qa)
+        except Exception:
+            logger.exception("Answer job %s failed", pk)
+            answer = FALLBACK_RESPONSE
+
+        if answer == FALLBACK_RESPONSE:
+            if qa.attempts < max_attempts:
+                next_attempt_at = timezone.now() + timedelta(seconds=retry_delay(qa.attempts, backoff_base, backoff_max))
+                QAPair.objects.filter(pk=pk).update(
+                    status=QAPair.STATUS_PENDING, answer_text=None, next_attempt_at=next_attempt_at
+                )
+                return QAPair.STATUS_PENDING
+            QAPair.objects.filter(pk=pk).update(status=QAPair.STATUS_FAILED, answer_text=FALLBACK_RESPONSE)
+            return QAPair.STATUS_FAILED
+        return QAPair.STATUS_DONE
+    finally:
+        close_old_connections()
+
+
+class AnswerWorkerPool:
+    """DB를 폴링하며 대기 작업을 스레드 풀에서 처리하는 워커"""
+
+    def __init__(self, workers: int = 4, poll_interval: float = 1.0, max_attempts: int = 3, stale_after: float = 300,
+                 backoff_base: float = 5.0, backoff_max: float = 300.0):
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.stale_after = stale_after
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.stop_event = threading.Event()
+        self.processed = 0
+        self._inflight = set()
+        self._lock = threading.Lock()
+
+    thread_name_prefix = 'answer-worker'
+
+    def claim(self, limit: int) -> List[int]:
+        return claim_jobs(limit, stale_after=self.stale_after)
+
+    def process(self, pk: int):
+        process_job(pk, max_attempts=self.max_attempts, backoff_base=self.backoff_base, backoff_max=self.backoff_max)
+
+    def _run_job(self, pk: int):
+        try:
+            self.process(pk)
+        finally:
+            with self._lock:
+                self._inflight.discard(pk)
+                self.processed += 1
+
+    def run(self, once: bool = False):
+        """
+        작업을 처리합니다. once=True이면 현재 대기 중인 작업을 모두 처리한 뒤 종료합니다.
+        """
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix=self.thread_name_prefix) as executor:
+            while not self.stop_event.is_set():
+                with self._lock:
+                    free = self.workers - len(self._inflight)
+                claimed = self.claim(free)
+                close_old_connections()
+                with self._lock:
+                    self._inflight.update(claimed)
+                for pk in claimed:
+                    executor.submit(self._run_job, pk)
+
+                if claimed:
+                    continue
+                with self._lock:
+                    idle = not self._inflight
+                if once and idle:
+                    break
+                self.stop_event.wait(self.poll_interval if idle else 0.05)
+
+    def stop(self):
+        self.stop_event.set()
@@ -0,0 +1,362 @@
+"""
+LLM 백엔드
+
+GPTService는 CHAT_LLM_BACKEND 설정(dotted path)으로 지정된 백엔드를 통해 모델을 호출합니다.
+백엔드는 OpenAI chat 메시지 목록을 받아 동기/비동기, 일반/스트리밍 네 가지 방식으로 응답합니다.
+
+- OpenAIBackend: 실제 OpenAI API 호출 (기본값, 공유 커넥션 풀/재시도/회로 차단기)
+- FakeBackend: 네트워크 없이 결정적인 응답을 주는 부하 테스트용 백엔드.
+  지연(첫 토큰까지 시간)과 토큰 처리량을 분포로 흉내내므로 ORM/직렬화/컨텍스트 구성 등
+  우리 쪽 오버헤드를 실제와 비슷한 동시성에서 측정할 수 있습니다.
+
+    CHAT_LLM_BACKEND=chat.llm.FakeBackend
+    CHAT_LLM_OPTIONS='{"ttft_ms": 400, "tokens_per_sec": 50}'
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import random
+import threading
+import time
+import weakref
+from typing import AsyncIterator, Iterator, List
+
+import httpx
+import openai
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+
+class LLMBackendError(Exception):
+    """LLM 백엔드 호출 실패"""
+
+
+class CircuitOpenError(LLMBackendError):
+    """업스트림이 불안정해 회로 차단기가 열려 있어 호출하지 않음"""
+
+
+class CircuitBreaker:
+    """
+    연속 실패가 failure_threshold번 쌓이면 reset_timeout초 동안 호출을 막는 회로 차단기
+
+    - closed: 정상 호출
+    - open: 즉시 CircuitOpenError (업스트림에 요청을 쌓지 않음)
+    - half_open: reset_timeout이 지나면 한 번만 시험 호출을 허용하고,
+      성공하면 closed, 실패하면 다시 open
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+            self._probe_in_flight = False
+
+    def release(self) -> None:
+        """성공/실패를 반영하지 않고 호출을 끝냅니다. (시험 호출이었다면 다음 시험 호출을 허용)"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def reset(self) -> None:
+        self.record_success()
+
+
+# 재시도할 오류: 429, 5xx, 연결 실패/타임아웃 (APITimeoutError는 APIConnectionError의 하위 클래스)
+RETRYABLE_ERRORS = (openai.RateLimitError, openai.InternalServerError, openai.APIConnectionError)
+
+
+def _retry_delay(attempt: int, error: Exception, base: float, cap: float) -> float:
+    """Retry-After 헤더가 있으면 따르고, 없으면 full jitter 지수 백오프"""
+    response = getattr(error, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    if retry_after:
+        try:
+            return min(float(retry_after), cap)
+        except ValueError:
+            pass
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+_clients = {}
+_clients_lock = threading.Lock()
+_breakers = {}
+# 이벤트 루프 -> {설정 키: AsyncOpenAI}
+# (비동기 커넥션은 만든 루프에서만 쓸 수 있으므로, WSGI에서 async_to_sync처럼 호출마다 루프가 바뀌어도
+#  닫힌 루프의 커넥션을 재사용하지 않도록 루프별로 공유)
+_loop_clients = weakref.WeakKeyDictionary()
+
+
+def _shared(registry: dict, key, factory):
+    with _clients_lock:
+        if key not in registry:
+            registry[key] = factory()
+        return registry[key]
+
+
+def _loop_shared(key, factory):
+    """현재 이벤트 루프에서 공유하는 객체 (닫힌 루프의 객체는 정리)"""
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        for closed in [other for other in _loop_clients if other.is_closed()]:
+            del _loop_clients[closed]
+        registry = _loop_clients.setdefault(loop, {})
+        if key not in registry:
+            registry[key] = factory()
+        return registry[key]
+
+
+class OpenAIBackend:
+    """
+    OpenAI chat completions API 백엔드
+
+    - 프로세스당 하나의 OpenAI 클라이언트(AsyncOpenAI는 이벤트 루프당 하나)를 공유해 keep-alive 커넥션 풀을 재사용합니다.
+    - 연결/읽기 타임아웃을 명시하고, 429/5xx/연결 오류는 jitter를 준 지수 백오프로 재시도합니다.
+    - 재시도 후에도 실패가 이어지면 회로 차단기가 열려 일정 시간 동안 즉시 실패합니다.
+      (GPTService는 이때 기본 안내 메시지를 반환)
+
+    생성자 인자는 CHAT_LLM_OPTIONS 설정으로 바꿀 수 있습니다.
+    """
+
+    def __init__(self, model: str = "gpt-4.1", timeout: float = 60.0, connect_timeout: float = 5.0,
+                 max_retries: int = 2, backoff_base: float = 0.5, backoff_max: float = 8.0,
+                 max_connections: int = 100, max_keepalive_connections: int = 20, keepalive_expiry: float = 60.0,
+                 breaker_threshold: int = 5, breaker_reset_timeout: float = 30.0):
+        self.model = model
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._timeout = httpx.Timeout(timeout, connect=connect_timeout)
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._client_key = (settings.OPENAI_API_KEY, timeout, connect_timeout, max_connections,
+                            max_keepalive_connections, keepalive_expiry)
+        # 같은 설정의 모든 백엔드 인스턴스(동기/비동기)가 업스트림 상태를 공유
+        self.breaker = _shared(_breakers, ("openai", breaker_threshold, breaker_reset_timeout),
+                               lambda: CircuitBreaker(breaker_threshold, breaker_reset_timeout))
+
+    @property
+    def client(self) -> openai.OpenAI:
+        return _shared(_clients, ("sync",) + self._client_key, lambda: openai.OpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            timeout=self._timeout,
+            max_retries=0,  # 재시도는 _call에서 직접 처리
+            http_client=httpx.Client(limits=self._limits, timeout=self._timeout),
+        ))
+
+    @property
+    def async_client(self) -> openai.AsyncOpenAI:
+        """현재 이벤트 루프에서 공유하는 비동기 클라이언트 (실행 중인 루프 안에서만 호출)"""
+        return _loop_shared(self._client_key, lambda: openai.AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            timeout=self._timeout,
+            max_retries=0,
+            http_client=httpx.AsyncClient(limits=self._limits, timeout=self._timeout),
+        ))
+
+    def _create(self, **kwargs):
+        return self.client.chat.completions.create(**kwargs)
+
+    async def _acreate(self, **kwargs):
+        return await self.async_client.chat.completions.create(**kwargs)
+
+    def _call(self, **kwargs):
+        """회로 차단기 + 재시도를 적용해 chat completion을 호출합니다."""
+        if not self.breaker.allow():
+            raise CircuitOpenError("OpenAI circuit breaker is open")
+        for attempt in range(self.max_retries + 1):
+            try:
+                result = self._create(model=self.model, **kwargs)
+            except RETRYABLE_ERRORS as e:
+                if attempt >= self.max_retries:
+                    self.breaker.record_failure()
+                    raise
+                logger.warning("OpenAI call failed (%s), retrying (%d/%d)", e, attempt + 1, self.max_retries)
+                time.sleep(_retry_delay(attempt, e, self.backoff_base, self.backoff_max))
+            except Exception:
+                # 400 등 요청 자체의 문제는 업스트림 상태와 무관하므로 차단기에 반영하지 않음
+                self.breaker.release()
+                raise
+            else:
+                self.breaker.record_success()
+                return result
+
+    async def _acall(self, **kwargs):
+        """_call의 비동기 버전"""
+        if not self.breaker.allow():
+            raise CircuitOpenError("OpenAI circuit breaker is open")
+        for attempt in range(self.max_retries + 1):
+            try:
+                result = await self._acreate(model=self.model, **kwargs)
+            except RETRYABLE_ERRORS as e:
+                if attempt >= self.max_retries:
+                    self.breaker.record_failure()
+                    raise
+                logger.warning("OpenAI call failed (%s), retrying (%d/%d)", e, attempt + 1, self.max_retries)
+                await asyncio.sleep(_retry_delay(attempt, e, self.backoff_base, self.backoff_max))
+            except Exception:
+                self.breaker.release()
+                raise
+            else:
+                self.breaker.record_success()
+                return result
+
+    def complete(self, messages: List[dict], temperature: float, max_tokens: int) -> str:
+        response = self._call(messages=messages, temperature=temperature, max_tokens=max_tokens)
+        return response.choices[0].message.content
+
+    def stream(self, messages: List[dict], temperature: float, max_tokens: int) -> Iterator[str]:
+        # 스트림 시작(첫 응답) 전까지만 재시도하고, 도중에 끊기면 그대로 실패 처리
+        stream = self._call(messages=messages, temperature=temperature, max_tokens=max_tokens, stream=True)
+        try:
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except RETRYABLE_ERRORS:
+            self.breaker.record_failure()
+            raise
+        finally:
+            # 소비자가 중간에 멈춰도(클라이언트 연결 끊김 등) 업스트림 HTTP 응답을 닫음
+            stream.close()
+
+    async def acomplete(self, messages: List[dict], temperature: float, max_tokens: int) -> str:
+        response = await self._acall(messages=messages, temperature=temperature, max_tokens=max_tokens)
+        return response.choices[0].message.content
+
+    async def astream(self, messages: List[dict], temperature: float, max_tokens: int) -> AsyncIterator[str]:
+        stream = await self._acall(messages=messages, temperature=temperature, max_tokens=max_tokens, stream=True)
+        try:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except RETRYABLE_ERRORS:
+            self.breaker.record_failure()
+            raise
+        finally:
+            await stream.close()
+
+
+FAKE_VOCABULARY = [
+    "이", "에피소드에서", "주인공은", "동료들과", "함께", "마을을", "지키기", "위해", "싸웁니다.",
+    "그", "과정에서", "새로운", "기술을", "익히고", "성장합니다.", "이후", "중요한", "선택을", "하게", "됩니다.",
+]
+
+
+class FakeBackend:
+    """
+    부하 테스트용 가짜 LLM 백엔드
+
+    같은 메시지에는 항상 같은 응답과 같은 지연을 돌려줍니다. (메시지 해시 + seed로 난수 생성)
+
+    Args:
+        ttft_ms: 첫 토큰까지 걸리는 시간의 중앙값(ms), 로그정규분포
+        ttft_sigma: 첫 토큰 지연 로그정규분포의 sigma
+        tokens_per_sec: 초당 생성 토큰 수 평균, 정규분포
+        tps_jitter: 초당 토큰 수의 표준편차 (평균 대비 비율)
+        response_tokens: 응답 토큰 수 (max_tokens를 넘지 않음)
+        error_rate: 호출이 LLMBackendError로 실패할 확률
+        seed: 난수 seed
+    """
+
+    def __init__(self, model: str = "fake-llm", ttft_ms: float = 300, ttft_sigma: float = 0.3,
+                 tokens_per_sec: float = 60, tps_jitter: float = 0.2, response_tokens: int = 120,
+                 error_rate: float = 0.0, seed: int = 0):
+        self.model = model
+        self.ttft_ms = ttft_ms
+        self.ttft_sigma = ttft_sigma
+        self.tokens_per_sec = tokens_per_sec
+        self.tps_jitter = tps_jitter
+        self.response_tokens = response_tokens
+        self.error_rate = error_rate
+        self.seed = seed
+
+    def plan(self, messages: List[dict], max_tokens: int):
+        """메시지로부터 (첫 토큰 지연(초), 토큰 간격(초), 토큰 목록, 실패 여부)를 결정합니다."""
+        digest = hashlib.sha256(json.dumps(messages, ensure_ascii=False, sort_keys=True).encode("utf-8")).digest()
+        rng = random.Random(int.from_bytes(digest[:8], "big") ^ self.seed)
+
+        ttft = rng.lognormvariate(math.log(max(self.ttft_ms, 1e-3) / 1000), self.ttft_sigma) if self.ttft_ms else 0.0
+        tps = max(1.0, rng.normalvariate(self.tokens_per_sec, self.tokens_per_sec * self.tps_jitter))
+        count = max(1, min(self.response_tokens, max_tokens))
+        tokens = [rng.choice(FAKE_VOCABULARY) + " " for _ in range(count)]
+        fail = rng.random() < self.error_rate
+        return ttft, (1.0 / tps if self.tokens_per_sec else 0.0), tokens, fail
+
+    def complete(self, messages: List[dict], temperature: float, max_tokens: int) -> str:
+        ttft, interval, tokens, fail = self.plan(messages, max_tokens)
+        time.sleep(ttft + interval * len(tokens))
+        if fail:
+            raise LLMBackendError("fake backend error")
+        return "".join(tokens)
+
+    def stream(self, messages: List[dict], temperature: float, max_tokens: int) -> Iterator[str]:
+        ttft, interval, tokens, fail = self.plan(messages, max_tokens)
+        time.sleep(ttft)
+        if fail:
+            raise LLMBackendError("fake backend error")
+        for token in tokens:
+            yield token
+            time.sleep(interval)
+
+    async def acomplete(self, messages: List[dict], temperature: float, max_tokens: int) -> str:
+        ttft, interval, tokens, fail = self.plan(messages, max_tokens)
+        await asyncio.sleep(ttft + interval * len(tokens))
+        if fail:
+            raise LLMBackendError("fake backend error")
+        return "".join(tokens)
+
+    async def astream(self, messages: List[dict], temperature: float, max_tokens: int) -> AsyncIterator[str]:
+        ttft, interval, tokens, fail = self.plan(messages, max_tokens)
+        await asyncio.sleep(ttft)
+        if fail:
+            raise LLMBackendError("fake backend error")
+        for token in tokens:
+            yield token
+            await asyncio.sleep(interval)
+
+
+def get_backend():
+    """CHAT_LLM_BACKEND / CHAT_LLM_MODEL / CHAT_LLM_OPTIONS 설정으로 백엔드를 생성합니다."""
+    backend_cls = import_string(getattr(settings, "CHAT_LLM_BACKEND", "chat.llm.OpenAIBackend"))
+    options = dict(getattr(settings, "CHAT_LLM_OPTIONS", {}) or {})
+    model = getattr(settings, "CHAT_LLM_MODEL", None)
+    if model:
+        options.setdefault("model", model)
+    return backend_cls(**options)
@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand
+from chat.jobs import AnswerWorkerPool
+import signal
+
+
+class Command(BaseCommand):
+    help = "background 모드로 등록된 질문(status=pending QAPair)의 답변을 생성하는 워커 실행"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=4, help="동시에 처리할 작업 수 (스레드 수)")
+        parser.add_argument("--poll-interval", type=float, default=1.0, help="대기 작업이 없을 때 DB 폴링 간격(초)")
+        parser.add_argument("--max-attempts", type=int, default=3, help="GPT 호출 실패 시 최대 시도 횟수")
+        parser.add_argument("--backoff-base", type=float, default=5.0, help="첫 재시도 대기 시간(초), 실패할 때마다 2배")
+        parser.add_argument("--backoff-max", type=float, default=300.0, help="재시도 대기 시간 상한(초)")
+        parser.add_argument("--stale-after", type=float, default=300, help="이 시간(초) 넘게 running인 작업은 다시 가져옴")
+        parser.add_argument("--once", action="store_true", help="현재 대기 중인 작업만 처리하고 종료")
+
+    def handle(self, *args, **options):
+        pool = AnswerWorkerPool(
+            workers=options["workers"],
+            poll_interval=options["poll_interval"],
+            max_attempts=options["max_attempts"],
+            stale_after=options["stale_after"],
+            backoff_base=options["backoff_base"],
+            backoff_max=options["backoff_max"],
+        )
+
+        def shutdown(signum, frame):
+            self.stdout.write("종료 신호를 받았습니다. 처리 중인 작업을 마치고 종료합니다.")
+            pool.stop()
+
+        if not options["once"]:
+            signal.signal(signal.SIGTERM, shutdown)
+            signal.signal(signal.SIGINT, shutdown)
+
+        self.stdout.write(f"답변 워커 시작 (workers={options['workers']})")
+        pool.run(once=options["once"])
+        self.stdout.write(self.style.SUCCESS(f"완료: {pool.processed}개 작업 처리"))
@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+from chat.outbox import BugReportWorkerPool
+import signal
+
+
+class Command(BaseCommand):
+    help = "오류 신고 outbox(status=pending BugReport)를 Channel.io로 전송하는 워커 실행"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=2, help="동시에 전송할 신고 수 (스레드 수)")
+        parser.add_argument("--rate", type=float, default=5, help="초당 최대 전송 수 (0이면 제한 없음)")
+        parser.add_argument("--poll-interval", type=float, default=1.0, help="전송할 신고가 없을 때 DB 폴링 간격(초)")
+        parser.add_argument("--max-attempts", type=int, default=8, help="전송 실패 시 최대 시도 횟수")
+        parser.add_argument("--backoff-base", type=float, default=30.0, help="첫 재시도 대기 시간(초), 실패할 때마다 2배")
+        parser.add_argument("--backoff-max", type=float, default=3600.0, help="재시도 대기 시간 상한(초)")
+        parser.add_argument("--stale-after", type=float, default=300, help="이 시간(초) 넘게 sending인 신고는 다시 가져옴")
+        parser.add_argument("--once", action="store_true", help="현재 전송할 신고만 처리하고 종료")
+
+    def handle(self, *args, **options):
+        pool = BugReportWorkerPool(
+            workers=options["workers"],
+            poll_interval=options["poll_interval"],
+            max_attempts=options["max_attempts"],
+            stale_after=options["stale_after"],
+            rate=options["rate"],
+            backoff_base=options["backoff_base"],
+            backoff_max=options["backoff_max"],
+        )
+
+        def shutdown(signum, frame):
+            self.stdout.write("종료 신호를 받았습니다. 전송 중인 신고를 마치고 종료합니다.")
+            pool.stop()
+
+        if not options["once"]:
+            signal.signal(signal.SIGTERM, shutdown)
+            signal.signal(signal.SIGINT, shutdown)
+
+        self.stdout.write(f"신고 전송 워커 시작 (workers={options['workers']}, rate={options['rate']}/s)")
+        pool.run(once=options["once"])
+        self.stdout.write(self.style.SUCCESS(f"완료: {pool.processed}개 신고 처리"))
@@ -0,0 +1,145 @@
+"""
+대화 메모리 (최근 질문-답변 + 누적 요약)
+
+이전 질문-답변을 모두 프롬프트에 넣으면 대화가 길어질수록 프롬프트가 선형으로 커지므로,
+최근 CHAT_MEMORY_TURNS개는 그대로 넣고 그보다 오래된 것은 Conversation.memory_summary에
+누적 요약해 둡니다.
+
+- Conversation.memory_until: 요약에 반영된 마지막 QAPair ID
+- 요약에 아직 반영되지 않은 답변 완료 QAPair가 CHAT_MEMORY_TURNS개를 넘으면, 넘는 것 중 오래된 순으로
+  최대 CHAT_MEMORY_TURNS개를 기존 요약과 합쳐 새 요약을 만듭니다. (매번 전체 대화를 다시 요약하지 않음)
+- memory_until은 요약에 실제로 합친 질문-답변까지만 옮기므로, 요약이 실패해 갱신이 밀려도
+  요약되지 않고 건너뛰는 질문-답변은 없습니다. (다음 요청부터 밀린 것을 순서대로 다시 합침)
+- 프롬프트에는 최근 CHAT_MEMORY_TURNS개만 그대로 넣고, 각 질문-답변과 요약은 토큰 수 상한으로
+  잘라내므로 프롬프트 크기는 항상 일정 범위 안에 있습니다.
+
+요약 갱신(GPT 호출)은 답변 생성과 동시에 실행하고, 답변 저장 뒤에 조건부 UPDATE로 저장합니다.
+"""
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from django.conf import settings
+
+from .context import truncate_to_tokens
+from .models import Conversation, QAPair
+from .services import FALLBACK_RESPONSE
+
+
+def memory_turns() -> int:
+    return getattr(settings, "CHAT_MEMORY_TURNS", 4)
+
+
+@dataclass
+class Turn:
+    """요약에 아직 반영되지 않은 질문-답변 하나"""
+    id: int
+    question: str
+    answer: str
+
+
+@dataclass
+class ConversationMemory:
+    """
+    GPT 프롬프트에 넣을 대화 메모리
+
+    - summary: memory_until 이전 질문-답변의 누적 요약
+    - until: summary에 반영된 마지막 QAPair ID
+    - turns: until 이후의 답변 완료 질문-답변 중 최근 CHAT_MEMORY_TURNS개 (오래된 순, 프롬프트에 그대로 넣음)
+    - backlog: turns보다 오래되었는데 아직 요약에 반영되지 않은 질문-답변 (until 바로 다음부터 최대 CHAT_MEMORY_TURNS개)
+    """
+    summary: str = ""
+    until: int = 0
+    turns: List[Turn] = field(default_factory=list)
+    backlog: List[Turn] = field(default_factory=list)
+
+    def is_empty(self) -> bool:
+        return not self.summary and not self.turns
+
+    def messages(self) -> List[dict]:
+        """GPTService의 history 인자로 넘길 메시지 목록"""
+        turn_tokens = getattr(settings, "CHAT_MEMORY_TURN_TOKENS", 300)
+        messages = []
+        if self.summary:
+            messages.append({
+                "role": "system",
+                "content": f"Summary of the earlier conversation:\n{self.summary}",
+            })
+        for turn in self.turns:
+            messages.append({"role": "user", "content": truncate_to_tokens(turn.question, turn_tokens)})
+            messages.append({"role": "assistant", "content": truncate_to_tokens(turn.answer, turn_tokens)})
+        return messages
+
+    def fingerprint(self) -> Optional[str]:
+        """답변 캐시 키에 넣을 메모리 식별값 (메모리가 비어 있으면 None)"""
+        if self.is_empty():
+            return None
+        payload = json.dumps(self.messages(), ensure_ascii=False, sort_keys=True)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def overflow(self) -> List[Turn]:
+        """이번에 요약에 합칠 질문-답변 (until 바로 다음부터 이어지므로 건너뛰는 것이 없음)"""
+        return self.backlog
+
+
+def load_memory(conv: Conversation, before_id: int = None) -> ConversationMemory:
+    """
+    Conversation의 대화 메모리를 읽습니다.
+
+    Args:
+        conv (Conversation): 대화
+        before_id (int): 이 ID 이전의 질문-답변만 사용 (백그라운드 작업처럼 질문이 이미 저장된 경우)
+    """
+    state = Conversation.objects.filter(pk=conv.pk).values('memory_summary', 'memory_until').first()
+    if state is None:
+        return ConversationMemory()
+
+    qs = (
+        QAPair.objects
+        .filter(conversation_id=conv.pk, status=QAPair.STATUS_DONE, id__gt=state['memory_until'])
+        .exclude(answer_text__isnull=True)
+        .exclude(answer_text__in=['', FALLBACK_RESPONSE])
+    )
+    if before_id is not None:
+        qs = qs.filter(id__lt=before_id)
+    fields = ('id', 'question_text', 'answer_text')
+    rows = list(qs.order_by('-id').values_list(*fields)[:memory_turns()])
+    rows.reverse()
+    backlog = list(qs.filter(id__lt=rows[0][0]).order_by('id').values_list(*fields)[:memory_turns()]) if rows else []
+
+    return ConversationMemory(
+        summary=state['memory_summary'],
+        until=state['memory_until'],
+        turns=[Turn(*row) for row in rows],
+        backlog=[Turn(*row) for row in backlog],
+    )
+
+
+def store_memory(conv: Conversation, memory: ConversationMemory, folded: List[Turn], summary: Optional[str]) -> bool:
+    """
+    folded를 반영한 새 요약을 저장합니다.
+    다른 요청이 먼저 요약을 갱신했으면(memory_until이 바뀌었으면) 저장하지 않습니다.
+    """
+    if not folded or not summary:
+        return False
+    summary = truncate_to_tokens(summary, getattr(settings, "CHAT_MEMORY_SUMMARY_TOKENS", 400))
+    updated = (
+        Conversation.objects
+        .filter(pk=conv.pk, memory_until=memory.until)
+        .update(memory_summary=summary, memory_until=folded[-1].id)
+    )
+    return bool(updated)
+
+
+def update_memory(conv: Conversation, service) -> bool:
+    """
+    요약에 반영되지 않은 질문-답변이 CHAT_MEMORY_TURNS개를 넘으면 넘는 것을 오래된 순으로 요약에 합칩니다.
+    (백그라운드 워커처럼 답변 지연과 무관한 곳에서 사용)
+    """
+    memory = load_memory(conv)
+    folded = memory.overflow()
+    if not folded:
+        return False
+    summary = service.summarize_history(memory.summary, [(t.question, t.answer) for t in folded])
+    return store_memory(conv, memory, folded, summary)
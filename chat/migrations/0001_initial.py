@@ -0,0 +1,50 @@
+# Generated by Django 5.2.8 on 2026-10-17 22:07
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('series', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Conversation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('summary', models.CharField(blank=True, help_text='대화 요약(선택)', max_length=1024)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now, help_text='생성 시각')),
+                ('series', models.ForeignKey(blank=True, help_text='관련된 시리즈(애니메이션)', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='conversations', to='series.series')),
+                ('user', models.ForeignKey(blank=True, help_text='대화를 시작한 사용자 (익명 가능)', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='conversations', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': '대화 세션',
+                'verbose_name_plural': '대화 세션들',
+                'db_table': 'conversation',
+            },
+        ),
+        migrations.CreateModel(
+            name='QAPair',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('question_text', models.TextField(help_text='질문 내용')),
+                ('answer_text', models.TextField(blank=True, help_text='답변 내용', null=True)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now, help_text='생성 시각')),
+                ('conversation', models.ForeignKey(help_text='연결된 대화(Conversation)', on_delete=django.db.models.deletion.CASCADE, related_name='qapairs', to='chat.conversation')),
+            ],
+            options={
+                'verbose_name': '질문-답변 쌍',
+                'verbose_name_plural': '질문-답변 쌍들',
+                'db_table': 'qapair',
+                'ordering': ('created_at',),
+            },
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.8 on 2026-10-17 22:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='qapair',
+            name='attempts',
+            field=models.PositiveSmallIntegerField(default=0, help_text='백그라운드 답변 생성 시도 횟수'),
+        ),
+        migrations.AddField(
+            model_name='qapair',
+            name='claimed_at',
+            field=models.DateTimeField(blank=True, help_text='워커가 작업을 가져간 시각', null=True),
+        ),
+        migrations.AddField(
+            model_name='qapair',
+            name='status',
+            field=models.CharField(choices=[('pending', '대기'), ('running', '생성중'), ('done', '완료'), ('failed', '실패')], default='done', help_text='답변 생성 상태', max_length=10),
+        ),
+        migrations.AddIndex(
+            model_name='qapair',
+            index=models.Index(fields=['status', 'id'], name='qapair_status_id_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.8 on 2026-10-17 22:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0002_qapair_background_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='conversation',
+            name='memory_summary',
+            field=models.TextField(blank=True, default='', help_text='오래된 질문-답변의 누적 요약 (GPT 프롬프트용)'),
+        ),
+        migrations.AddField(
+            model_name='conversation',
+            name='memory_until',
+            field=models.PositiveIntegerField(default=0, help_text='memory_summary에 반영된 마지막 QAPair ID'),
+        ),
+    ]
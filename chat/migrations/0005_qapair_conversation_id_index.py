@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-17 22:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0004_conversation_list_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='qapair',
+            index=models.Index(fields=['conversation', 'id'], name='qapair_conversation_id_idx'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.8 on 2026-10-17 22:19
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0005_qapair_conversation_id_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BugReport',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('member_id', models.CharField(help_text='Channel.io memberId', max_length=128)),
+                ('query', models.TextField(help_text='질문 내용')),
+                ('answer_text', models.TextField(help_text='신고한 답변 내용')),
+                ('answer_id', models.CharField(blank=True, help_text='신고한 답변 ID (중복 신고 방지)', max_length=64, null=True, unique=True)),
+                ('extra_info', models.JSONField(blank=True, help_text='추가 정보', null=True)),
+                ('status', models.CharField(choices=[('pending', '대기'), ('sending', '전송중'), ('sent', '전송완료'), ('failed', '실패')], default='pending', help_text='전송 상태', max_length=10)),
+                ('attempts', models.PositiveSmallIntegerField(default=0, help_text='전송 시도 횟수')),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now, help_text='다음 전송 시도 시각')),
+                ('claimed_at', models.DateTimeField(blank=True, help_text='워커가 작업을 가져간 시각', null=True)),
+                ('last_error', models.TextField(blank=True, default='', help_text='마지막 전송 오류')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now, help_text='생성 시각')),
+                ('sent_at', models.DateTimeField(blank=True, help_text='전송 완료 시각', null=True)),
+            ],
+            options={
+                'verbose_name': '오류 신고',
+                'verbose_name_plural': '오류 신고들',
+                'db_table': 'bug_report',
+                'indexes': [models.Index(fields=['status', 'next_attempt_at'], name='bug_report_status_next_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-17 22:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0006_bug_report_outbox'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='qapair',
+            name='next_attempt_at',
+            field=models.DateTimeField(blank=True, help_text='실패한 작업을 다시 시도할 시각 (백오프)', null=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-17 23:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0007_qapair_next_attempt_at'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='qapair',
+            name='status',
+            field=models.CharField(choices=[('pending', '대기'), ('running', '생성중'), ('done', '완료'), ('failed', '실패')], default='pending', help_text='답변 생성 상태', max_length=10),
+        ),
+    ]
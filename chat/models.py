@@ -11,6 +11,7 @@ class Conversation(models.Model):
     - user: FK to user who started the conversation (nullable for anonymous)
     - series (anime): FK to the related series
     - summary: short text summary (optional)
+    - memory_summary / memory_until: 최근 N개 이전 질문-답변을 누적 요약한 대화 메모리 (chat.memory 참고)
     - created_at: timestamp
     """
     user = models.ForeignKey(
@@ -30,12 +31,19 @@ class Conversation(models.Model):
         help_text='관련된 시리즈(애니메이션)'
     )
     summary = models.CharField(max_length=1024, blank=True, help_text='대화 요약(선택)')
+    memory_summary = models.TextField(blank=True, default='', help_text='오래된 질문-답변의 누적 요약 (GPT 프롬프트용)')
+    memory_until = models.PositiveIntegerField(default=0, help_text='memory_summary에 반영된 마지막 QAPair ID')
     created_at = models.DateTimeField(default=timezone.now, help_text='생성 시각')
 
     class Meta:
         db_table = 'conversation'
         verbose_name = '대화 세션'
         verbose_name_plural = '대화 세션들'
+        indexes = [
+            # 대화 목록 cursor 페이지네이션 (전체 / 사용자별 생성일 역순)
+            models.Index(fields=['-created_at', '-id'], name='conversation_created_idx'),
+            models.Index(fields=['user', '-created_at', '-id'], name='conversation_user_created_idx'),
+        ]
 
     def __str__(self):
         return f"Conversation:{self.id} - {self.summary[:40] or 'untitled'}"
@@ -49,8 +57,21 @@ class QAPair(models.Model):
     - conversation: FK to Conversation
     - question_text
     - answer_text
+    - status: 답변 생성 상태 (답변이 저장되기 전에는 pending/running, 백그라운드 모드는 pending으로 생성되어 워커가 채움)
+    - attempts / claimed_at: 백그라운드 워커 처리 정보
     - created_at
     """
+    STATUS_PENDING = 'pending'
+    STATUS_RUNNING = 'running'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, '대기'),
+        (STATUS_RUNNING, '생성중'),
+        (STATUS_DONE, '완료'),
+        (STATUS_FAILED, '실패'),
+    ]
+
     conversation = models.ForeignKey(
         Conversation,
         on_delete=models.CASCADE,
@@ -59,6 +80,10 @@ class QAPair(models.Model):
     )
     question_text = models.TextField(help_text='질문 내용')
     answer_text = models.TextField(blank=True, null=True, help_text='답변 내용')
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING, help_text='답변 생성 상태')
+    attempts = models.PositiveSmallIntegerField(default=0, help_text='백그라운드 답변 생성 시도 횟수')
+    claimed_at = models.DateTimeField(null=True, blank=True, help_text='워커가 작업을 가져간 시각')
+    next_attempt_at = models.DateTimeField(null=True, blank=True, help_text='실패한 작업을 다시 시도할 시각 (백오프)')
     created_at = models.DateTimeField(default=timezone.now, help_text='생성 시각')
 
     class Meta:
@@ -66,6 +91,62 @@ class QAPair(models.Model):
         verbose_name = '질문-답변 쌍'
         verbose_name_plural = '질문-답변 쌍들'
         ordering = ('created_at',)
+        indexes = [
+            # 워커가 대기 중인 작업을 오래된 순으로 가져올 때 사용
+            models.Index(fields=['status', 'id'], name='qapair_status_id_idx'),
+            # 대화별 증분 조회 (?after_id=)
+            models.Index(fields=['conversation', 'id'], name='qapair_conversation_id_idx'),
+        ]
 
     def __str__(self):
         return f"Q{self.id}: {self.question_text[:40]}"
+
+
+class BugReport(models.Model):
+    """
+    Channel.io로 보낼 답변 오류 신고 (outbox)
+
+    신고 API는 이 테이블에 저장만 하고 바로 202를 반환하며,
+    run_bug_report_worker 명령이 Channel.io로 전송합니다. (chat.outbox 참고)
+
+    Fields:
+    - member_id / query / answer_text / answer_id / extra_info: 신고 내용 (answer_id가 같은 신고는 한 번만 저장)
+    - status: 전송 상태
+    - attempts / next_attempt_at / claimed_at / last_error: 전송 재시도 정보
+    - created_at / sent_at
+    """
+    STATUS_PENDING = 'pending'
+    STATUS_SENDING = 'sending'
+    STATUS_SENT = 'sent'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, '대기'),
+        (STATUS_SENDING, '전송중'),
+        (STATUS_SENT, '전송완료'),
+        (STATUS_FAILED, '실패'),
+    ]
+
+    member_id = models.CharField(max_length=128, help_text='Channel.io memberId')
+    query = models.TextField(help_text='질문 내용')
+    answer_text = models.TextField(help_text='신고한 답변 내용')
+    answer_id = models.CharField(max_length=64, unique=True, null=True, blank=True, help_text='신고한 답변 ID (중복 신고 방지)')
+    extra_info = models.JSONField(null=True, blank=True, help_text='추가 정보')
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING, help_text='전송 상태')
+    attempts = models.PositiveSmallIntegerField(default=0, help_text='전송 시도 횟수')
+    next_attempt_at = models.DateTimeField(default=timezone.now, help_text='다음 전송 시도 시각')
+    claimed_at = models.DateTimeField(null=True, blank=True, help_text='워커가 작업을 가져간 시각')
+    last_error = models.TextField(blank=True, default='', help_text='마지막 전송 오류')
+    created_at = models.DateTimeField(default=timezone.now, help_text='생성 시각')
+    sent_at = models.DateTimeField(null=True, blank=True, help_text='전송 완료 시각')
+
+    class Meta:
+        db_table = 'bug_report'
+        verbose_name = '오류 신고'
+        verbose_name_plural = '오류 신고들'
+        indexes = [
+            # 워커가 전송할 신고를 시도 시각 순으로 가져올 때 사용
+            models.Index(fields=['status', 'next_attempt_at'], name='bug_report_status_next_idx'),
+        ]
+
+    def __str__(self):
+        return f"BugReport:{self.id} ({self.status})"
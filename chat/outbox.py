@@ -0,0 +1,131 @@
+"""
+Channel.io 오류 신고 outbox
+
+신고 API(ChannelBugReportView)는 BugReport를 저장만 하고 바로 202를 반환합니다.
+run_bug_report_worker 명령이 띄운 워커가 대기 중인 신고를 가져가 Channel.io로 전송하며,
+
+- 동시에 전송하는 신고 수(workers)와 초당 전송 수(rate)를 제한해 신고가 몰려도 API를 두드리지 않고,
+- 전송에 실패하면 지수 백오프(+jitter)로 next_attempt_at을 미뤄 max_attempts까지 재시도합니다.
+- 다시 보내도 성공할 수 없는 실패(memberId에 해당하는 유저 없음 등)는 재시도하지 않고 바로 failed로 기록합니다.
+
+작업 점유는 답변 워커(chat.jobs)와 같이 조건부 UPDATE로 합니다.
+"""
+import logging
+import threading
+import time
+from datetime import timedelta
+from typing import List
+
+from django.db import close_old_connections
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .channelio import ChannelIoError, ChannelIoUserNotFound, report_bug_with_member_id
+from .jobs import AnswerWorkerPool, retry_delay
+from .models import BugReport
+
+logger = logging.getLogger(__name__)
+
+# 재시도해도 결과가 같은 오류 (바로 failed 처리)
+PERMANENT_ERRORS = (ChannelIoUserNotFound,)
+
+
+def claim_reports(limit: int, stale_after: float = 300) -> List[int]:
+    """
+    전송할 때가 된 신고를 오래된 순으로 최대 limit개 점유하고 ID 목록을 반환합니다.
+    워커가 죽어 stale_after초 넘게 sending으로 남은 신고도 다시 가져옵니다.
+    """
+    if limit <= 0:
+        return []
+    now = timezone.now()
+    due = Q(status=BugReport.STATUS_PENDING, next_attempt_at__lte=now)
+    stale = Q(status=BugReport.STATUS_SENDING, claimed_at__lt=now - timedelta(seconds=stale_after))
+    candidates = (
+        BugReport.objects
+        .filter(due | stale)
+        .order_by('next_attempt_at', 'id')
+        .values_list('id', 'status', 'claimed_at')[:limit * 2]
+    )
+
+    claimed = []
+    for pk, status, claimed_at in candidates:
+        updated = (
+            BugReport.objects
+            .filter(pk=pk, status=status, claimed_at=claimed_at)
+            .update(status=BugReport.STATUS_SENDING, claimed_at=now, attempts=F('attempts') + 1)
+        )
+        if updated:
+            claimed.append(pk)
+            if len(claimed) >= limit:
+                break
+    return claimed
+
+
+def deliver_report(pk: int, max_attempts: int = 8, backoff_base: float = 30.0, backoff_max: float = 3600.0) -> str:
+    """
+    점유한 신고 하나를 Channel.io로 전송하고 최종 상태를 반환합니다.
+    실패하면 max_attempts까지 백오프 후 pending으로 되돌립니다. (PERMANENT_ERRORS는 바로 failed)
+    """
+    try:
+        report = BugReport.objects.get(pk=pk)
+        try:
+            report_bug_with_member_id(
+                member_id=report.member_id,
+                query=report.query,
+                answer_text=report.answer_text,
+                answer_id=report.answer_id,
+                extra_info=report.extra_info,
+            )
+        except Exception as e:
+            if not isinstance(e, ChannelIoError):
+                logger.exception("Bug report %s delivery failed", pk)
+            elif isinstance(e, PERMANENT_ERRORS):
+                logger.warning("Bug report %s dropped: %s", pk, e)
+            if report.attempts < max_attempts and not isinstance(e, PERMANENT_ERRORS):
+                next_attempt_at = timezone.now() + timedelta(seconds=retry_delay(report.attempts, backoff_base, backoff_max))
+                BugReport.objects.filter(pk=pk).update(
+                    status=BugReport.STATUS_PENDING, next_attempt_at=next_attempt_at, last_error=str(e)[:1000]
+                )
+                return BugReport.STATUS_PENDING
+            BugReport.objects.filter(pk=pk).update(status=BugReport.STATUS_FAILED, last_error=str(e)[:1000])
+            return BugReport.STATUS_FAILED
+
+        BugReport.objects.filter(pk=pk).update(status=BugReport.STATUS_SENT, sent_at=timezone.now(), last_error='')
+        return BugReport.STATUS_SENT
+    finally:
+        close_old_connections()
+
+
+class BugReportWorkerPool(AnswerWorkerPool):
+    """
+    신고 전송 워커
+
+    AnswerWorkerPool과 같이 workers개까지 동시에 전송하며,
+    rate > 0이면 초당 rate개를 넘지 않도록 토큰 버킷으로 점유 수를 제한합니다.
+    """
+    thread_name_prefix = 'bug-report-worker'
+
+    def __init__(self, workers: int = 2, poll_interval: float = 1.0, max_attempts: int = 8,
+                 stale_after: float = 300, rate: float = 0, backoff_base: float = 30.0, backoff_max: float = 3600.0):
+        super().__init__(workers=workers, poll_interval=poll_interval, max_attempts=max_attempts,
+                         stale_after=stale_after, backoff_base=backoff_base, backoff_max=backoff_max)
+        self.rate = rate
+        self._tokens = float(max(rate, 1))
+        self._refilled_at = time.monotonic()
+        self._bucket_lock = threading.Lock()
+
+    def claim(self, limit: int) -> List[int]:
+        if self.rate > 0:
+            with self._bucket_lock:
+                now = time.monotonic()
+                self._tokens = min(max(self.rate, 1), self._tokens + (now - self._refilled_at) * self.rate)
+                self._refilled_at = now
+                limit = min(limit, int(self._tokens))
+        claimed = claim_reports(limit, stale_after=self.stale_after)
+        if self.rate > 0:
+            with self._bucket_lock:
+                self._tokens -= len(claimed)
+        return claimed
+
+    def process(self, pk: int):
+        deliver_report(pk, max_attempts=self.max_attempts, backoff_base=self.backoff_base, backoff_max=self.backoff_max)
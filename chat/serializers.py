@@ -10,8 +10,8 @@ class QAPairSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = QAPair
-        fields = ('id', 'conversation', 'question_text', 'answer_text', 'created_at')
-        read_only_fields = ('id', 'created_at')
+        fields = ('id', 'conversation', 'question_text', 'answer_text', 'status', 'created_at')
+        read_only_fields = ('id', 'status', 'created_at')
 
 
 class ConversationSerializer(serializers.ModelSerializer):
@@ -25,7 +25,40 @@ class ConversationSerializer(serializers.ModelSerializer):
         read_only_fields = ('id', 'created_at', 'qapairs')
 
 
+class ConversationPreviewSerializer(serializers.ModelSerializer):
+    """
+    대화 목록용 시리얼라이저 (QAPair 목록 없이)
+
+    context['qapairs']가 'latest'이면 가장 최근 QAPair 하나(latest_qapair)만 포함합니다.
+    (뷰에서 obj.latest_qapair를 미리 채워둠)
+    """
+    user = serializers.PrimaryKeyRelatedField(read_only=True)
+    latest_qapair = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Conversation
+        fields = ('id', 'user', 'series', 'summary', 'created_at', 'latest_qapair')
+        read_only_fields = fields
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if self.context.get('qapairs') != 'latest':
+            fields.pop('latest_qapair')
+        return fields
+
+    def get_latest_qapair(self, obj):
+        qa = getattr(obj, 'latest_qapair', None)
+        return QAPairSerializer(qa).data if qa else None
+
+
 class CreateQuestionSerializer(serializers.Serializer):
     """질문 생성 요청 본문 검증용 시리얼라이저"""
     question = serializers.CharField(help_text='질문 내용', max_length=2000)
     summary = serializers.CharField(help_text='대화 요약(선택)', max_length=1024, required=False, allow_blank=True)
+    stream = serializers.BooleanField(help_text='true이면 답변을 SSE(text/event-stream)로 스트리밍', required=False, default=False)
+    background = serializers.BooleanField(help_text='true이면 202와 작업 ID를 바로 반환하고 답변은 워커가 채움', required=False, default=False)
+
+    def validate(self, attrs):
+        if attrs.get('stream') and attrs.get('background'):
+            raise serializers.ValidationError('stream과 background는 함께 사용할 수 없습니다.')
+        return attrs
@@ -1,11 +1,25 @@
-from typing import List
-import openai
-from django.conf import settings
+from contextlib import aclosing, closing
+from typing import AsyncIterator, Iterator, List, Optional, Sequence, Tuple
+from .llm import get_backend
+
+# GPT 호출 실패 시 사용자에게 반환하는 기본 메시지
+FALLBACK_RESPONSE = "죄송합니다. 응답을 생성하는 중에 오류가 발생했습니다."
+
+
+def fallback_summary(question: str) -> str:
+    """질문 요약 GPT 호출 실패 시 대신 쓰는 요약 (질문 앞부분)"""
+    return question[:50] + "..."
+
+
+# 프롬프트(시스템 메시지, 컨텍스트 형식)를 바꾸면 올려서 이전 답변 캐시를 무효화
+PROMPT_VERSION = 2
+
 
 class GPTService:
-    def __init__(self):
-        openai.api_key = settings.OPENAI_API_KEY
-        self.model = "gpt-4.1"  
+    def __init__(self, backend=None):
+        # 모델 호출은 CHAT_LLM_BACKEND 설정의 백엔드가 담당 (기본: OpenAI)
+        self.backend = backend or get_backend()
+        self.model = self.backend.model
         
     def summarize_question(self, question: str) -> str:
         """
@@ -18,39 +32,80 @@ class GPTService:
             str: 요약된 내용 (최대 200자)
         """
         try:
-            response = openai.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "주어진 질문을 30자에서 50자 사이로 간단히 요약해주세요. 핵심 키워드를 포함하되, 너무 자세하지 않게 요약합니다."
-                    },
-                    {
-                        "role": "user",
-                        "content": question
-                    }
-                ],
+            response = self.backend.complete(
+                self._build_summary_messages(question),
                 temperature=0.3,  # 더 일관된 요약을 위해 temperature를 낮게 설정
                 max_tokens=100
             )
             
-            return response.choices[0].message.content.strip()
+            return response.strip()
             
         except Exception as e:
             print(f"Error in summarizing question: {str(e)}")
             # 에러 발생 시 질문의 앞부분을 잘라서 반환
-            return question[:50] + "..."
+            return fallback_summary(question)
 
-    def generate_response(self, prompt: str, additional_context: List[str] = None) -> str:
+    def summarize_history(self, summary: str, turns: Sequence[Tuple[str, str]]) -> Optional[str]:
         """
-        GPT API를 호출하여 응답을 생성합니다.
-        
+        기존 대화 메모리 요약에 이후 질문-답변(turns)을 합쳐 새 요약을 만듭니다.
+
         Args:
-            prompt (str): 사용자가 입력한 프롬프트
-            additional_context (List[str]): DB에서 가져온 추가 컨텍스트 목록
-            
+            summary (str): 기존 누적 요약
+            turns (Sequence[Tuple[str, str]]): 요약에 새로 반영할 (질문, 답변) 목록
+
         Returns:
-            str: GPT가 생성한 응답
+            Optional[str]: 새 요약 (실패 시 None, 호출한 쪽은 기존 메모리를 유지)
+        """
+        try:
+            response = self.backend.complete(
+                self._build_history_summary_messages(summary, turns),
+                temperature=0.3,
+                max_tokens=300
+            )
+            return response.strip()
+
+        except Exception as e:
+            print(f"Error in summarizing history: {str(e)}")
+            return None
+
+    def _build_summary_messages(self, question: str) -> List[dict]:
+        """
+        질문 요약용 GPT 메시지 목록을 구성합니다.
+        """
+        return [
+            {
+                "role": "system",
+                "content": "주어진 질문을 30자에서 50자 사이로 간단히 요약해주세요. 핵심 키워드를 포함하되, 너무 자세하지 않게 요약합니다."
+            },
+            {
+                "role": "user",
+                "content": question
+            }
+        ]
+
+    def _build_history_summary_messages(self, summary: str, turns: Sequence[Tuple[str, str]]) -> List[dict]:
+        """
+        대화 메모리 요약 갱신용 GPT 메시지 목록을 구성합니다.
+        """
+        transcript = "\n".join(f"Q: {question}\nA: {answer}" for question, answer in turns)
+        return [
+            {
+                "role": "system",
+                "content": (
+                    "다음은 애니메이션에 대한 대화의 기존 요약과 그 이후 질문-답변입니다. "
+                    "이후 질문에 답할 때 필요한 사실(언급된 인물, 에피소드, 사용자의 관심사)을 빠짐없이 담아 "
+                    "기존 요약과 합친 하나의 요약으로 간결하게 작성해주세요."
+                )
+            },
+            {
+                "role": "user",
+                "content": f"기존 요약: {summary or '(없음)'}\n\n이후 대화:\n{transcript}"
+            }
+        ]
+
+    def _build_messages(self, prompt: str, additional_context: List[str] = None, history: List[dict] = None) -> List[dict]:
+        """
+        시스템 메시지, 추가 컨텍스트, 이전 대화(history), 사용자 프롬프트로 GPT 메시지 목록을 구성합니다.
         """
         messages = []
         
@@ -67,6 +122,10 @@ class GPTService:
                 "role": "system",
                 "content": f"Here is some additional context about the anime/movie:\n{context_message}"
             })
+
+        # 이전 대화 (누적 요약 + 최근 질문-답변)
+        if history:
+            messages.extend(history)
         
         # 사용자 프롬프트 추가
         messages.append({
@@ -74,19 +133,134 @@ class GPTService:
             "content": prompt
         })
 
+        return messages
+
+    def generate_response(self, prompt: str, additional_context: List[str] = None, history: List[dict] = None) -> str:
+        """
+        GPT API를 호출하여 응답을 생성합니다.
+        
+        Args:
+            prompt (str): 사용자가 입력한 프롬프트
+            additional_context (List[str]): DB에서 가져온 추가 컨텍스트 목록
+            history (List[dict]): 이전 대화 메시지 (ConversationMemory.messages())
+            
+        Returns:
+            str: GPT가 생성한 응답
+        """
+        messages = self._build_messages(prompt, additional_context, history)
+
         try:
             # GPT API 호출
-            response = openai.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=0.7,
-                max_tokens=500
-            )
+            response = self.backend.complete(messages, temperature=0.7, max_tokens=500)
             
             # 응답 텍스트 반환
-            return response.choices[0].message.content.strip()
+            return response.strip()
             
         except Exception as e:
             # 에러 발생 시 로깅하고 기본 메시지 반환
             print(f"Error in GPT API call: {str(e)}")
-            return "죄송합니다. 응답을 생성하는 중에 오류가 발생했습니다."
\ No newline at end of file
+            return FALLBACK_RESPONSE
+
+    def stream_response(self, prompt: str, additional_context: List[str] = None, history: List[dict] = None) -> Iterator[str]:
+        """
+        GPT API를 스트리밍 모드로 호출하여 응답 텍스트 조각(delta)을 도착하는 즉시 반환합니다.
+
+        Args:
+            prompt (str): 사용자가 입력한 프롬프트
+            additional_context (List[str]): DB에서 가져온 추가 컨텍스트 목록
+            history (List[dict]): 이전 대화 메시지
+
+        Yields:
+            str: GPT가 생성한 응답 텍스트 조각
+        """
+        messages = self._build_messages(prompt, additional_context, history)
+        received = False
+
+        try:
+            # 이 제너레이터가 중간에 닫히면 백엔드 스트림(업스트림 응답)도 바로 닫음
+            with closing(self.backend.stream(messages, temperature=0.7, max_tokens=500)) as deltas:
+                for delta in deltas:
+                    received = True
+                    yield delta
+
+        except Exception as e:
+            # 에러 발생 시 로깅하고 기본 메시지 반환
+            print(f"Error in GPT API stream: {str(e)}")
+            # 이미 일부 응답을 보냈다면 그대로 종료하고, 아니면 기본 메시지 반환
+            if not received:
+                yield FALLBACK_RESPONSE
+
+
+class AsyncGPTService(GPTService):
+    """
+    GPTService의 비동기 버전
+
+    ASGI 환경에서 백엔드의 비동기 API(OpenAI는 AsyncOpenAI 클라이언트)를 사용하므로,
+    LLM 응답을 기다리는 동안 워커를 점유하지 않고 한 프로세스에서 많은 요청을 동시에 처리할 수 있습니다.
+    """
+
+    async def summarize_question(self, question: str) -> str:
+        """
+        질문을 간단하게 요약합니다. (비동기)
+        """
+        try:
+            response = await self.backend.acomplete(
+                self._build_summary_messages(question),
+                temperature=0.3,
+                max_tokens=100
+            )
+
+            return response.strip()
+
+        except Exception as e:
+            print(f"Error in summarizing question: {str(e)}")
+            return fallback_summary(question)
+
+    async def summarize_history(self, summary: str, turns: Sequence[Tuple[str, str]]) -> Optional[str]:
+        """
+        대화 메모리 요약을 갱신합니다. (비동기)
+        """
+        try:
+            response = await self.backend.acomplete(
+                self._build_history_summary_messages(summary, turns),
+                temperature=0.3,
+                max_tokens=300
+            )
+            return response.strip()
+
+        except Exception as e:
+            print(f"Error in summarizing history: {str(e)}")
+            return None
+
+    async def generate_response(self, prompt: str, additional_context: List[str] = None, history: List[dict] = None) -> str:
+        """
+        GPT API를 호출하여 응답을 생성합니다. (비동기)
+        """
+        messages = self._build_messages(prompt, additional_context, history)
+
+        try:
+            response = await self.backend.acomplete(messages, temperature=0.7, max_tokens=500)
+
+            return response.strip()
+
+        except Exception as e:
+            print(f"Error in GPT API call: {str(e)}")
+            return FALLBACK_RESPONSE
+
+    async def stream_response(self, prompt: str, additional_context: List[str] = None, history: List[dict] = None) -> AsyncIterator[str]:
+        """
+        GPT API를 스트리밍 모드로 호출하여 응답 텍스트 조각을 반환합니다. (비동기)
+        """
+        messages = self._build_messages(prompt, additional_context, history)
+        received = False
+
+        try:
+            async with aclosing(self.backend.astream(messages, temperature=0.7, max_tokens=500)) as deltas:
+                async for delta in deltas:
+                    received = True
+                    yield delta
+
+        except Exception as e:
+            print(f"Error in GPT API stream: {str(e)}")
+            if not received:
+                yield FALLBACK_RESPONSE
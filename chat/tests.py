@@ -1,12 +1,25 @@
 import os
-from unittest.mock import patch, MagicMock
+import threading
+import time
+
+import httpx
+import openai
+from unittest.mock import patch, MagicMock, AsyncMock
 from django.test import TestCase, override_settings
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework.test import APIClient
 from django.contrib.auth import get_user_model
-from .models import Conversation, QAPair
-from .services import GPTService
+from .models import Conversation, QAPair, BugReport
+from .services import GPTService, AsyncGPTService, fallback_summary
+from .llm import OpenAIBackend, FakeBackend, LLMBackendError, CircuitBreaker, CircuitOpenError
+from rest_framework_simplejwt.tokens import RefreshToken
+from .context import collect_context, pack_context, ContextSnippet, estimate_tokens
+from .answer_cache import answer_cache, normalize_question
+from .answering import summarize
+from .memory import load_memory, update_memory
 from series.models import Series
+from user.models import WatchingStatus
 
 User = get_user_model()
 
@@ -18,7 +31,7 @@ class GPTServiceTest(TestCase):
         self.gpt_service = GPTService()
         self.test_prompt = "이 애니메이션의 첫 번째 에피소드에 대해 설명해주세요."
 
-    @patch('openai.chat.completions.create')
+    @patch('chat.llm.OpenAIBackend._create')
     def test_generate_response(self, mock_create):
         # Mock GPT 응답 설정
         mock_response = MagicMock()
@@ -42,7 +55,7 @@ class GPTServiceTest(TestCase):
         context_message = next(msg for msg in call_args['messages'] if "테스트 애니메이션" in msg['content'])
         self.assertIsNotNone(context_message)
 
-    @patch('openai.chat.completions.create')
+    @patch('chat.llm.OpenAIBackend._create')
     def test_summarize_question(self, mock_create):
         # Mock GPT 응답 설정
         mock_response = MagicMock()
@@ -61,7 +74,7 @@ class GPTServiceTest(TestCase):
         call_args = mock_create.call_args[1]
         self.assertEqual(call_args['temperature'], 0.3)  # 요약은 더 결정적이어야 함
 
-    @patch('openai.chat.completions.create')
+    @patch('chat.llm.OpenAIBackend._create')
     def test_error_handling(self, mock_create):
         # API 에러 시뮬레이션
         mock_create.side_effect = Exception("API Error")
@@ -75,11 +88,179 @@ class GPTServiceTest(TestCase):
         self.assertTrue(summary.endswith("..."))
         self.assertLessEqual(len(summary), 53)  # 50자 + "..."
 
+    @patch('chat.llm.OpenAIBackend._create')
+    def test_stream_response(self, mock_create):
+        # 스트림 청크 Mock 설정 (빈 delta는 무시되어야 함)
+        chunks = []
+        for text in ["테스트 ", None, "응답입니다."]:
+            chunk = MagicMock()
+            chunk.choices[0].delta.content = text
+            chunks.append(chunk)
+        stream = MagicMock()
+        stream.__iter__.side_effect = lambda: iter(chunks)
+        mock_create.return_value = stream
+
+        deltas = list(self.gpt_service.stream_response(self.test_prompt))
+        self.assertEqual(deltas, ["테스트 ", "응답입니다."])
+        self.assertTrue(mock_create.call_args[1]['stream'])
+        stream.close.assert_called_once()
+
+        # 소비자가 중간에 멈춰도 업스트림 스트림을 닫음
+        stream.close.reset_mock()
+        deltas = self.gpt_service.stream_response(self.test_prompt)
+        self.assertEqual(next(deltas), "테스트 ")
+        deltas.close()
+        stream.close.assert_called_once()
+
+        # 스트림 시작 전 에러 시 기본 메시지 반환
+        mock_create.side_effect = Exception("API Error")
+        deltas = list(self.gpt_service.stream_response(self.test_prompt))
+        self.assertEqual(len(deltas), 1)
+        self.assertIn("죄송합니다", deltas[0])
+
+
+class OpenAIBackendResilienceTest(TestCase):
+    """OpenAI 백엔드 재시도/회로 차단기 테스트"""
+
+    def setUp(self):
+        self.backend = OpenAIBackend(max_retries=2, backoff_base=0, breaker_threshold=2)
+        self.backend.breaker.reset()
+        self.addCleanup(self.backend.breaker.reset)
+        self.messages = [{"role": "user", "content": "질문"}]
+
+    def _connection_error(self):
+        return openai.APIConnectionError(request=httpx.Request("POST", "https://api.openai.com/v1/chat/completions"))
+
+    def _response(self, content):
+        response = MagicMock()
+        response.choices[0].message.content = content
+        return response
+
+    def test_shared_client(self):
+        self.assertIs(self.backend.client, OpenAIBackend(max_retries=0).client)
+        self.assertEqual(self.backend.client.max_retries, 0)
+
+    def test_async_client_per_event_loop(self):
+        import asyncio
+
+        def handler(request):
+            return httpx.Response(200, json={
+                "id": "chatcmpl-1", "object": "chat.completion", "created": 0, "model": "gpt-4.1",
+                "choices": [{"index": 0, "finish_reason": "stop",
+                             "message": {"role": "assistant", "content": "비동기 응답"}}],
+            })
+
+        class MockAsyncClient(httpx.AsyncClient):
+            def __init__(self, **kwargs):
+                super().__init__(transport=httpx.MockTransport(handler), **kwargs)
+
+        async def ask():
+            answer = await self.backend.acomplete(self.messages, temperature=0.7, max_tokens=10)
+            return answer, self.backend.async_client, self.backend.async_client
+
+        # async_to_sync처럼 호출마다 새 이벤트 루프에서 실행해도 각 루프의 클라이언트를 사용
+        with patch('chat.llm.httpx.AsyncClient', MockAsyncClient):
+            first, client_a, client_b = asyncio.run(ask())
+            second, client_c, _ = asyncio.run(ask())
+        self.assertEqual((first, second), ("비동기 응답", "비동기 응답"))
+        self.assertIs(client_a, client_b)
+        self.assertIsNot(client_a, client_c)
+
+    @patch('chat.llm.time.sleep')
+    @patch('chat.llm.OpenAIBackend._create')
+    def test_retries_transient_errors(self, mock_create, mock_sleep):
+        mock_create.side_effect = [self._connection_error(), self._response("복구된 응답")]
+        self.assertEqual(self.backend.complete(self.messages, temperature=0.7, max_tokens=10), "복구된 응답")
+        self.assertEqual(mock_create.call_count, 2)
+        self.assertEqual(self.backend.breaker.state, CircuitBreaker.CLOSED)
+
+        # 400 등 재시도 대상이 아닌 오류는 한 번만 호출
+        mock_create.reset_mock()
+        mock_create.side_effect = ValueError("bad request")
+        with self.assertRaises(ValueError):
+            self.backend.complete(self.messages, temperature=0.7, max_tokens=10)
+        self.assertEqual(mock_create.call_count, 1)
+
+        # 시험 호출(half_open)이 그런 오류로 끝나도 차단기 상태는 그대로이고 다음 시험 호출을 허용
+        self.backend.breaker.record_failure()
+        self.backend.breaker.record_failure()
+        self.backend.breaker.opened_at -= self.backend.breaker.reset_timeout
+        with self.assertRaises(ValueError):
+            self.backend.complete(self.messages, temperature=0.7, max_tokens=10)
+        self.assertEqual(self.backend.breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertTrue(self.backend.breaker.allow())
+
+    @patch('chat.llm.time.sleep')
+    @patch('chat.llm.OpenAIBackend._create')
+    def test_breaker_opens_and_falls_back(self, mock_create, mock_sleep):
+        mock_create.side_effect = self._connection_error()
+        service = GPTService(backend=self.backend)
+        for _ in range(2):
+            self.assertIn("죄송합니다", service.generate_response("질문"))
+        self.assertEqual(mock_create.call_count, 6)
+        self.assertEqual(self.backend.breaker.state, CircuitBreaker.OPEN)
+
+        # 차단기가 열려 있으면 업스트림을 호출하지 않고 즉시 실패
+        mock_create.reset_mock()
+        with self.assertRaises(CircuitOpenError):
+            self.backend.complete(self.messages, temperature=0.7, max_tokens=10)
+        self.assertIn("죄송합니다", service.generate_response("질문"))
+        mock_create.assert_not_called()
+
+    def test_breaker_half_open(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        # reset_timeout이 지나면 시험 호출 하나만 허용
+        self.assertTrue(breaker.allow())
+        self.assertFalse(breaker.allow())
+        breaker.record_success()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+
+class FakeLLMBackendTest(TestCase):
+    """부하 테스트용 가짜 LLM 백엔드 테스트"""
+
+    def setUp(self):
+        self.messages = [{"role": "user", "content": "나루토 1화 줄거리"}]
+
+    def test_deterministic_response_and_latency(self):
+        backend = FakeBackend(ttft_ms=0, tokens_per_sec=0, response_tokens=20)
+        first = backend.complete(self.messages, temperature=0.7, max_tokens=500)
+        self.assertEqual(first, FakeBackend(ttft_ms=0, tokens_per_sec=0, response_tokens=20).complete(
+            self.messages, temperature=0.7, max_tokens=500))
+        self.assertEqual(len(first.split()), 20)
+        self.assertEqual("".join(backend.stream(self.messages, temperature=0.7, max_tokens=500)), first)
+
+        # 같은 메시지면 지연 분포에서 뽑힌 값도 같음
+        a = FakeBackend(ttft_ms=300).plan(self.messages, 500)
+        b = FakeBackend(ttft_ms=300).plan(self.messages, 500)
+        self.assertEqual(a[:2], b[:2])
+        self.assertGreater(a[0], 0)
+
+    def test_max_tokens_and_errors(self):
+        backend = FakeBackend(ttft_ms=0, tokens_per_sec=0, response_tokens=50, error_rate=1.0)
+        self.assertEqual(len(backend.plan(self.messages, 10)[2]), 10)
+        with self.assertRaises(LLMBackendError):
+            backend.complete(self.messages, temperature=0.7, max_tokens=10)
+
+        # GPTService는 백엔드 실패 시 기본 메시지를 반환
+        self.assertIn("죄송합니다", GPTService(backend=backend).generate_response("질문"))
+
+    @override_settings(CHAT_LLM_BACKEND='chat.llm.FakeBackend', CHAT_LLM_MODEL='fake-model',
+                       CHAT_LLM_OPTIONS={'ttft_ms': 0, 'tokens_per_sec': 0})
+    def test_backend_selected_from_settings(self):
+        service = GPTService()
+        self.assertIsInstance(service.backend, FakeBackend)
+        self.assertEqual(service.model, 'fake-model')
+        self.assertTrue(service.generate_response("질문"))
+
 
 class ChatAPIIntegrationTest(TestCase):
     """채팅 API 통합 테스트"""
 
     def setUp(self):
+        answer_cache.clear()
         self.client = APIClient()
         self.user = User.objects.create_user(username='tester', password='pass12345')
         self.client.force_authenticate(user=self.user)
@@ -127,6 +308,442 @@ class ChatAPIIntegrationTest(TestCase):
         self.conversation.refresh_from_db()
         self.assertEqual(self.conversation.summary, "테스트 질문 요약")  # 여전히 첫 번째 요약을 유지
 
+    @patch('chat.services.GPTService.stream_response')
+    @patch('chat.services.GPTService.summarize_question')
+    def test_create_qa_pair_stream(self, mock_summarize, mock_stream):
+        mock_summarize.return_value = "테스트 질문 요약"
+        mock_stream.return_value = iter(["스트리밍 ", "답변입니다."])
+
+        response = self.client.post(
+            reverse('conversation-qapairs', kwargs={'conversation_id': self.conversation.id}),
+            {'question': '테스트 질문입니다.', 'stream': True},
+            format='json',
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        body = b''.join(response.streaming_content).decode('utf-8')
+
+        # delta 이벤트가 순서대로 전달되고 마지막에 done 이벤트가 와야 함
+        self.assertIn('event: delta\ndata: {"text": "스트리밍 "}', body)
+        self.assertTrue(body.rstrip().split('\n\n')[-1].startswith('event: done'))
+
+        # 스트림 종료 후 answer_text가 저장되어야 함
+        qa = QAPair.objects.get(conversation=self.conversation)
+        self.assertEqual(qa.answer_text, "스트리밍 답변입니다.")
+
+    @patch('chat.services.GPTService.generate_response')
+    @patch('chat.services.GPTService.summarize_question')
+    def test_summary_runs_concurrently_with_answer(self, mock_summarize, mock_generate):
+        # 요약은 답변 생성이 시작되기를 기다림 -> 순차 실행이면 타임아웃으로 실패
+        answer_started = threading.Event()
+
+        def generate(*args, **kwargs):
+            answer_started.set()
+            return "동시 실행 답변"
+
+        def summarize(question):
+            return "동시 요약" if answer_started.wait(timeout=5) else "순차 실행됨"
+
+        mock_generate.side_effect = generate
+        mock_summarize.side_effect = summarize
+
+        response = self.client.post(
+            reverse('conversation-qapairs', kwargs={'conversation_id': self.conversation.id}),
+            {'question': '첫 질문입니다.'}
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.conversation.refresh_from_db()
+        self.assertEqual(self.conversation.summary, "동시 요약")
+
+    @patch('chat.services.GPTService.generate_response')
+    @patch('chat.services.GPTService.summarize_question')
+    def test_repeated_question_uses_answer_cache(self, mock_summarize, mock_generate):
+        mock_generate.return_value = "캐시될 답변입니다."
+        mock_summarize.return_value = "요약"
+        url = reverse('conversation-qapairs', kwargs={'conversation_id': self.conversation.id})
+
+        self.client.post(url, {'question': '나루토 1화 줄거리?'})
+        other = Conversation.objects.create(user=self.user, series=self.series)
+        response = self.client.post(
+            reverse('conversation-qapairs', kwargs={'conversation_id': other.id}),
+            {'question': ' 나루토  1화 줄거리 '}
+        )
+
+        # 정규화된 질문이 같으면 GPT를 다시 호출하지 않고 QAPair는 생성되어야 함
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['answer_text'], "캐시될 답변입니다.")
+        self.assertEqual(mock_generate.call_count, 1)
+        self.assertEqual(mock_summarize.call_count, 1)
+        self.assertEqual(QAPair.objects.filter(conversation=other).count(), 1)
+
+        # 에러 기본 메시지는 캐시하지 않음
+        mock_generate.return_value = "죄송합니다. 응답을 생성하는 중에 오류가 발생했습니다."
+        self.client.post(url, {'question': '다른 질문'})
+        self.client.post(url, {'question': '다른 질문'})
+        self.assertEqual(mock_generate.call_count, 3)
+
+    @patch('chat.services.GPTService.summarize_question')
+    def test_fallback_summary_is_not_cached(self, mock_summarize):
+        # 요약 실패 시 대신 쓴 요약(질문 앞부분)은 캐시하지 않고 다음에 다시 요약
+        mock_summarize.side_effect = fallback_summary
+        self.assertEqual(summarize("나루토 1화 줄거리?"), "나루토 1화 줄거리?...")
+        mock_summarize.side_effect = None
+        mock_summarize.return_value = "요약"
+        self.assertEqual(summarize("나루토 1화 줄거리?"), "요약")
+        self.assertEqual(summarize("나루토 1화 줄거리?"), "요약")
+        self.assertEqual(mock_summarize.call_count, 2)
+
+
+class AnswerCacheTest(TestCase):
+    """답변 캐시 키 단위 테스트"""
+
+    def test_normalize_question(self):
+        self.assertEqual(normalize_question(" 나루토  1화 줄거리?! "), "나루토 1화 줄거리")
+        self.assertEqual(normalize_question("ＡＢＣ"), "abc")
+
+
+class ContextPackerTest(TestCase):
+    """토큰 예산 기반 컨텍스트 구성 테스트"""
+
+    def test_estimate_tokens(self):
+        self.assertEqual(estimate_tokens("abcd" * 10), 10)
+        self.assertEqual(estimate_tokens("나루토"), 3)
+        self.assertEqual(estimate_tokens(""), 0)
+
+    def test_stable_first_and_priority_order(self):
+        packed = pack_context([
+            ContextSnippet("검색결과2", priority=-1),
+            ContextSnippet("시리즈 제목", stable=True, required=True),
+            ContextSnippet("검색결과1", priority=0),
+            ContextSnippet("시리즈 설명", stable=True),
+        ], budget=1000)
+        self.assertEqual(packed.snippets, ["시리즈 제목", "시리즈 설명", "검색결과1", "검색결과2"])
+        self.assertEqual(packed.used_tokens, sum(estimate_tokens(t) for t in packed.snippets))
+        self.assertEqual(packed.dropped, 0)
+
+    def test_budget_truncates_and_drops(self):
+        packed = pack_context([
+            ContextSnippet("가" * 50, priority=3),
+            ContextSnippet("나" * 50, priority=2),
+            ContextSnippet("다" * 50, priority=1),
+            ContextSnippet("스포일러 주의", stable=True, required=True),
+        ], budget=100)
+
+        # required는 예산을 먼저 예약하고, 남는 예산으로 우선순위 순서대로 채움
+        self.assertEqual(packed.snippets[0], "스포일러 주의")
+        self.assertEqual(packed.snippets[1], "가" * 50)
+        self.assertTrue(packed.snippets[2].startswith("나") and packed.snippets[2].endswith("…"))
+        self.assertLessEqual(packed.used_tokens, 100)
+        self.assertEqual(packed.truncated, 1)
+        self.assertEqual(packed.dropped, 1)
+
+
+class CollectContextTest(TestCase):
+    """시청 진행도 기반 컨텍스트 수집 테스트"""
+
+    def setUp(self):
+        from season.models import Season
+        from episode.models import Episode
+        self.user = User.objects.create_user(username='viewer', password='pass12345', nickname='viewer')
+        self.series = Series.objects.create(title="테스트 애니메이션", description="테스트용 시리즈입니다.")
+        season = Season.objects.create(series=self.series, season_number=1)
+        Episode.objects.create(season=season, episode_number=1, episode_title='시작', content='주인공이 검을 얻는다.')
+        Episode.objects.create(season=season, episode_number=2, episode_title='반전', content='주인공의 검이 부러진다.')
+        self.conversation = Conversation.objects.create(user=self.user, series=self.series)
+
+    def test_no_watching_status_excludes_episodes(self):
+        context = collect_context(self.conversation, '검은 어떻게 되나요?', self.user)
+        self.assertIn("시리즈 제목: 테스트 애니메이션", context)
+        self.assertFalse(any('검' in c and c.startswith('[') for c in context))
+
+    def test_watching_status_bounds_episodes(self):
+        WatchingStatus.objects.create(user=self.user, series=self.series, status='watching', current_episode=1)
+        context = '\n'.join(collect_context(self.conversation, '검은 어떻게 되나요?', self.user))
+        self.assertIn('검을 얻는다', context)
+        self.assertNotIn('부러진다', context)
+
+        WatchingStatus.objects.filter(user=self.user).update(status='completed')
+        context = '\n'.join(collect_context(self.conversation, '검은 어떻게 되나요?', self.user))
+        self.assertIn('부러진다', context)
+
+
+class ConversationListTest(TestCase):
+    """Conversation 목록 (cursor 페이지네이션, 사용자별 필터, QAPair 포함 방식) 테스트"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='lister', password='pass12345', nickname='lister')
+        self.other = User.objects.create_user(username='other', password='pass12345', nickname='other')
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('conversations')
+        self.conversations = []
+        for n in range(5):
+            conv = Conversation.objects.create(user=self.user, summary=f"대화{n}")
+            for m in range(3):
+                QAPair.objects.create(conversation=conv, question_text=f"질문{n}-{m}", answer_text="답변",
+                                      status=QAPair.STATUS_DONE)
+            self.conversations.append(conv)
+        Conversation.objects.create(user=self.other, summary="다른 사용자")
+
+    def test_paginates_own_conversations(self):
+        response = self.client.get(self.url, {'page_size': 2})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([c['summary'] for c in response.data['results']], ["대화4", "대화3"])
+        self.assertEqual(len(response.data['results'][0]['qapairs']), 3)
+
+        summaries = [c['summary'] for c in response.data['results']]
+        next_url = response.data['next']
+        while next_url:
+            response = self.client.get(next_url)
+            summaries.extend(c['summary'] for c in response.data['results'])
+            next_url = response.data['next']
+        self.assertEqual(summaries, ["대화4", "대화3", "대화2", "대화1", "대화0"])
+
+        response = self.client.get(self.url, {'user': self.other.id})
+        self.assertEqual([c['summary'] for c in response.data['results']], ["다른 사용자"])
+
+    def test_query_count_is_constant(self):
+        # 페이지 크기와 무관하게 (대화 + QAPair prefetch) 2개 쿼리
+        with self.assertNumQueries(2):
+            self.client.get(self.url, {'page_size': 5})
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url, {'page_size': 5, 'qapairs': 'latest'})
+        self.assertEqual(response.data['results'][0]['latest_qapair']['question_text'], "질문4-2")
+        self.assertNotIn('qapairs', response.data['results'][0])
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {'page_size': 5, 'qapairs': 'none'})
+        self.assertNotIn('latest_qapair', response.data['results'][0])
+
+    def test_invalid_params(self):
+        self.assertEqual(self.client.get(self.url, {'qapairs': 'some'}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {'user': 'abc'}).status_code, 400)
+
+
+class QAPairIncrementalFetchTest(TestCase):
+    """QAPair 증분 조회(?after_id=)와 long-poll(?wait=) 테스트"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.conversation = Conversation.objects.create()
+        self.first = QAPair.objects.create(conversation=self.conversation, question_text="질문1", answer_text="답변1",
+                                           status=QAPair.STATUS_DONE)
+        self.second = QAPair.objects.create(conversation=self.conversation, question_text="질문2", answer_text="답변2",
+                                            status=QAPair.STATUS_DONE)
+        self.url = reverse('conversation-qapairs', kwargs={'conversation_id': self.conversation.id})
+
+    def test_after_id(self):
+        response = self.client.get(self.url, {'after_id': self.first.id})
+        self.assertEqual([qa['id'] for qa in response.data], [self.second.id])
+        self.assertEqual(self.client.get(self.url, {'after_id': self.second.id}).data, [])
+        self.assertEqual(self.client.get(self.url, {'after_id': 'x'}).status_code, 400)
+
+    @patch('chat.views.time.sleep')
+    def test_long_poll_waits_for_pending_answer(self, mock_sleep):
+        pending = QAPair.objects.create(conversation=self.conversation, question_text="질문3",
+                                        status=QAPair.STATUS_PENDING)
+
+        def finish(_):
+            QAPair.objects.filter(pk=pending.pk).update(status=QAPair.STATUS_DONE, answer_text="답변3")
+        mock_sleep.side_effect = finish
+
+        response = self.client.get(self.url, {'after_id': self.second.id, 'wait': 5})
+        self.assertEqual(response.data[0]['status'], 'done')
+        self.assertEqual(response.data[0]['answer_text'], "답변3")
+        mock_sleep.assert_called_once()
+
+    @patch('chat.views.time.sleep')
+    @patch('chat.services.GPTService.stream_response')
+    def test_long_poll_waits_for_streaming_answer(self, mock_stream, mock_sleep):
+        user = User.objects.create_user(username='poller', password='pass12345')
+        self.client.force_authenticate(user=user)
+        mock_stream.return_value = iter(["스트리밍 ", "답변"])
+
+        # 스트림을 아직 읽지 않았으므로 답변 생성 중 (running)
+        stream = self.client.post(self.url, {'question': '질문3', 'stream': True}, format='json')
+        qa = QAPair.objects.get(conversation=self.conversation, question_text='질문3')
+        self.assertEqual((qa.status, qa.answer_text), (QAPair.STATUS_RUNNING, None))
+
+        # long-poll 대기 중에 스트림이 끝나면 완료된 답변을 반환
+        mock_sleep.side_effect = lambda _: b''.join(stream.streaming_content)
+        response = self.client.get(self.url, {'after_id': self.second.id, 'wait': 5})
+        mock_sleep.assert_called_once()
+        self.assertEqual(response.data[0]['status'], 'done')
+        self.assertEqual(response.data[0]['answer_text'], '스트리밍 답변')
+
+    @override_settings(CHAT_LONG_POLL_INTERVAL=0.01)
+    def test_long_poll_timeout(self):
+        response = self.client.get(self.url, {'after_id': self.second.id, 'wait': 0.05})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, [])
+
+    @override_settings(CHAT_LONG_POLL_INTERVAL=0.01, CHAT_LONG_POLL_MAX_WAIT=0.05)
+    def test_long_poll_wait_is_capped(self):
+        started = time.monotonic()
+        response = self.client.get(self.url, {'after_id': self.second.id, 'wait': 600})
+        self.assertEqual(response.data, [])
+        self.assertLess(time.monotonic() - started, 5)
+
+
+@override_settings(CHAT_MEMORY_TURNS=2)
+class ConversationMemoryTest(TestCase):
+    """대화 메모리(최근 질문-답변 + 누적 요약) 테스트"""
+
+    def setUp(self):
+        answer_cache.clear()
+        self.user = User.objects.create_user(username='memory', password='pass12345')
+        self.conversation = Conversation.objects.create(user=self.user)
+        self.service = MagicMock()
+
+    def _turn(self, n, **kwargs):
+        kwargs.setdefault('status', QAPair.STATUS_DONE)
+        return QAPair.objects.create(
+            conversation=self.conversation, question_text=f"질문{n}", answer_text=f"답변{n}", **kwargs
+        )
+
+    def test_load_memory_skips_unanswered_turns(self):
+        self._turn(1)
+        QAPair.objects.create(conversation=self.conversation, question_text="대기", status=QAPair.STATUS_PENDING)
+        QAPair.objects.create(conversation=self.conversation, question_text="실패", status=QAPair.STATUS_FAILED,
+                              answer_text="죄송합니다. 응답을 생성하는 중에 오류가 발생했습니다.")
+        memory = load_memory(self.conversation)
+        self.assertEqual([t.question for t in memory.turns], ["질문1"])
+        self.assertEqual(memory.messages(), [
+            {"role": "user", "content": "질문1"},
+            {"role": "assistant", "content": "답변1"},
+        ])
+        self.assertIsNone(load_memory(Conversation.objects.create()).fingerprint())
+
+    def test_incremental_summary(self):
+        first = self._turn(1)
+        self._turn(2)
+        self.assertFalse(update_memory(self.conversation, self.service))
+        self.service.summarize_history.assert_not_called()
+
+        # 최근 2개를 넘는 질문-답변만 기존 요약과 합침
+        self._turn(3)
+        self.service.summarize_history.return_value = "요약1"
+        self.assertTrue(update_memory(self.conversation, self.service))
+        self.service.summarize_history.assert_called_once_with("", [("질문1", "답변1")])
+        self.conversation.refresh_from_db()
+        self.assertEqual((self.conversation.memory_summary, self.conversation.memory_until), ("요약1", first.id))
+
+        self._turn(4)
+        self.service.summarize_history.return_value = "요약2"
+        update_memory(self.conversation, self.service)
+        self.service.summarize_history.assert_called_with("요약1", [("질문2", "답변2")])
+
+        memory = load_memory(self.conversation)
+        self.assertEqual(memory.summary, "요약2")
+        self.assertEqual([t.question for t in memory.turns], ["질문3", "질문4"])
+        self.assertIn("요약2", memory.messages()[0]["content"])
+
+        # 요약 실패 시 기존 메모리 유지
+        self._turn(5)
+        self.service.summarize_history.return_value = None
+        self.assertFalse(update_memory(self.conversation, self.service))
+        self.assertEqual(load_memory(self.conversation).summary, "요약2")
+
+    def test_prompt_size_is_bounded(self):
+        turns = [self._turn(n) for n in range(20)]
+        memory = load_memory(self.conversation)
+        # 요약이 밀려도 프롬프트에는 최근 CHAT_MEMORY_TURNS개만 사용
+        self.assertEqual([t.question for t in memory.turns], ["질문18", "질문19"])
+        self.assertEqual(len(memory.messages()), 4)
+        # 밀린 것은 가장 오래된 것부터 요약에 합침
+        self.assertEqual([t.question for t in memory.overflow()], ["질문0", "질문1"])
+
+        # 요약이 계속 실패해도 memory_until은 그대로이고, 성공하면 이어서 합침
+        self.service.summarize_history.return_value = None
+        for _ in range(3):
+            self.assertFalse(update_memory(self.conversation, self.service))
+        self.conversation.refresh_from_db()
+        self.assertEqual(self.conversation.memory_until, 0)
+
+        self.service.summarize_history.return_value = "요약"
+        self.assertTrue(update_memory(self.conversation, self.service))
+        self.service.summarize_history.assert_called_with("", [("질문0", "답변0"), ("질문1", "답변1")])
+        self.conversation.refresh_from_db()
+        self.assertEqual(self.conversation.memory_until, turns[1].id)
+        self.assertEqual([t.question for t in load_memory(self.conversation).overflow()], ["질문2", "질문3"])
+
+    @patch('chat.services.GPTService.summarize_history', return_value="이전 대화 요약")
+    @patch('chat.services.GPTService.generate_response', return_value="후속 답변")
+    def test_api_uses_memory(self, mock_generate, mock_summarize_history):
+        for n in range(3):
+            self._turn(n)
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        url = reverse('conversation-qapairs', kwargs={'conversation_id': self.conversation.id})
+
+        response = client.post(url, {'question': '그 다음은?'}, format='json')
+        self.assertEqual(response.status_code, 201)
+        history = mock_generate.call_args[0][2]
+        self.assertEqual([m["content"] for m in history if m["role"] == "user"], ["질문1", "질문2"])
+
+        # 답변 생성과 동시에 오래된 질문-답변을 요약해 저장
+        mock_summarize_history.assert_called_once_with("", [("질문0", "답변0")])
+        self.conversation.refresh_from_db()
+        self.assertEqual(self.conversation.memory_summary, "이전 대화 요약")
+
+        client.post(url, {'question': '그 다음은?'}, format='json')
+        history = mock_generate.call_args[0][2]
+        self.assertIn("이전 대화 요약", history[0]["content"])
+        self.assertEqual([m["content"] for m in history if m["role"] == "user"], ["질문2", "그 다음은?"])
+        mock_summarize_history.assert_called_with("이전 대화 요약", [("질문1", "답변1")])
+
+
+class AsyncChatAPITest(TestCase):
+    """비동기(ASGI) 질문 등록 API 테스트"""
+
+    def setUp(self):
+        answer_cache.clear()
+        self.user = User.objects.create_user(username='tester', password='pass12345')
+        token = RefreshToken.for_user(self.user).access_token
+        self.auth_headers = {'Authorization': f'Bearer {token}'}
+        self.series = Series.objects.create(title="테스트 애니메이션", description="테스트용 시리즈입니다.")
+        self.conversation = Conversation.objects.create(user=self.user, series=self.series, summary="")
+        self.url = reverse('conversation-qapairs-async', kwargs={'conversation_id': self.conversation.id})
+
+    @patch.object(AsyncGPTService, 'generate_response', new_callable=AsyncMock)
+    @patch.object(AsyncGPTService, 'summarize_question', new_callable=AsyncMock)
+    async def test_create_qa_pair_async(self, mock_summarize, mock_generate):
+        mock_generate.return_value = "비동기 답변입니다."
+        mock_summarize.return_value = "비동기 질문 요약"
+
+        response = await self.async_client.post(
+            self.url, {'question': '테스트 질문입니다.'}, content_type='application/json', headers=self.auth_headers
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()['answer_text'], "비동기 답변입니다.")
+        qa = await QAPair.objects.aget(conversation=self.conversation)
+        self.assertEqual(qa.answer_text, "비동기 답변입니다.")
+        conv = await Conversation.objects.aget(id=self.conversation.id)
+        self.assertEqual(conv.summary, "비동기 질문 요약")
+
+        # 컨텍스트에 시리즈 정보가 포함되어야 함
+        self.assertIn("시리즈 제목: 테스트 애니메이션", mock_generate.call_args[0][1])
+
+    async def test_requires_authentication(self):
+        response = await self.async_client.post(self.url, {'question': '질문'}, content_type='application/json')
+        self.assertEqual(response.status_code, 401)
+
+    @patch.object(OpenAIBackend, 'async_client', new_callable=MagicMock)
+    async def test_async_service_generate_response(self, mock_client):
+        mock_response = MagicMock()
+        mock_response.choices[0].message.content = " 테스트 응답입니다. "
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
+
+        response = await AsyncGPTService().generate_response("질문", ["컨텍스트"])
+        self.assertEqual(response, "테스트 응답입니다.")
+
+        mock_client.chat.completions.create.side_effect = Exception("API Error")
+        response = await AsyncGPTService().generate_response("질문")
+        self.assertIn("죄송합니다", response)
+
 
 class LiveGPTTest(TestCase):
     """실제 GPT API 호출 테스트
@@ -163,3 +780,203 @@ class LiveGPTTest(TestCase):
         self.assertIsNotNone(summary)
         self.assertGreater(len(summary), 10)
         self.assertLess(len(summary), 51)  # 30-50자 제한 확인
+
+
+from datetime import timedelta
+from django.core.management import call_command
+from django.test import TransactionTestCase
+from io import StringIO
+from .jobs import claim_jobs, process_job
+
+
+class BackgroundAnswerJobTest(TransactionTestCase):
+    """백그라운드 답변 작업(202 + 워커) 테스트"""
+
+    def setUp(self):
+        answer_cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='tester', password='pass12345', nickname='tester')
+        self.client.force_authenticate(user=self.user)
+        self.series = Series.objects.create(title="테스트 애니메이션", description="테스트용 시리즈입니다.")
+        self.conversation = Conversation.objects.create(user=self.user, series=self.series)
+        self.url = reverse('conversation-qapairs', kwargs={'conversation_id': self.conversation.id})
+
+    @patch('chat.services.GPTService.generate_response')
+    @patch('chat.services.GPTService.summarize_question')
+    def test_background_submit_and_worker(self, mock_summarize, mock_generate):
+        mock_generate.return_value = "워커가 생성한 답변"
+        mock_summarize.return_value = "워커 요약"
+
+        response = self.client.post(self.url, {'question': '백그라운드 질문', 'background': True}, format='json')
+        self.assertEqual(response.status_code, 202)
+        job_id = response.data['job_id']
+        self.assertEqual(response.data['status'], QAPair.STATUS_PENDING)
+        self.assertIsNone(response.data['qapair']['answer_text'])
+        mock_generate.assert_not_called()
+
+        call_command('run_answer_worker', once=True, workers=2, stdout=StringIO())
+
+        status_resp = self.client.get(reverse('qapair-status', kwargs={'qapair_id': job_id}))
+        self.assertEqual(status_resp.data['status'], QAPair.STATUS_DONE)
+        self.assertEqual(status_resp.data['answer_text'], "워커가 생성한 답변")
+        self.conversation.refresh_from_db()
+        self.assertEqual(self.conversation.summary, "워커 요약")
+
+    def test_stream_and_background_are_exclusive(self):
+        response = self.client.post(self.url, {'question': '질문', 'background': True, 'stream': True}, format='json')
+        self.assertEqual(response.status_code, 400)
+
+    @patch('chat.services.GPTService.generate_response')
+    def test_claim_is_exclusive_and_failures_retry(self, mock_generate):
+        mock_generate.return_value = "죄송합니다. 응답을 생성하는 중에 오류가 발생했습니다."
+        self.conversation.summary = "요약"
+        self.conversation.save()
+        qa = QAPair.objects.create(conversation=self.conversation, question_text='질문', status=QAPair.STATUS_PENDING)
+
+        self.assertEqual(claim_jobs(5), [qa.id])
+        self.assertEqual(claim_jobs(5), [])  # 이미 점유된 작업은 다시 가져가지 않음
+
+        # 실패 시 max_attempts 전까지는 백오프 후 pending으로 되돌림
+        self.assertEqual(process_job(qa.id, max_attempts=2, backoff_base=60), QAPair.STATUS_PENDING)
+        qa.refresh_from_db()
+        self.assertGreater(qa.next_attempt_at, timezone.now() + timedelta(seconds=30))
+        self.assertEqual(claim_jobs(5), [])  # 재시도 시각 전에는 가져가지 않음
+
+        QAPair.objects.filter(pk=qa.pk).update(next_attempt_at=timezone.now() - timedelta(seconds=1))
+        self.assertEqual(claim_jobs(5), [qa.id])
+        self.assertEqual(process_job(qa.id, max_attempts=2), QAPair.STATUS_FAILED)
+        qa.refresh_from_db()
+        self.assertEqual(qa.attempts, 2)
+        self.assertEqual(qa.status, QAPair.STATUS_FAILED)
+
+
+@patch('chat.channelio._auth_headers', return_value={})
+class ChannelIoIdCacheTest(TestCase):
+    """Channel.io memberId/userId 매핑 캐시 테스트"""
+
+    def setUp(self):
+        from . import channelio
+        self.channelio = channelio
+        channelio.clear_id_cache()
+        self.addCleanup(channelio.clear_id_cache)
+
+    def _response(self, status_code=200, data=None):
+        response = MagicMock(status_code=status_code)
+        response.json.return_value = data or {}
+        return response
+
+    def _get(self, url, **kwargs):
+        if url.endswith('/user-chats'):
+            return self._response(data={'userChats': [{'id': 'chat-1', 'state': 'opened'}]})
+        return self._response(data={'user': {'id': 'user-1'}})
+
+    def _patch_http(self):
+        """공유 HTTP 클라이언트 호출을 GET/POST 별 mock으로 나눔"""
+        mock_get, mock_post = MagicMock(side_effect=self._get), MagicMock()
+        patcher = patch('chat.channelio.http_client.request',
+                        side_effect=lambda method, url, **kw: (mock_get if method == 'GET' else mock_post)(url, **kw))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return mock_get, mock_post
+
+    def test_repeat_report_uses_one_call(self, _):
+        mock_get, mock_post = self._patch_http()
+        mock_post.return_value = self._response(data={'message': {}})
+
+        self.channelio.report_bug_with_member_id('member-1', '질문', '답변')
+        self.assertEqual((mock_get.call_count, mock_post.call_count), (2, 1))
+
+        self.channelio.report_bug_with_member_id('member-1', '질문', '답변')
+        self.assertEqual((mock_get.call_count, mock_post.call_count), (2, 2))
+        self.assertTrue(mock_post.call_args[0][0].endswith('/user-chats/chat-1/messages'))
+
+    def test_stale_ids_are_invalidated(self, _):
+        mock_get, mock_post = self._patch_http()
+        mock_post.return_value = self._response(data={})
+        self.channelio.report_bug_with_member_id('member-1', '질문', '답변')
+
+        # 캐시된 userChat이 사라졌으면(404) 다시 조회해서 전송
+        mock_post.side_effect = [self._response(404), self._response(data={})]
+        self.channelio.report_bug_with_member_id('member-1', '질문', '답변')
+        self.assertEqual(mock_get.call_count, 4)
+        self.assertEqual(mock_post.call_count, 3)
+
+        # 다시 조회해도 실패하면 에러
+        mock_post.side_effect = [self._response(404), self._response(404)]
+        with self.assertRaises(self.channelio.ChannelIoUserChatNotFound):
+            self.channelio.report_bug_with_member_id('member-1', '질문', '답변')
+
+    def test_network_error_is_wrapped(self, _):
+        import requests
+        with patch('chat.channelio.http_client.request', side_effect=requests.ConnectionError("reset")):
+            with self.assertRaises(self.channelio.ChannelIoError):
+                self.channelio.report_bug_with_member_id('member-1', '질문', '답변')
+
+
+class BugReportOutboxTest(TransactionTestCase):
+    """오류 신고 outbox (202 접수, 중복 제거, 재시도 전송) 테스트"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse('report-issue')
+        self.body = {'memberId': 'member-1', 'query': '질문', 'answerText': '틀린 답변', 'answerId': 42}
+
+    def test_report_is_queued_and_deduplicated(self):
+        response = self.client.post(self.url, self.body, format='json')
+        self.assertEqual(response.status_code, 202)
+        self.assertFalse(response.data['duplicate'])
+        report = BugReport.objects.get()
+        self.assertEqual((report.answer_id, report.status), ('42', BugReport.STATUS_PENDING))
+
+        response = self.client.post(self.url, self.body, format='json')
+        self.assertEqual(response.status_code, 202)
+        self.assertTrue(response.data['duplicate'])
+        self.assertEqual(response.data['report_id'], report.id)
+        self.assertEqual(BugReport.objects.count(), 1)
+
+        self.assertEqual(self.client.post(self.url, {'memberId': 'member-1'}, format='json').status_code, 400)
+
+    @patch('chat.outbox.report_bug_with_member_id')
+    def test_delivery_retries_with_backoff(self, mock_report):
+        from .channelio import ChannelIoError
+        from .outbox import BugReportWorkerPool, claim_reports
+
+        self.client.post(self.url, self.body, format='json')
+        mock_report.side_effect = ChannelIoError("502")
+        pool = BugReportWorkerPool(workers=1, max_attempts=2, backoff_base=60)
+        pool.run(once=True)
+
+        report = BugReport.objects.get()
+        self.assertEqual((report.status, report.attempts, report.last_error), (BugReport.STATUS_PENDING, 1, "502"))
+        self.assertGreater(report.next_attempt_at, timezone.now())
+        # 백오프 시간이 지나기 전에는 다시 가져가지 않음
+        self.assertEqual(claim_reports(10), [])
+
+        BugReport.objects.update(next_attempt_at=timezone.now())
+        mock_report.side_effect = None
+        pool.run(once=True)
+        report.refresh_from_db()
+        self.assertEqual((report.status, report.attempts), (BugReport.STATUS_SENT, 2))
+        self.assertEqual(mock_report.call_args[1]['answer_id'], '42')
+
+    @patch('chat.outbox.report_bug_with_member_id')
+    def test_unknown_member_fails_without_retry(self, mock_report):
+        from .channelio import ChannelIoUserNotFound
+        from .outbox import BugReportWorkerPool
+
+        self.client.post(self.url, self.body, format='json')
+        mock_report.side_effect = ChannelIoUserNotFound("Channel user not found for memberId=member-1")
+        BugReportWorkerPool(workers=1, max_attempts=8).run(once=True)
+
+        report = BugReport.objects.get()
+        self.assertEqual((report.status, report.attempts), (BugReport.STATUS_FAILED, 1))
+        self.assertIn('memberId=member-1', report.last_error)
+
+    def test_rate_limit(self):
+        from .outbox import BugReportWorkerPool
+
+        for n in range(5):
+            BugReport.objects.create(member_id='m', query='q', answer_text='a', answer_id=str(n))
+        pool = BugReportWorkerPool(workers=4, rate=2)
+        self.assertEqual(len(pool.claim(4)), 2)
+        self.assertEqual(pool.claim(4), [])
@@ -1,8 +1,12 @@
 from django.urls import path
-from .views import ConversationListCreateView, QAPairListCreateView, ChannelBugReportView
+from .views import (
+    ConversationListCreateView, QAPairListCreateView, AsyncQAPairCreateView, QAPairStatusView, ChannelBugReportView
+)
 
 urlpatterns = [
     path('', ConversationListCreateView.as_view(), name='conversations'),
     path('<int:conversation_id>/qapairs/', QAPairListCreateView.as_view(), name='conversation-qapairs'),
+    path('<int:conversation_id>/qapairs/async/', AsyncQAPairCreateView.as_view(), name='conversation-qapairs-async'),
+    path('qapairs/<int:qapair_id>/', QAPairStatusView.as_view(), name='qapair-status'),
     path("report/", ChannelBugReportView.as_view(), name="report-issue"),
 ]
@@ -4,47 +4,183 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from django.shortcuts import get_object_or_404
-from .models import Conversation, QAPair
+from django.urls import reverse
+from .models import Conversation, QAPair, BugReport
 from .serializers import (
     ConversationSerializer,
+    ConversationPreviewSerializer,
     QAPairSerializer,
     CreateQuestionSerializer,
 )
 from series.models import Series
+from config.pagination import CreatedAtCursorPagination, CURSOR_PARAMETERS
+from django.db.models import OuterRef, Prefetch, Subquery
 from django.contrib.auth import get_user_model
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 import json
-from django.http import JsonResponse
-from django.views.decorators.http import require_POST
+import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from django.http import JsonResponse, StreamingHttpResponse
+from rest_framework.utils.encoders import JSONEncoder
 from django.views.decorators.csrf import csrf_exempt
-from .services import GPTService
+from django.utils.decorators import method_decorator
+from django.views import View
+from asgiref.sync import sync_to_async
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken, AuthenticationFailed
+from .context import collect_context, get_spoiler_bound
+from .answer_cache import answer_cache, answer_key
+from .answering import gpt_service, async_gpt_service, answer_status, remember_answer, summarize, asummarize
+from .memory import load_memory, store_memory
 
 
 User = get_user_model()
-gpt_service = GPTService()
+# 첫 질문의 대화 요약과 대화 메모리 요약 갱신을 답변 생성과 동시에 실행하기 위한 스레드 풀 (DB 접근 없이 GPT 호출만 수행)
+summary_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='chat-summary')
+
+
+def _sse_event(event: str, data) -> str:
+    """SSE(Server-Sent Events) 형식의 이벤트 문자열을 만듭니다."""
+    payload = json.dumps(data, cls=JSONEncoder, ensure_ascii=False)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+def _save_summary(conv, summary_future):
+    """동시에 실행한 요약 작업이 끝나면 Conversation.summary에 저장"""
+    if summary_future is None:
+        return
+    conv.summary = summary_future.result()
+    conv.save(update_fields=['summary'])
+
+
+def _fold_memory(memory):
+    """
+    최근 N개를 넘는 질문-답변이 있으면 누적 요약 갱신을 답변 생성과 동시에 시작합니다.
+    Returns: (memory, 요약에 합칠 질문-답변, future) 또는 None
+    """
+    folded = memory.overflow()
+    if not folded:
+        return None
+    future = summary_executor.submit(
+        gpt_service.summarize_history, memory.summary, [(t.question, t.answer) for t in folded]
+    )
+    return memory, folded, future
+
+
+def _save_memory(conv, memory_fold):
+    """동시에 실행한 메모리 요약 작업이 끝나면 Conversation에 저장"""
+    if memory_fold is None:
+        return
+    memory, folded, future = memory_fold
+    store_memory(conv, memory, folded, future.result())
+
+
+def _qapairs_after(conversation_id, after_id):
+    """after_id 이후의 QAPair를 ID 순으로 조회 ((conversation, id) 인덱스 사용)"""
+    return list(QAPair.objects.filter(conversation_id=conversation_id, id__gt=after_id).order_by('id'))
+
+
+def _sync_ready(qas):
+    """증분 조회 결과가 있고 답변 생성 중인 QAPair가 없으면 True"""
+    return bool(qas) and all(qa.status not in (QAPair.STATUS_PENDING, QAPair.STATUS_RUNNING) for qa in qas)
+
+
+def _sse_response(events):
+    response = StreamingHttpResponse(events, content_type='text/event-stream', status=status.HTTP_201_CREATED)
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'  # 프록시(nginx 등) 버퍼링 방지
+    return response
+
+
+def _stream_answer(qa, deltas, cache_key, summary_future=None, memory_fold=None):
+    """
+    응답 조각(deltas)을 SSE 이벤트로 전달하고, 스트림이 끝나면 answer_text를 저장합니다.
+
+    - delta: {"text": "..."} 응답 조각
+    - done: 저장된 QAPair 전체
+    """
+    chunks = []
+    completed = False
+    try:
+        for delta in deltas:
+            chunks.append(delta)
+            yield _sse_event('delta', {'text': delta})
+        completed = True
+    finally:
+        # 클라이언트 연결이 끊겨도 그때까지 받은 답변은 저장 (상태도 같은 저장에서 완료로 바꿈)
+        qa.answer_text = ''.join(chunks).strip()
+        qa.status = answer_status(qa.answer_text)
+        qa.save(update_fields=['answer_text', 'status'])
+        if completed:
+            remember_answer(cache_key, qa.answer_text)
+        _save_summary(qa.conversation, summary_future)
+        _save_memory(qa.conversation, memory_fold)
+
+    yield _sse_event('done', QAPairSerializer(qa).data)
 
 
 class ConversationListCreateView(APIView):
     """
     Conversation 목록 조회 및 새 Conversation 생성
 
-    GET: 모든 Conversation 목록 반환
+    GET: Conversation 목록을 생성일 역순 cursor 페이지로 반환
     POST: 새 Conversation 생성 (summary, series)
     """
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
-
-    
+    pagination_class = CreatedAtCursorPagination
+    QAPAIRS_MODES = ('all', 'latest', 'none')
 
     @swagger_auto_schema(
         operation_summary="Conversation 목록 조회",
-        operation_description="모든 Conversation(대화 세션)을 생성일 역순으로 반환합니다.",
-        responses={200: ConversationSerializer(many=True)}
+        operation_description=(
+            "Conversation(대화 세션)을 생성일 역순으로 cursor 페이지네이션해 반환합니다. "
+            "응답의 `next`/`previous` 링크로 다음/이전 페이지를 가져옵니다.\n\n"
+            "로그인한 사용자는 기본적으로 자신의 대화만 조회하며, `user`로 다른 사용자를 지정할 수 있습니다.\n\n"
+            "`qapairs`: `all`(기본, 모든 QAPair 포함) / `latest`(가장 최근 QAPair 하나만 `latest_qapair`로 포함) / `none`(미포함)"
+        ),
+        manual_parameters=CURSOR_PARAMETERS + [
+            openapi.Parameter('user', openapi.IN_QUERY, description='사용자 ID로 필터링', type=openapi.TYPE_INTEGER),
+            openapi.Parameter('qapairs', openapi.IN_QUERY, description='QAPair 포함 방식', type=openapi.TYPE_STRING, enum=list(QAPAIRS_MODES)),
+        ],
+        responses={200: ConversationSerializer(many=True), 400: '잘못된 요청'}
     )
     def get(self, request):
-        conversations = Conversation.objects.all().order_by('-created_at')
-        serializer = ConversationSerializer(conversations, many=True)
-        return Response(serializer.data)
+        mode = request.query_params.get('qapairs', 'all')
+        if mode not in self.QAPAIRS_MODES:
+            return Response({'qapairs': f"{', '.join(self.QAPAIRS_MODES)} 중 하나여야 합니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+        conversations = Conversation.objects.all()
+        user_id = request.query_params.get('user')
+        if user_id is not None:
+            if not user_id.isdigit():
+                return Response({'user': '사용자 ID는 정수여야 합니다.'}, status=status.HTTP_400_BAD_REQUEST)
+            conversations = conversations.filter(user_id=int(user_id))
+        elif request.user.is_authenticated:
+            conversations = conversations.filter(user=request.user)
+
+        if mode == 'all':
+            conversations = conversations.prefetch_related(
+                Prefetch('qapairs', queryset=QAPair.objects.order_by('created_at', 'id'))
+            )
+        elif mode == 'latest':
+            latest = QAPair.objects.filter(conversation=OuterRef('pk')).order_by('-id').values('id')[:1]
+            conversations = conversations.annotate(latest_qapair_id=Subquery(latest))
+
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(conversations, request, view=self)
+
+        if mode == 'all':
+            serializer = ConversationSerializer(page, many=True)
+        else:
+            if mode == 'latest':
+                # 페이지의 최신 QAPair들을 한 번에 조회
+                qapairs = QAPair.objects.in_bulk([c.latest_qapair_id for c in page if c.latest_qapair_id])
+                for conv in page:
+                    conv.latest_qapair = qapairs.get(conv.latest_qapair_id)
+            serializer = ConversationPreviewSerializer(page, many=True, context={'qapairs': mode})
+        return paginator.get_paginated_response(serializer.data)
 
     @swagger_auto_schema(
         operation_summary="새 대화 생성",
@@ -85,26 +221,59 @@ class QAPairListCreateView(APIView):
 
     @swagger_auto_schema(
         operation_summary="Conversation의 QAPair 목록 조회",
-        operation_description="주어진 Conversation ID에 연결된 모든 QAPair를 생성일 순으로 반환합니다.",
+        operation_description=(
+            "주어진 Conversation ID에 연결된 QAPair를 생성일 순으로 반환합니다.\n\n"
+            "`after_id`를 주면 그 ID 이후의 QAPair만 ID 순으로 반환합니다. (마지막으로 받은 ID를 넘겨 증분 동기화)\n\n"
+            "`wait`(초)를 함께 주면 long-poll로 동작해, 새 QAPair가 있고 그 답변이 모두 완료(pending/running 아님)될 때까지 "
+            "최대 `wait`초(CHAT_LONG_POLL_MAX_WAIT 이하, 기본 5초) 기다린 뒤 그 시점의 결과를 반환합니다. "
+            "대기 중에는 서버 워커를 점유하므로 대기 시간이 짧게 제한되며, 준비되지 않은 채 반환되면 같은 `after_id`로 다시 요청하세요."
+        ),
         manual_parameters=[
-            openapi.Parameter('conversation_id', openapi.IN_PATH, description='대화 ID', type=openapi.TYPE_INTEGER)
+            openapi.Parameter('conversation_id', openapi.IN_PATH, description='대화 ID', type=openapi.TYPE_INTEGER),
+            openapi.Parameter('after_id', openapi.IN_QUERY, description='이 ID 이후의 QAPair만 반환', type=openapi.TYPE_INTEGER),
+            openapi.Parameter('wait', openapi.IN_QUERY, description='long-poll 최대 대기 시간(초)', type=openapi.TYPE_NUMBER),
         ],
-        responses={200: QAPairSerializer(many=True), 404: 'Conversation 없음'}
+        responses={200: QAPairSerializer(many=True), 400: '잘못된 요청', 404: 'Conversation 없음'}
     )
     def get(self, request, conversation_id):
         conv = get_object_or_404(Conversation, id=conversation_id)
-        qas = conv.qapairs.all()
-        serializer = QAPairSerializer(qas, many=True)
-        return Response(serializer.data)
+        after_id = request.query_params.get('after_id')
+        wait = request.query_params.get('wait')
+
+        if after_id is None:
+            qas = conv.qapairs.all()
+            serializer = QAPairSerializer(qas, many=True)
+            return Response(serializer.data)
+
+        try:
+            after_id = int(after_id)
+            wait = min(max(float(wait or 0), 0), getattr(settings, 'CHAT_LONG_POLL_MAX_WAIT', 5))
+        except ValueError:
+            return Response({'detail': 'after_id는 정수, wait는 숫자여야 합니다.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        qas = _qapairs_after(conv.id, after_id)
+        deadline = time.monotonic() + wait
+        # long-poll: 새 QAPair가 생기고 답변이 모두 채워질 때까지 짧은 간격으로 다시 조회
+        # (동기 뷰라 기다리는 동안 워커 스레드를 점유하므로 wait는 CHAT_LONG_POLL_MAX_WAIT로 짧게 제한)
+        while not _sync_ready(qas) and time.monotonic() < deadline:
+            time.sleep(min(getattr(settings, 'CHAT_LONG_POLL_INTERVAL', 0.5), max(deadline - time.monotonic(), 0)))
+            qas = _qapairs_after(conv.id, after_id)
+        return Response(QAPairSerializer(qas, many=True).data)
 
     @swagger_auto_schema(
         operation_summary="질문 등록 및 자동 응답 생성",
-        operation_description="Conversation에 질문을 등록하면 QAPair가 생성되고 간단한 자동응답이 채워져 반환됩니다.",
+        operation_description=(
+            "Conversation에 질문을 등록하면 QAPair가 생성되고 간단한 자동응답이 채워져 반환됩니다.\n\n"
+            "`stream: true`이면 `text/event-stream`으로 응답 조각(`delta`)을 생성되는 즉시 전달하고, "
+            "마지막에 저장된 QAPair를 `done` 이벤트로 보냅니다.\n\n"
+            "`background: true`이면 QAPair를 `pending` 상태로 만들고 202와 작업 ID(`job_id`)를 바로 반환합니다. "
+            "답변은 `run_answer_worker` 워커가 채우며, `status_url` 또는 QAPair 목록으로 확인합니다."
+        ),
         manual_parameters=[
             openapi.Parameter('conversation_id', openapi.IN_PATH, description='대화 ID', type=openapi.TYPE_INTEGER)
         ],
         request_body=CreateQuestionSerializer,
-        responses={201: QAPairSerializer(), 400: '잘못된 요청', 404: 'Conversation 없음'}
+        responses={201: QAPairSerializer(), 202: '백그라운드 작업 등록됨', 400: '잘못된 요청', 404: 'Conversation 없음'}
     )
     def post(self, request, conversation_id):
         conv = get_object_or_404(Conversation, id=conversation_id)
@@ -113,51 +282,256 @@ class QAPairListCreateView(APIView):
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
         question = serializer.validated_data['question']
-        
+        user = request.user
+
+        # 백그라운드 모드: 답변 없이 대기 상태로 저장하고 바로 응답 (워커가 답변/요약 생성)
+        if serializer.validated_data['background']:
+            qa = QAPair.objects.create(conversation=conv, question_text=question, status=QAPair.STATUS_PENDING)
+            return Response({
+                'job_id': qa.id,
+                'status': qa.status,
+                'status_url': request.build_absolute_uri(reverse('qapair-status', kwargs={'qapair_id': qa.id})),
+                'qapair': QAPairSerializer(qa).data,
+            }, status=status.HTTP_202_ACCEPTED)
+
+        # 이전 대화는 최근 N개 질문-답변 + 누적 요약으로 프롬프트에 포함
+        # (오래된 질문-답변의 요약 갱신은 답변 생성과 동시에 실행)
+        memory = load_memory(conv)
+        memory_fold = _fold_memory(memory)
+
+        # 같은 시리즈/시청 범위/대화 맥락의 같은 질문은 캐시된 답변 재사용
+        bound = get_spoiler_bound(user, conv.series_id) if conv.series_id else None
+        cache_key = answer_key(question, conv.series_id, bound, memory.fingerprint())
+
         # 첫 번째 질문인 경우에만 GPT로 요약하여 summary 설정
+        # (요약은 답변 생성과 동시에 실행하고, 답변이 끝난 뒤 저장)
+        summary_future = None
         if not conv.qapairs.exists():
-            summary = gpt_service.summarize_question(question)
-            conv.summary = summary
-            conv.save()
-
-        # QAPair 생성 (초기에는 answer_text 비워두고 생성)
-        qa = QAPair.objects.create(conversation=conv, question_text=question)
-
-        # 시리즈와 관련된 컨텍스트 수집
-        additional_context = []
-        if conv.series:
-            series = conv.series
-            additional_context.extend([
-                f"시리즈 제목: {series.title}",
-                f"시리즈 설명: {series.description}",
-            ])
-            # 시즌 정보 추가
-            for season in series.seasons.all():
-                additional_context.append(f"시즌 {season.number}: {season.title}")
-                additional_context.append(f"시즌 설명: {season.description}")
-
-        # GPT API를 통해 답변 생성
-        answer = gpt_service.generate_response(question, additional_context)
+            summary_future = summary_executor.submit(summarize, question)
+
+        # QAPair 생성 (답변을 저장할 때까지 running이므로 long-poll 조회는 완료를 기다림)
+        qa = QAPair.objects.create(conversation=conv, question_text=question, status=QAPair.STATUS_RUNNING)
+        cached = answer_cache.get(cache_key)
+
+        # 스트리밍 모드: 첫 토큰부터 바로 전달하고 스트림 종료 후 answer_text 저장
+        if serializer.validated_data['stream']:
+            if cached is not None:
+                return _sse_response(_stream_answer(qa, [cached], cache_key, summary_future, memory_fold))
+            # 시리즈 정보와 시청 범위 이내의 관련 에피소드 내용 수집
+            additional_context = collect_context(conv, question, user, bound=bound)
+            deltas = gpt_service.stream_response(question, additional_context, memory.messages())
+            return _sse_response(_stream_answer(qa, deltas, cache_key, summary_future, memory_fold))
+
+        if cached is not None:
+            answer = cached
+        else:
+            # 시리즈 정보와 시청 범위 이내의 관련 에피소드 내용 수집
+            additional_context = collect_context(conv, question, user, bound=bound)
+            # GPT API를 통해 답변 생성
+            answer = gpt_service.generate_response(question, additional_context, memory.messages())
+            remember_answer(cache_key, answer)
+
         qa.answer_text = answer
-        qa.save()
+        qa.status = answer_status(answer)
+        qa.save(update_fields=['answer_text', 'status'])
+        _save_summary(conv, summary_future)
+        _save_memory(conv, memory_fold)
 
         return Response(QAPairSerializer(qa).data, status=status.HTTP_201_CREATED)
 
-from .channelio import (
-    report_bug_with_member_id,
-    ChannelIoUserNotFound,
-    ChannelIoError,
-)
 
-class ChannelBugReportView(APIView):
-    @csrf_exempt  # 실제 서비스면 CSRF 토큰 처리 추천
-    @require_POST
-    def channel_bug_report(request):
+class QAPairStatusView(APIView):
+    """
+    QAPair 단건 조회 (백그라운드 답변 작업 상태 확인용)
+    """
+    permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+
+    @swagger_auto_schema(
+        operation_summary="QAPair 상태 조회",
+        operation_description="QAPair 하나를 반환합니다. background 모드로 등록한 질문의 `status`(pending/running/done/failed)와 답변을 확인할 때 사용합니다.",
+        manual_parameters=[
+            openapi.Parameter('qapair_id', openapi.IN_PATH, description='QAPair ID (job_id)', type=openapi.TYPE_INTEGER)
+        ],
+        responses={200: QAPairSerializer(), 404: 'QAPair 없음'}
+    )
+    def get(self, request, qapair_id):
+        qa = get_object_or_404(QAPair, id=qapair_id)
+        return Response(QAPairSerializer(qa).data)
+
+
+async def _asave_summary(conv, summary_task):
+    """_save_summary의 비동기 버전"""
+    if summary_task is None:
+        return
+    conv.summary = await summary_task
+    await conv.asave(update_fields=['summary'])
+
+
+def _afold_memory(memory):
+    """_fold_memory의 비동기 버전 (future 대신 asyncio task)"""
+    folded = memory.overflow()
+    if not folded:
+        return None
+    task = asyncio.ensure_future(
+        async_gpt_service.summarize_history(memory.summary, [(t.question, t.answer) for t in folded])
+    )
+    return memory, folded, task
+
+
+async def _asave_memory(conv, memory_fold):
+    """_save_memory의 비동기 버전"""
+    if memory_fold is None:
+        return
+    memory, folded, task = memory_fold
+    await sync_to_async(store_memory)(conv, memory, folded, await task)
+
+
+async def _astream_answer(qa, deltas, cache_key, summary_task=None, memory_fold=None):
+    """_stream_answer의 비동기 버전 (deltas는 async iterator)"""
+    chunks = []
+    completed = False
+    try:
+        async for delta in deltas:
+            chunks.append(delta)
+            yield _sse_event('delta', {'text': delta})
+        completed = True
+    finally:
+        qa.answer_text = ''.join(chunks).strip()
+        qa.status = answer_status(qa.answer_text)
+        await qa.asave(update_fields=['answer_text', 'status'])
+        if completed:
+            remember_answer(cache_key, qa.answer_text)
+        await _asave_summary(qa.conversation, summary_task)
+        await _asave_memory(qa.conversation, memory_fold)
+
+    yield _sse_event('done', QAPairSerializer(qa).data)
+
+
+async def _aiter_once(text):
+    yield text
+
+
+@method_decorator(csrf_exempt, name='dispatch')
+class AsyncQAPairCreateView(View):
+    """
+    질문 등록 및 자동 응답 생성 (ASGI 비동기 버전)
+
+    QAPairListCreateView.post와 같은 요청/응답 형식을 사용하지만, AsyncOpenAI 클라이언트와
+    async ORM으로 동작하므로 LLM 응답을 기다리는 동안 워커를 점유하지 않습니다.
+    ASGI 서버(config.asgi)로 실행할 때 효과가 있습니다.
+    """
+
+    async def _authenticate(self, request):
+        try:
+            result = await sync_to_async(JWTAuthentication().authenticate)(request)
+        except (InvalidToken, AuthenticationFailed):
+            return None
+        return result[0] if result else None
+
+    async def post(self, request, conversation_id):
+        user = await self._authenticate(request)
+        if user is None:
+            return JsonResponse(
+                {'detail': '자격 인증데이터(authentication credentials)가 제공되지 않았습니다.'},
+                status=status.HTTP_401_UNAUTHORIZED,
+            )
+
+        try:
+            conv = await Conversation.objects.select_related('series').aget(id=conversation_id)
+        except Conversation.DoesNotExist:
+            return JsonResponse({'detail': '찾을 수 없습니다.'}, status=status.HTTP_404_NOT_FOUND)
+
         try:
-            body = json.loads(request.body.decode("utf-8"))
-        except json.JSONDecodeError:
-            return JsonResponse({"error": "invalid_json"}, status=400)
+            data = json.loads(request.body.decode('utf-8') or '{}')
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return JsonResponse({'error': 'invalid_json'}, status=status.HTTP_400_BAD_REQUEST)
+
+        serializer = CreateQuestionSerializer(data=data)
+        if not serializer.is_valid():
+            return JsonResponse(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        question = serializer.validated_data['question']
+
+        if serializer.validated_data['background']:
+            qa = await QAPair.objects.acreate(conversation=conv, question_text=question, status=QAPair.STATUS_PENDING)
+            return JsonResponse({
+                'job_id': qa.id,
+                'status': qa.status,
+                'status_url': request.build_absolute_uri(reverse('qapair-status', kwargs={'qapair_id': qa.id})),
+                'qapair': QAPairSerializer(qa).data,
+            }, encoder=JSONEncoder, json_dumps_params={'ensure_ascii': False}, status=status.HTTP_202_ACCEPTED)
+
+        memory = await sync_to_async(load_memory)(conv)
+        memory_fold = _afold_memory(memory)
+
+        bound = await sync_to_async(get_spoiler_bound)(user, conv.series_id) if conv.series_id else None
+        cache_key = answer_key(question, conv.series_id, bound, memory.fingerprint())
 
+        # 첫 번째 질문인 경우에만 GPT로 요약하여 summary 설정 (답변 생성과 동시에 실행)
+        summary_task = None
+        if not await conv.qapairs.aexists():
+            summary_task = asyncio.ensure_future(asummarize(question))
+
+        qa = await QAPair.objects.acreate(conversation=conv, question_text=question, status=QAPair.STATUS_RUNNING)
+        cached = answer_cache.get(cache_key)
+
+        if serializer.validated_data['stream']:
+            if cached is not None:
+                return _sse_response(_astream_answer(qa, _aiter_once(cached), cache_key, summary_task, memory_fold))
+            additional_context = await sync_to_async(collect_context)(conv, question, user, bound=bound)
+            deltas = async_gpt_service.stream_response(question, additional_context, memory.messages())
+            return _sse_response(_astream_answer(qa, deltas, cache_key, summary_task, memory_fold))
+
+        if cached is not None:
+            qa.answer_text = cached
+        else:
+            additional_context = await sync_to_async(collect_context)(conv, question, user, bound=bound)
+            qa.answer_text = await async_gpt_service.generate_response(question, additional_context, memory.messages())
+            remember_answer(cache_key, qa.answer_text)
+        qa.status = answer_status(qa.answer_text)
+        await qa.asave(update_fields=['answer_text', 'status'])
+        await _asave_summary(conv, summary_task)
+        await _asave_memory(conv, memory_fold)
+
+        return JsonResponse(
+            QAPairSerializer(qa).data,
+            encoder=JSONEncoder,
+            json_dumps_params={'ensure_ascii': False},
+            status=status.HTTP_201_CREATED,
+        )
+
+
+class ChannelBugReportView(APIView):
+    """
+    답변 오류 신고
+
+    신고를 outbox(BugReport)에 저장하고 바로 202를 반환합니다.
+    Channel.io 전송은 run_bug_report_worker 워커가 재시도와 함께 처리하므로
+    Channel.io 장애나 지연이 신고 API 응답에 영향을 주지 않습니다.
+    (memberId에 해당하는 Channel.io 유저가 없으면 재시도 없이 failed로 기록되며 last_error에 남음)
+    """
+
+    @swagger_auto_schema(
+        operation_summary="답변 오류 신고",
+        operation_description=(
+            "답변 오류 신고를 등록합니다. 신고는 저장 후 워커가 Channel.io로 전송합니다.\n\n"
+            "같은 `answerId`로 다시 신고하면 새로 저장하지 않고 기존 신고를 반환합니다. (`duplicate: true`)"
+        ),
+        request_body=openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            required=['memberId', 'query', 'answerText'],
+            properties={
+                'memberId': openapi.Schema(type=openapi.TYPE_STRING, description='Channel.io memberId'),
+                'query': openapi.Schema(type=openapi.TYPE_STRING, description='질문'),
+                'answerText': openapi.Schema(type=openapi.TYPE_STRING, description='신고할 답변'),
+                'answerId': openapi.Schema(type=openapi.TYPE_STRING, description='답변 ID (선택, 중복 신고 방지)'),
+                'extraInfo': openapi.Schema(type=openapi.TYPE_OBJECT, description='추가 정보 (선택)'),
+            }
+        ),
+        responses={202: '신고 접수됨', 400: '잘못된 요청'}
+    )
+    def post(self, request):
+        body = request.data
         member_id = str(body.get("memberId") or "").strip()
         query = body.get("query") or ""
         answer_text = body.get("answerText") or ""
@@ -165,29 +539,23 @@ class ChannelBugReportView(APIView):
         extra_info = body.get("extraInfo")
 
         if not member_id or not query or not answer_text:
-            return JsonResponse(
+            return Response(
                 {"error": "memberId, query, answerText 는 필수입니다."},
-                status=400,
+                status=status.HTTP_400_BAD_REQUEST,
             )
 
-        try:
-            result = report_bug_with_member_id(
-                member_id=member_id,
-                query=query,
-                answer_text=answer_text,
-                answer_id=answer_id,
-                extra_info=extra_info,
-            )
-        except ChannelIoUserNotFound:
-            # 프론트에서 아직 ChannelIO('boot') 를 안 했을 가능성
-            return JsonResponse(
-                {"error": "channel_user_not_found", "detail": "Channel member 가 없습니다."},
-                status=404,
-            )
-        except ChannelIoError as e:
-            return JsonResponse(
-                {"error": "channel_io_error", "detail": str(e)},
-                status=502,
-            )
+        fields = {
+            "member_id": member_id,
+            "query": query,
+            "answer_text": answer_text,
+            "extra_info": extra_info,
+        }
+        if answer_id not in (None, ""):
+            report, created = BugReport.objects.get_or_create(answer_id=str(answer_id), defaults=fields)
+        else:
+            report, created = BugReport.objects.create(**fields), True
 
-        return JsonResponse({"ok": True, "channel": result}, status=201)
\ No newline at end of file
+        return Response(
+            {"ok": True, "report_id": report.id, "status": report.status, "duplicate": not created},
+            status=status.HTTP_202_ACCEPTED,
+        )
@@ -5,6 +5,9 @@ It exposes the ASGI callable as a module-level variable named ``application``.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
+
+비동기 질문 API(/api/chat/<id>/qapairs/async/)는 ASGI 서버에서 실행해야 효과가 있습니다.
+    gunicorn config.asgi:application -k uvicorn.workers.UvicornWorker
 """
 
 import os
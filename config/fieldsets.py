@@ -0,0 +1,89 @@
+"""
+목록/상세 API의 sparse fieldset (?fields= / ?omit=)
+
+    /api/episode/?season=1&fields=episode_number,episode_title
+    /api/episode/?omit=content
+
+요청한 필드만 직렬화하고, 쓰지 않는 DB 컬럼은 QuerySet.only()로 읽지 않습니다.
+(id는 항상 포함)
+"""
+from typing import Optional, Set
+
+from django.db import models
+from drf_yasg import openapi
+from rest_framework.exceptions import ValidationError
+
+# swagger_auto_schema manual_parameters용
+FIELDSET_PARAMETERS = [
+    openapi.Parameter('fields', openapi.IN_QUERY, description='반환할 필드 (쉼표 구분, id는 항상 포함)', type=openapi.TYPE_STRING),
+    openapi.Parameter('omit', openapi.IN_QUERY, description='제외할 필드 (쉼표 구분)', type=openapi.TYPE_STRING),
+]
+
+
+def _parse(value: Optional[str]) -> Set[str]:
+    return {name.strip() for name in (value or "").split(",") if name.strip()}
+
+
+class SparseFieldsetSerializerMixin:
+    """serializer context['fields']에 없는 필드를 제외하는 ModelSerializer 믹스인"""
+
+    def get_fields(self):
+        fields = super().get_fields()
+        selected = self.context.get("fields")
+        if selected is not None:
+            for name in list(fields):
+                if name not in selected:
+                    fields.pop(name)
+        return fields
+
+
+class SparseFieldsetMixin:
+    """
+    ?fields= / ?omit= 쿼리 파라미터를 처리하는 ViewSet 믹스인
+
+    serializer_class는 SparseFieldsetSerializerMixin을 사용해야 합니다.
+    """
+    always_fields = ("id",)
+
+    def get_sparse_fields(self) -> Optional[Set[str]]:
+        """선택된 serializer 필드 이름 집합 (파라미터가 없으면 None = 전체)"""
+        if hasattr(self, "_sparse_fields"):
+            return self._sparse_fields
+        if getattr(self, "swagger_fake_view", False):
+            return None  # swagger 스키마 생성 중
+
+        params = self.request.query_params
+        include, omit = _parse(params.get("fields")), _parse(params.get("omit"))
+        available = set(self.get_serializer_class().Meta.fields)
+        unknown = (include | omit) - available
+        if unknown:
+            raise ValidationError({"fields": f"알 수 없는 필드: {', '.join(sorted(unknown))}"})
+
+        selected = None
+        if include or omit:
+            selected = (include or available) - omit | set(self.always_fields)
+        self._sparse_fields = selected
+        return selected
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["fields"] = self.get_sparse_fields()
+        return context
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        selected = self.get_sparse_fields()
+        if selected is None:
+            return queryset
+
+        # 선택된 필드 중 이 모델의 컬럼만 읽음 (M2M 등은 제외)
+        columns = [
+            field.name for field in queryset.model._meta.concrete_fields
+            if field.name in selected and not isinstance(field, models.ManyToManyField)
+        ]
+        ordering = getattr(self.pagination_class, "ordering", ()) if self.pagination_class else ()
+        for name in ordering:
+            # cursor 위치 계산에 쓰는 정렬 컬럼도 함께 읽음
+            column = name.lstrip("-")
+            columns.append(column[:-3] if column.endswith("_id") else column)
+        return queryset.only(*columns)
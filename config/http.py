@@ -0,0 +1,149 @@
+"""
+외부 API 호출용 공통 HTTP 클라이언트
+
+requests.get/post를 직접 호출하면 요청마다 새 TCP+TLS 연결을 맺고, timeout을 빠뜨리기 쉽습니다.
+외부 연동(Channel.io, 카카오 등)은 이 모듈의 http_client를 사용합니다.
+
+- 호스트별 requests.Session을 재사용해 keep-alive 커넥션 풀을 공유합니다.
+- 기본 timeout(연결, 읽기)을 항상 적용합니다.
+- 연결 실패와 멱등 메서드(GET 등)의 429/5xx 응답은 urllib3 Retry로 백오프 재시도합니다.
+  (POST는 요청이 서버에 도달하지 않은 연결 실패만 재시도)
+- 호스트별 요청 수, 오류 수, 지연 시간을 집계합니다. (http_client.stats())
+"""
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HostStats:
+    """호스트별 호출 지표"""
+    requests: int = 0
+    errors: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    last_error: str = ""
+
+    def snapshot(self) -> dict:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "avg_ms": round(self.total_ms / self.requests, 1) if self.requests else 0.0,
+            "max_ms": round(self.max_ms, 1),
+            "last_error": self.last_error,
+        }
+
+
+class OutboundHTTPClient:
+    """
+    호스트별 커넥션 풀을 공유하는 HTTP 클라이언트
+
+    Args:
+        timeout: 기본 (연결, 읽기) timeout(초)
+        retries: 연결 실패/재시도 대상 응답의 최대 재시도 횟수
+        backoff_factor: 재시도 간격 (backoff_factor * 2^(n-1)초, Retry-After 헤더 우선)
+        pool_maxsize: 호스트별로 유지할 최대 연결 수
+    """
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(self, timeout=(3.05, 10), retries: int = 2, backoff_factor: float = 0.3, pool_maxsize: int = 20):
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.pool_maxsize = pool_maxsize
+        self._sessions: Dict[str, requests.Session] = {}
+        self._stats: Dict[str, HostStats] = {}
+        self._lock = threading.Lock()
+
+    def _retry(self) -> Retry:
+        return Retry(
+            total=self.retries,
+            connect=self.retries,
+            read=self.retries,
+            status=self.retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=self.RETRY_STATUSES,
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,  # POST 등 비멱등 메서드는 응답/읽기 오류 시 재시도 안 함
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+
+    def session_for(self, host: str) -> requests.Session:
+        """호스트 전용 Session (처음 호출 시 생성)"""
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize, max_retries=self._retry())
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._sessions[host] = session
+                self._stats.setdefault(host, HostStats())
+            return session
+
+    def request(self, method: str, url: str, timeout=None, **kwargs) -> requests.Response:
+        """
+        requests.request와 같은 인자로 호출합니다. (timeout 생략 시 기본값 적용)
+        네트워크 오류는 requests.RequestException으로 그대로 전달합니다.
+        """
+        host = urlsplit(url).netloc
+        session = self.session_for(host)
+        started = time.perf_counter()
+        error = ""
+        try:
+            response = session.request(method, url, timeout=timeout or self.timeout, **kwargs)
+            if response.status_code >= 500:
+                error = f"HTTP {response.status_code}"
+            return response
+        except requests.RequestException as e:
+            error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            with self._lock:
+                stats = self._stats[host]
+                stats.requests += 1
+                stats.total_ms += elapsed_ms
+                stats.max_ms = max(stats.max_ms, elapsed_ms)
+                if error:
+                    stats.errors += 1
+                    stats.last_error = error
+            if error:
+                logger.warning("Outbound %s %s failed after %.0fms: %s", method, host, elapsed_ms, error)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def stats(self, host: Optional[str] = None) -> dict:
+        """호스트별 지표 (host를 주면 해당 호스트만)"""
+        with self._lock:
+            if host is not None:
+                return self._stats[host].snapshot() if host in self._stats else HostStats().snapshot()
+            return {name: stats.snapshot() for name, stats in self._stats.items()}
+
+    def close(self) -> None:
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
+http_client = OutboundHTTPClient(
+    timeout=(getattr(settings, "OUTBOUND_HTTP_CONNECT_TIMEOUT", 3.05), getattr(settings, "OUTBOUND_HTTP_READ_TIMEOUT", 10)),
+    retries=getattr(settings, "OUTBOUND_HTTP_RETRIES", 2),
+    backoff_factor=getattr(settings, "OUTBOUND_HTTP_BACKOFF", 0.3),
+    pool_maxsize=getattr(settings, "OUTBOUND_HTTP_POOL_SIZE", 20),
+)
@@ -0,0 +1,111 @@
+"""
+API 공통 페이지네이션
+
+OFFSET 방식은 뒤 페이지로 갈수록 건너뛸 행이 늘어나므로, 목록 API는 정렬 키를 기준으로
+다음 페이지를 바로 찾는 cursor 방식을 사용합니다. (응답: {"next", "previous", "results"})
+"""
+import json
+
+from django.conf import settings
+from django.db.models import Q
+from drf_yasg import openapi
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination, _reverse_ordering
+
+# swagger_auto_schema manual_parameters용
+CURSOR_PARAMETERS = [
+    openapi.Parameter('cursor', openapi.IN_QUERY, description='페이지 cursor (next/previous 링크에 포함)', type=openapi.TYPE_STRING),
+    openapi.Parameter('page_size', openapi.IN_QUERY, description='페이지 크기 (최대 API_MAX_PAGE_SIZE)', type=openapi.TYPE_INTEGER),
+]
+
+
+class DefaultCursorPagination(CursorPagination):
+    """
+    ?cursor=<next/previous 링크의 값>&page_size=<개수>
+
+    cursor에는 정렬 키 첫 필드의 값을 기억하고, 같은 값이 여러 행이면 offset으로 구분합니다.
+    (첫 필드는 값이 잘 바뀌지 않고 중복이 적을수록 좋음)
+    """
+    ordering = ('-id',)
+    page_size = getattr(settings, 'API_PAGE_SIZE', 20)
+    page_size_query_param = 'page_size'
+    max_page_size = getattr(settings, 'API_MAX_PAGE_SIZE', 100)
+
+
+class CreatedAtCursorPagination(DefaultCursorPagination):
+    """생성일 역순 (created_at, id)"""
+    ordering = ('-created_at', '-id')
+
+
+class KeysetCursorPagination(DefaultCursorPagination):
+    """
+    정렬 키 전체를 cursor에 기억하는 cursor 페이지네이션
+
+    (시즌 ID, 에피소드 번호)처럼 첫 필드만으로는 중복이 많은 정렬에서 offset 없이
+    (a, b) > (x, y) 조건으로 다음 페이지를 찾습니다. ordering은 전체로 유일해야 합니다.
+    """
+
+    def _get_position_from_instance(self, instance, ordering):
+        values = []
+        for name in ordering:
+            attr = name.lstrip('-')
+            values.append(instance[attr] if isinstance(instance, dict) else getattr(instance, attr))
+        return json.dumps(values, separators=(',', ':'), default=str)
+
+    def _after(self, position, reverse):
+        """정렬 순서(reverse면 역순)에서 position보다 뒤에 오는 행의 조건"""
+        condition, equal = Q(pk__in=[]), Q()
+        for name, value in zip(self.ordering, position):
+            attr = name.lstrip('-')
+            lookup = 'lt' if name.startswith('-') != reverse else 'gt'
+            condition |= equal & Q(**{f'{attr}__{lookup}': value})
+            equal &= Q(**{attr: value})
+        return condition
+
+    def paginate_queryset(self, queryset, request, view=None):
+        # CursorPagination.paginate_queryset과 같고, 위치 조건만 정렬 키 전체로 비교
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+
+        self.cursor = self.decode_cursor(request)
+        if self.cursor is None:
+            offset, reverse, current_position = 0, False, None
+        else:
+            offset, reverse, current_position = self.cursor
+
+        queryset = queryset.order_by(*(_reverse_ordering(self.ordering) if reverse else self.ordering))
+        if current_position is not None:
+            try:
+                position = json.loads(current_position)
+            except ValueError:
+                raise NotFound(self.invalid_cursor_message)
+            if not isinstance(position, list) or len(position) != len(self.ordering):
+                raise NotFound(self.invalid_cursor_message)
+            queryset = queryset.filter(self._after(position, reverse))
+
+        results = list(queryset[offset:offset + self.page_size + 1])
+        self.page = results[:self.page_size]
+        following_position = (
+            self._get_position_from_instance(results[-1], self.ordering) if len(results) > len(self.page) else None
+        )
+
+        if reverse:
+            self.page.reverse()
+            self.has_next = current_position is not None or offset > 0
+            self.has_previous = following_position is not None
+            self.next_position = current_position
+            self.previous_position = following_position
+        else:
+            self.has_next = following_position is not None
+            self.has_previous = current_position is not None or offset > 0
+            self.next_position = following_position
+            self.previous_position = current_position
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+        return self.page
@@ -169,10 +169,55 @@ REST_FRAMEWORK = {
     ),
 }
 
+# 목록 API cursor 페이지네이션 (config.pagination)
+API_PAGE_SIZE = env.int('API_PAGE_SIZE', default=20)
+API_MAX_PAGE_SIZE = env.int('API_MAX_PAGE_SIZE', default=100)
+
+# 외부 API 호출 공통 HTTP 클라이언트 (config.http)
+OUTBOUND_HTTP_CONNECT_TIMEOUT = env.float('OUTBOUND_HTTP_CONNECT_TIMEOUT', default=3.05)  # 초
+OUTBOUND_HTTP_READ_TIMEOUT = env.float('OUTBOUND_HTTP_READ_TIMEOUT', default=10)  # 초
+OUTBOUND_HTTP_RETRIES = env.int('OUTBOUND_HTTP_RETRIES', default=2)
+OUTBOUND_HTTP_BACKOFF = env.float('OUTBOUND_HTTP_BACKOFF', default=0.3)
+OUTBOUND_HTTP_POOL_SIZE = env.int('OUTBOUND_HTTP_POOL_SIZE', default=20)  # 호스트별 최대 연결 수
+
 # Kakao OAuth 설정
 KAKAO_REDIRECT_URI = env('KAKAO_REDIRECT_URI', default='http://localhost:8000/api/user/kakao/callback/')
 KAKAO_CLIENT_SECRET = env('KAKAO_CLIENT_SECRET', default='your-kakao-client-secret')
 
 CHANNEL_OPEN_API_KEY = env('CHANNEL_ACCESS_KEY')
 CHANNEL_OPEN_API_SECRET = env('CHANNEL_ACCESS_SECRET')
-CHANNEL_OPEN_BASE_URL = "https://api.channel.io/open/v5" 
\ No newline at end of file
+CHANNEL_OPEN_BASE_URL = "https://api.channel.io/open/v5" 
+CHANNEL_IO_ID_CACHE_TTL = env.int('CHANNEL_IO_ID_CACHE_TTL', default=86400)  # memberId/userId 매핑 캐시 (초)
+CHANNEL_IO_ID_CACHE_SIZE = env.int('CHANNEL_IO_ID_CACHE_SIZE', default=10000)
+
+# Django 캐시 (예: CACHE_URL=filecache:///var/tmp/spoil_cache, redis://127.0.0.1:6379/1)
+CACHES = {'default': env.cache('CACHE_URL', default='locmemcache://')}
+
+# 카탈로그(시리즈/시즌/에피소드/장르) 조회 응답 캐시 (series.catalog)
+CATALOG_CACHE_ALIAS = env('CATALOG_CACHE_ALIAS', default='default')
+CATALOG_CACHE_TIMEOUT = env.int('CATALOG_CACHE_TIMEOUT', default=3600)  # 초, 버전이 바뀌면 만료 전이라도 다른 키를 사용
+
+# LLM 백엔드 (부하 테스트 시 chat.llm.FakeBackend 사용)
+CHAT_LLM_BACKEND = env('CHAT_LLM_BACKEND', default='chat.llm.OpenAIBackend')
+CHAT_LLM_MODEL = env('CHAT_LLM_MODEL', default='gpt-4.1')
+CHAT_LLM_OPTIONS = env.json('CHAT_LLM_OPTIONS', default={})  # 백엔드 생성자 인자 (예: {"timeout": 30, "max_retries": 2, "breaker_threshold": 5})
+
+# 에피소드 검색(스포일러 방지 컨텍스트) 설정
+CHAT_RETRIEVAL_BACKEND = env('CHAT_RETRIEVAL_BACKEND', default='bm25')  # 'bm25' 또는 'vector'
+EPISODE_EMBEDDER = env('EPISODE_EMBEDDER', default='episode.vector_index.HashingEmbedder')
+EPISODE_VECTOR_INDEX_DIR = os.path.join(BASE_DIR, 'vector_index')
+CHAT_CONTEXT_TOKEN_BUDGET = env.int('CHAT_CONTEXT_TOKEN_BUDGET', default=1500)  # GPT 컨텍스트 토큰 예산(추정치)
+
+# 대화 메모리 (최근 N개 질문-답변 + 오래된 질문-답변의 누적 요약)
+CHAT_MEMORY_TURNS = env.int('CHAT_MEMORY_TURNS', default=4)
+CHAT_MEMORY_TURN_TOKENS = env.int('CHAT_MEMORY_TURN_TOKENS', default=300)  # 질문/답변 하나당 최대 토큰(추정치)
+CHAT_MEMORY_SUMMARY_TOKENS = env.int('CHAT_MEMORY_SUMMARY_TOKENS', default=400)  # 누적 요약 최대 토큰(추정치)
+
+# QAPair 목록 long-poll (?wait=초)
+# 동기(WSGI) 뷰에서 기다리는 동안 워커 스레드를 점유하므로 몇 초로 제한하고, 클라이언트는 응답을 받으면 다시 요청
+CHAT_LONG_POLL_MAX_WAIT = env.float('CHAT_LONG_POLL_MAX_WAIT', default=5)  # 초
+CHAT_LONG_POLL_INTERVAL = env.float('CHAT_LONG_POLL_INTERVAL', default=0.5)  # 초
+
+# GPT 답변 캐시 (프로세스 메모리, TTL + LRU)
+CHAT_ANSWER_CACHE_SIZE = env.int('CHAT_ANSWER_CACHE_SIZE', default=1024)
+CHAT_ANSWER_CACHE_TTL = env.int('CHAT_ANSWER_CACHE_TTL', default=3600)  # 초
@@ -0,0 +1,55 @@
+"""
+내용 해시 기반 파일 저장소 (Series.photo, User.profile_image)
+
+파일 이름을 업로드한 이름 대신 내용의 sha256으로 정합니다. (예: series_photos/<sha256>.webp)
+같은 내용은 이미 저장된 파일을 그대로 사용하므로, 같은 이미지를 다시 import하거나
+같은 카카오 프로필 이미지를 다시 받아도 naruto_FYlnMBR.webp 같은 사본이 쌓이지 않습니다.
+"""
+import hashlib
+import posixpath
+
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
+
+
+def content_addressed_name(name, content):
+    """name과 같은 디렉터리, 같은 확장자에 내용 해시를 파일 이름으로 쓴 경로"""
+    digest = hashlib.sha256()
+    if hasattr(content, "seek"):
+        content.seek(0)
+    for chunk in content.chunks():
+        digest.update(chunk)
+    if hasattr(content, "seek"):
+        content.seek(0)
+    ext = posixpath.splitext(name)[1].lower()
+    return posixpath.join(posixpath.dirname(name), digest.hexdigest() + ext)
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """내용이 같은 파일은 한 번만 쓰는 FileSystemStorage"""
+
+    def __init__(self, **kwargs):
+        # 여러 프로세스가 같은 파일을 동시에 쓰더라도 내용이 같으므로 덮어써도 됨
+        kwargs.setdefault("allow_overwrite", True)
+        super().__init__(**kwargs)
+
+    def save(self, name, content, max_length=None):
+        if name is None:
+            name = content.name
+        if not hasattr(content, "chunks"):
+            content = File(content, name)
+        name = content_addressed_name(name, content)
+        if self.exists(name):
+            return name
+        return super().save(name, content, max_length=max_length)
+
+
+_storage = None
+
+
+def content_addressed_storage():
+    """FileField(storage=...)에 넘기는 callable (migration에는 함수 경로로 기록됨)"""
+    global _storage
+    if _storage is None:
+        _storage = ContentAddressedStorage()
+    return _storage
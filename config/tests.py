@@ -0,0 +1,126 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from .cache import TTLCache
+from .http import OutboundHTTPClient
+from .storage import ContentAddressedStorage
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def _reply(self):
+        server = self.server
+        server.requests.append((self.command, self.client_address[1]))
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        code = server.statuses.pop(0) if server.statuses else 200
+        body = b"ok"
+        self.send_response(code)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = _reply
+    do_POST = _reply
+
+    def log_message(self, *args):
+        pass
+
+
+class OutboundHTTPClientTest(SimpleTestCase):
+    """공통 HTTP 클라이언트 (커넥션 재사용, 재시도, 지표) 테스트"""
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.server.requests = []
+        self.server.statuses = []
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.host = f"127.0.0.1:{self.server.server_address[1]}"
+        self.url = f"http://{self.host}/"
+        self.client = OutboundHTTPClient(timeout=(1, 2), retries=2, backoff_factor=0)
+        self.addCleanup(self.client.close)
+
+    def test_reuses_connection(self):
+        for _ in range(3):
+            self.assertEqual(self.client.get(self.url).status_code, 200)
+        self.client.post(self.url, data={"a": "b"})
+        # 같은 호스트로의 요청은 하나의 keep-alive 연결(같은 클라이언트 포트)을 사용
+        self.assertEqual(len({port for _, port in self.server.requests}), 1)
+        self.assertIs(self.client.session_for(self.host), self.client.session_for(self.host))
+
+        stats = self.client.stats(self.host)
+        self.assertEqual((stats["requests"], stats["errors"]), (4, 0))
+
+    def test_retries_idempotent_requests_only(self):
+        self.server.statuses = [503, 200]
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+        self.assertEqual(len(self.server.requests), 2)
+
+        # POST는 서버가 받은 요청을 다시 보내지 않음
+        self.server.statuses = [503, 200]
+        self.assertEqual(self.client.post(self.url).status_code, 503)
+        self.assertEqual(len(self.server.requests), 3)
+
+        stats = self.client.stats(self.host)
+        self.assertEqual((stats["requests"], stats["errors"], stats["last_error"]), (2, 1, "HTTP 503"))
+
+
+class ContentAddressedStorageTest(SimpleTestCase):
+    """내용 해시 기반 저장소 테스트"""
+
+    def setUp(self):
+        import tempfile
+
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.root = tmpdir.name
+        self.storage = ContentAddressedStorage(location=self.root)
+
+    def test_same_content_is_stored_once(self):
+        import hashlib
+        import os
+        from django.core.files.base import ContentFile
+
+        first = self.storage.save('photos/naruto.WEBP', ContentFile(b'image'))
+        second = self.storage.save('photos/naruto.webp', ContentFile(b'image'))
+        other = self.storage.save('photos/naruto.webp', ContentFile(b'other'))
+
+        self.assertEqual(first, f"photos/{hashlib.sha256(b'image').hexdigest()}.webp")
+        self.assertEqual(second, first)
+        self.assertNotEqual(other, first)
+        self.assertEqual(len(os.listdir(os.path.join(self.root, 'photos'))), 2)
+
+
+class TTLCacheTest(SimpleTestCase):
+    """TTL + LRU 캐시 단위 테스트"""
+
+    def test_lru_eviction_and_counters(self):
+        cache = TTLCache(max_entries=2, ttl=60)
+        cache.set('a', '1')
+        cache.set('b', '2')
+        self.assertEqual(cache.get('a'), '1')  # a가 최근 사용됨
+        cache.set('c', '3')                     # 가장 오래된 b가 제거됨
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('c'), '3')
+        self.assertEqual(cache.stats()['hits'], 2)
+        self.assertEqual(cache.stats()['misses'], 1)
+        self.assertEqual(cache.stats()['evictions'], 1)
+
+    @patch('config.cache.time.monotonic')
+    def test_ttl_expiry(self, mock_time):
+        cache = TTLCache(max_entries=10, ttl=5)
+        mock_time.return_value = 100
+        cache.set('a', '1')
+        mock_time.return_value = 104
+        self.assertEqual(cache.get('a'), '1')
+        mock_time.return_value = 106
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.stats()['size'], 0)
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.module_loading import import_string
+from series.models import Series
+from episode.vector_index import build_series_vectors, get_embedder, index_dir
+import time
+
+
+class Command(BaseCommand):
+    help = "시리즈별 에피소드 청크 임베딩을 계산해 NumPy(.npy) 색인 파일로 저장"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--series", type=int, action="append", help="색인할 시리즈 ID (여러 번 지정 가능, 생략 시 전체)")
+        parser.add_argument("--embedder", help="임베더 dotted path (기본: settings.EPISODE_EMBEDDER)")
+        parser.add_argument("--batch-size", type=int, default=256, help="임베딩 배치 크기")
+
+    def handle(self, *args, **options):
+        embedder = import_string(options["embedder"])() if options.get("embedder") else get_embedder()
+
+        series_qs = Series.objects.order_by("id")
+        if options.get("series"):
+            series_qs = series_qs.filter(id__in=options["series"])
+            missing = set(options["series"]) - set(series_qs.values_list("id", flat=True))
+            if missing:
+                raise CommandError(f"시리즈를 찾을 수 없습니다: {sorted(missing)}")
+
+        self.stdout.write(f"임베더: {embedder.name}, 저장 위치: {index_dir()}")
+        for series in series_qs:
+            started = time.perf_counter()
+            count = build_series_vectors(series.id, embedder=embedder, batch_size=options["batch_size"])
+            elapsed = time.perf_counter() - started
+            self.stdout.write(f"- {series.title}(id={series.id}): 청크 {count}개, {elapsed:.2f}초")
+
+        self.stdout.write(self.style.SUCCESS("완료"))
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.8 on 2026-10-17 22:32
+
+import hashlib
+
+from django.db import migrations, models
+
+
+def backfill_content_hash(apps, schema_editor):
+    # 기존 에피소드도 처음 재import할 때 모두 바뀐 것으로 처리되지 않도록 해시를 채움
+    Episode = apps.get_model('episode', 'Episode')
+    batch = []
+    for episode in Episode.objects.only('id', 'episode_title', 'content').iterator(chunk_size=500):
+        text = f"{episode.episode_title or ''}\0{episode.content or ''}"
+        episode.content_hash = hashlib.sha256(text.encode()).hexdigest()
+        batch.append(episode)
+        if len(batch) >= 500:
+            Episode.objects.bulk_update(batch, ['content_hash'])
+            batch = []
+    if batch:
+        Episode.objects.bulk_update(batch, ['content_hash'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('episode', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='episode',
+            name='content_hash',
+            field=models.CharField(blank=True, default='', editable=False, max_length=64),
+        ),
+        migrations.RunPython(backfill_content_hash, migrations.RunPython.noop),
+    ]
@@ -1,16 +1,33 @@
+import hashlib
+
 from django.db import models
 from season.models import Season
 
+
+def episode_content_hash(episode_title, content):
+    """에피소드 제목/본문 해시 (import 시 바뀐 에피소드만 골라내는 데 사용)"""
+    return hashlib.sha256(f"{episode_title or ''}\0{content or ''}".encode()).hexdigest()
+
+
 # Create your models here.
 class Episode(models.Model):
     season = models.ForeignKey( Season, on_delete=models.CASCADE, related_name="episodes",)
     episode_number = models.PositiveIntegerField()
     episode_title = models.CharField(max_length=255)
     content = models.TextField(blank=True, null=True)
+    content_hash = models.CharField(max_length=64, blank=True, default="", editable=False)
 
     class Meta:
         unique_together = ("season", "episode_number")
         ordering = ["season", "episode_number"]
 
     def __str__(self):
-        return f"{self.season.series.title} S{self.season.season_number}E{self.episode_number}"
\ No newline at end of file
+        return f"{self.season.series.title} S{self.season.season_number}E{self.episode_number}"
+
+    def save(self, *args, **kwargs):
+        # bulk_create/bulk_update는 save()를 거치지 않으므로 호출하는 쪽에서 content_hash를 직접 채워야 함
+        self.content_hash = episode_content_hash(self.episode_title, self.content)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and {"episode_title", "content"} & set(update_fields):
+            kwargs["update_fields"] = {*update_fields, "content_hash"}
+        super().save(*args, **kwargs)
@@ -0,0 +1,212 @@
+"""
+에피소드 내용(Episode.content) 기반 스포일러 방지 검색
+
+- 에피소드 내용을 문장 단위로 묶어 청크(passage)로 나눕니다.
+- 시리즈별로 한국어 문자 n-gram 역색인(inverted index)을 만들고 BM25로 점수를 매깁니다.
+- 검색 시 사용자가 본 에피소드(시리즈 내 순번) 이하의 청크만 후보로 사용합니다.
+
+색인은 프로세스 메모리에 시리즈별로 캐시되므로 요청마다 content 행을 읽지 않습니다.
+캐시에는 빌드 시점의 시리즈 카탈로그 버전(series.catalog)을 함께 저장하고, 조회할 때 현재 버전과
+다르면 다시 만듭니다. 따라서 다른 프로세스(import 명령 등)의 변경도 버전이 오르는 즉시 반영됩니다.
+"""
+from __future__ import annotations
+
+import bisect
+import math
+import re
+import threading
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+
+from .models import Episode
+
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+SENTENCE_RE = re.compile(r"(?<=[.!?。])\s+|\n+")
+
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+
+def _setting(name: str, default):
+    return getattr(settings, name, default)
+
+
+@dataclass(frozen=True)
+class Passage:
+    """검색 단위가 되는 에피소드 내용 청크"""
+    episode_id: int
+    ordinal: int  # 시리즈 내 에피소드 순번 (시즌, 에피소드 번호 순, 1부터)
+    season_number: int
+    episode_number: int
+    episode_title: str
+    text: str
+
+    @property
+    def label(self) -> str:
+        return f"S{self.season_number}E{self.episode_number} {self.episode_title}".strip()
+
+
+def chunk_text(text: str, max_chars: int = None) -> List[str]:
+    """
+    텍스트를 문장 경계 기준으로 max_chars 이하의 청크로 나눕니다.
+    한 문장이 max_chars보다 길면 글자 수 기준으로 자릅니다.
+    """
+    max_chars = max_chars or _setting("RETRIEVAL_CHUNK_CHARS", 400)
+    chunks: List[str] = []
+    current = ""
+    for sentence in SENTENCE_RE.split(text or ""):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        while len(sentence) > max_chars:
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(sentence[:max_chars])
+            sentence = sentence[max_chars:]
+        if current and len(current) + 1 + len(sentence) > max_chars:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def char_ngrams(text: str, sizes: Tuple[int, ...] = (1, 2)) -> List[str]:
+    """
+    단어별 문자 n-gram(기본: unigram + bigram)을 만듭니다.
+    한국어는 조사/어미가 붙어 단어 단위 매칭이 잘 안 되므로 문자 n-gram을 사용합니다.
+    ("검은" / "검을" 처럼 한 글자 명사도 unigram으로 매칭됨)
+    """
+    grams: List[str] = []
+    for token in TOKEN_RE.findall((text or "").lower()):
+        for n in sizes:
+            grams.extend(token[i:i + n] for i in range(len(token) - n + 1))
+    return grams
+
+
+def iter_series_passages(series_id: int) -> Iterable[Passage]:
+    """시리즈의 에피소드를 순서대로 읽어 Passage로 나눕니다."""
+    episodes = (
+        Episode.objects
+        .filter(season__series_id=series_id)
+        .select_related("season")
+        .order_by("season__season_number", "episode_number")
+        .only("id", "episode_number", "episode_title", "content", "season__season_number")
+    )
+    for ordinal, ep in enumerate(episodes.iterator(), start=1):
+        for chunk in chunk_text(ep.content or ""):
+            yield Passage(
+                episode_id=ep.id,
+                ordinal=ordinal,
+                season_number=ep.season.season_number,
+                episode_number=ep.episode_number,
+                episode_title=ep.episode_title,
+                text=chunk,
+            )
+
+
+class SeriesIndex:
+    """시리즈 하나에 대한 BM25 역색인"""
+
+    def __init__(self, passages: Iterable[Passage]):
+        self.passages: List[Passage] = list(passages)
+        # passage는 에피소드 순번 순으로 정렬되어 있으므로 스포일러 경계는 prefix로 표현됨
+        self._ordinals = [p.ordinal for p in self.passages]
+        self.postings: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        self.doc_lengths: List[int] = []
+
+        for pid, passage in enumerate(self.passages):
+            grams = char_ngrams(passage.text)
+            self.doc_lengths.append(len(grams))
+            for term, tf in Counter(grams).items():
+                self.postings[term].append((pid, tf))
+
+        total = len(self.passages)
+        self.avgdl = (sum(self.doc_lengths) / total) if total else 0.0
+        self.idf = {
+            term: math.log(1 + (total - len(plist) + 0.5) / (len(plist) + 0.5))
+            for term, plist in self.postings.items()
+        }
+
+    def __len__(self):
+        return len(self.passages)
+
+    def cutoff(self, max_ordinal: Optional[int]) -> int:
+        """max_ordinal 이하 에피소드에 속한 passage 개수 (None이면 전체)"""
+        if max_ordinal is None:
+            return len(self.passages)
+        return bisect.bisect_right(self._ordinals, max_ordinal)
+
+    def search(self, query: str, k: int = 5, max_ordinal: Optional[int] = None) -> List[Tuple[Passage, float]]:
+        """
+        query와 관련된 상위 k개 passage를 (passage, score) 목록으로 반환합니다.
+        max_ordinal이 주어지면 해당 순번 이하 에피소드의 passage만 검색합니다.
+        """
+        limit = self.cutoff(max_ordinal)
+        if not limit or not self.avgdl:
+            return []
+
+        scores: Dict[int, float] = defaultdict(float)
+        for term in set(char_ngrams(query)):
+            plist = self.postings.get(term)
+            if not plist:
+                continue
+            idf = self.idf[term]
+            for pid, tf in plist:
+                if pid >= limit:
+                    break  # postings는 pid 오름차순
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self.doc_lengths[pid] / self.avgdl)
+                scores[pid] += idf * tf * (BM25_K1 + 1) / (tf + norm)
+
+        top = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:k]
+        return [(self.passages[pid], score) for pid, score in top]
+
+
+_cache: Dict[int, Tuple[str, SeriesIndex]] = {}
+_lock = threading.Lock()
+_build_locks: Dict[int, threading.Lock] = {}
+
+
+def get_series_index(series_id: int) -> SeriesIndex:
+    """시리즈 색인을 반환합니다. 캐시에 없거나 카탈로그 버전이 바뀌었으면 새로 만듭니다."""
+    from series.catalog import get_catalog_token
+
+    token = get_catalog_token(series_id)
+    with _lock:
+        cached = _cache.get(series_id)
+        build_lock = _build_locks.setdefault(series_id, threading.Lock())
+    if cached and cached[0] == token:
+        return cached[1]
+
+    # 동시에 캐시가 비어도 한 스레드만 만들고, 나머지는 기다렸다가 그 결과를 사용
+    with build_lock:
+        with _lock:
+            cached = _cache.get(series_id)
+        if cached and cached[0] == token:
+            return cached[1]
+        # 읽기 전의 버전을 기록 (빌드 중에 바뀌면 다음 조회에서 다시 만듦)
+        index = SeriesIndex(iter_series_passages(series_id))
+        with _lock:
+            _cache[series_id] = (token, index)
+    return index
+
+
+def invalidate_series_index(series_id: Optional[int] = None) -> None:
+    """시리즈 색인 캐시를 비웁니다. (series_id가 없으면 전체)"""
+    with _lock:
+        if series_id is None:
+            _cache.clear()
+        else:
+            _cache.pop(series_id, None)
+
+
+def search_passages(series_id: int, query: str, k: int = None, max_ordinal: Optional[int] = None) -> List[Passage]:
+    """시리즈에서 스포일러 경계(max_ordinal) 이내의 관련 passage 상위 k개를 반환합니다."""
+    k = k or _setting("RETRIEVAL_TOP_K", 5)
+    return [passage for passage, _ in get_series_index(series_id).search(query, k=k, max_ordinal=max_ordinal)]
@@ -1,7 +1,8 @@
 from rest_framework import serializers
+from config.fieldsets import SparseFieldsetSerializerMixin
 from .models import Episode
 
-class EpisodeSerializer(serializers.ModelSerializer):
+class EpisodeSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Episode
         fields = ['id', 'season', 'episode_number', 'episode_title', 'content']
@@ -0,0 +1,14 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from season.models import Season
+from .models import Episode
+from .retrieval import invalidate_series_index
+
+
+@receiver([post_save, post_delete], sender=Episode)
+def invalidate_episode_index(sender, instance, **kwargs):
+    """에피소드 변경 시 해당 시리즈의 검색 색인을 무효화합니다."""
+    series_id = Season.objects.filter(pk=instance.season_id).values_list("series_id", flat=True).first()
+    # 시즌이 함께 삭제된 경우 시리즈를 알 수 없으므로 전체 무효화
+    invalidate_series_index(series_id)
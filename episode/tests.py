@@ -59,3 +59,245 @@ class EpisodeModelTest(TestCase):
             episode_title='내용 없는 에피소드'
         )
         self.assertIsNone(episode.content)
+
+
+from .retrieval import chunk_text, char_ngrams, get_series_index, search_passages
+
+
+class EpisodeRetrievalTest(TestCase):
+    def setUp(self):
+        self.series = Series.objects.create(title='나루토')
+        season1 = Season.objects.create(series=self.series, season_number=1)
+        season2 = Season.objects.create(series=self.series, season_number=2)
+        Episode.objects.create(season=season1, episode_number=1, episode_title='등장',
+                               content='나루토는 닌자 아카데미에서 변신술 시험에 낙제한다.')
+        Episode.objects.create(season=season1, episode_number=2, episode_title='이루카',
+                               content='이루카 선생님이 나루토에게 라멘을 사준다.')
+        Episode.objects.create(season=season2, episode_number=1, episode_title='결전',
+                               content='나루토가 라멘 가게에서 사스케와 결전을 약속한다.')
+
+    def test_chunk_text(self):
+        """문장 경계 기준 청크 분할 테스트"""
+        chunks = chunk_text('첫 문장입니다. 두 번째 문장입니다. 세 번째 문장입니다.', max_chars=20)
+        self.assertEqual(chunks, ['첫 문장입니다. 두 번째 문장입니다.', '세 번째 문장입니다.'])
+        self.assertTrue(all(len(c) <= 5 for c in chunk_text('가' * 12, max_chars=5)))
+
+    def test_char_ngrams(self):
+        """문자 n-gram 생성 테스트"""
+        self.assertEqual(char_ngrams('라멘을', sizes=(2,)), ['라멘', '멘을'])
+        self.assertEqual(char_ngrams('Ab 검'), ['a', 'b', 'ab', '검'])
+
+    def test_search_respects_spoiler_bound(self):
+        """시청한 에피소드(시리즈 내 순번) 이하만 검색되는지 테스트"""
+        results = search_passages(self.series.id, '라멘', max_ordinal=2)
+        self.assertEqual([p.ordinal for p in results], [2])
+
+        results = search_passages(self.series.id, '라멘', max_ordinal=None)
+        self.assertEqual(sorted(p.ordinal for p in results), [2, 3])
+        self.assertEqual(search_passages(self.series.id, '라멘', max_ordinal=0), [])
+
+    def test_index_invalidated_on_episode_save(self):
+        """에피소드 저장 시 색인이 다시 만들어지는지 테스트"""
+        index = get_series_index(self.series.id)
+        self.assertIs(get_series_index(self.series.id), index)
+
+        episode = Episode.objects.get(season__season_number=1, episode_number=1)
+        episode.content = '나루토가 그림자 분신술을 익힌다.'
+        episode.save()
+
+        self.assertIsNot(get_series_index(self.series.id), index)
+        self.assertEqual(search_passages(self.series.id, '분신술', max_ordinal=1)[0].ordinal, 1)
+
+    def test_index_rebuilt_when_catalog_version_changes(self):
+        """다른 프로세스의 변경(signal 없이 카탈로그 버전만 오름)도 색인에 반영되는지 테스트"""
+        from series.catalog import bump_catalog_version
+
+        index = get_series_index(self.series.id)
+        Episode.objects.filter(season__season_number=1, episode_number=1).update(content='나루토가 분신술을 익힌다.')
+        self.assertIs(get_series_index(self.series.id), index)
+
+        bump_catalog_version([self.series.id])
+        self.assertIsNot(get_series_index(self.series.id), index)
+        self.assertEqual(search_passages(self.series.id, '분신술', max_ordinal=1)[0].ordinal, 1)
+
+    def test_concurrent_misses_build_once(self):
+        """캐시가 빈 상태에서 동시에 조회해도 색인은 한 번만 만드는지 테스트"""
+        import threading
+        import time
+        from unittest import mock
+        from . import retrieval
+
+        retrieval.invalidate_series_index(self.series.id)
+        original = retrieval.SeriesIndex
+
+        def slow_index(passages):
+            time.sleep(0.05)
+            return original(passages)
+
+        # 스레드는 테스트 트랜잭션 밖의 DB 연결을 쓰므로 버전/passage 조회는 대체
+        with mock.patch('series.catalog.get_catalog_token', return_value='1'), \
+                mock.patch.object(retrieval, 'iter_series_passages', return_value=[]), \
+                mock.patch.object(retrieval, 'SeriesIndex', side_effect=slow_index) as build:
+            results = []
+            threads = [threading.Thread(target=lambda: results.append(get_series_index(self.series.id)))
+                       for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(build.call_count, 1)
+        self.assertTrue(all(result is results[0] for result in results))
+
+
+import tempfile
+from io import StringIO
+import numpy as np
+from django.core.management import call_command
+from django.test import override_settings
+from .vector_index import HashingEmbedder, get_vector_index, search_vectors
+
+
+class EpisodeVectorIndexTest(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        override = override_settings(EPISODE_VECTOR_INDEX_DIR=self.tmpdir.name)
+        override.enable()
+        self.addCleanup(override.disable)
+
+        self.series = Series.objects.create(title='나루토')
+        season = Season.objects.create(series=self.series, season_number=1)
+        Episode.objects.create(season=season, episode_number=1, episode_title='시험',
+                               content='나루토는 변신술 시험에 낙제한다.')
+        Episode.objects.create(season=season, episode_number=2, episode_title='라멘',
+                               content='이루카 선생님이 나루토에게 라멘을 사준다.')
+        Episode.objects.create(season=season, episode_number=3, episode_title='결전',
+                               content='나루토가 라멘 가게 앞에서 사스케와 결전을 벌인다.')
+
+    def test_hashing_embedder_is_deterministic_and_normalized(self):
+        """해싱 임베더 결정성/정규화 테스트"""
+        embedder = HashingEmbedder(dim=64)
+        a = embedder.embed(['라멘을 먹는다', ''])
+        b = HashingEmbedder(dim=64).embed(['라멘을 먹는다', ''])
+        self.assertEqual(a.dtype, np.float32)
+        np.testing.assert_array_equal(a, b)
+        self.assertAlmostEqual(float(np.linalg.norm(a[0])), 1.0, places=5)
+        self.assertEqual(float(np.linalg.norm(a[1])), 0.0)
+
+    def test_build_command_and_masked_search(self):
+        """색인 생성 명령과 시청 범위 마스크 검색 테스트"""
+        self.assertIsNone(search_vectors(self.series.id, '라멘'))
+
+        call_command('build_episode_index', series=[self.series.id], stdout=StringIO())
+        index = get_vector_index(self.series.id)
+        self.assertIsInstance(index.vectors, np.memmap)
+        self.assertEqual(index.vectors.shape, (3, HashingEmbedder().dim))
+
+        results = search_vectors(self.series.id, '라멘', k=2, max_ordinal=2)
+        self.assertEqual([p.ordinal for p in results], [2, 1])
+        results = search_vectors(self.series.id, '사스케와 결전', k=1)
+        self.assertEqual(results[0].episode_title, '결전')
+        self.assertEqual(search_vectors(self.series.id, '라멘', max_ordinal=0), [])
+
+    def test_versioned_swap_and_stale_index(self):
+        """포인터 교체, 이전 버전 정리, 카탈로그 변경 후 오래된 색인 미사용 테스트"""
+        import os
+        from .vector_index import build_series_vectors
+
+        for _ in range(3):
+            build_series_vectors(self.series.id)
+        index = get_vector_index(self.series.id)
+        versions = os.listdir(os.path.join(self.tmpdir.name, f'series_{self.series.id}'))
+        self.assertEqual(len(versions), 2)  # 현재 + 직전 버전만 유지
+        self.assertIn(index.data.split('/')[-1], versions)
+        self.assertEqual(len(search_vectors(self.series.id, '라멘', k=1)), 1)
+
+        # 에피소드가 바뀌면 카탈로그 버전이 올라 색인을 쓰지 않음 (BM25로 대체)
+        episode = Episode.objects.get(episode_number=3)
+        episode.content = '사스케가 떠난다.'
+        episode.save()
+        self.assertIsNone(search_vectors(self.series.id, '라멘'))
+
+        build_series_vectors(self.series.id)
+        self.assertEqual(search_vectors(self.series.id, '사스케가 떠난다', k=1)[0].episode_number, 3)
+
+
+class EpisodeAPITest(TestCase):
+    """에피소드 목록 API (cursor 페이지네이션, sparse fieldset) 테스트"""
+
+    def setUp(self):
+        from rest_framework.test import APIClient
+
+        self.client = APIClient()
+        self.series = Series.objects.create(title='테스트 애니메이션')
+        self.season = Season.objects.create(series=self.series, season_number=1)
+        for n in range(5, 0, -1):
+            Episode.objects.create(season=self.season, episode_number=n, episode_title=f'{n}화', content='긴 본문' * 1000)
+
+    def test_cursor_pagination(self):
+        response = self.client.get('/api/episode/', {'season': self.season.id, 'page_size': 2})
+        self.assertEqual([e['episode_number'] for e in response.data['results']], [1, 2])
+        numbers = []
+        url = '/api/episode/?season=%d&page_size=2' % self.season.id
+        while url:
+            # 첫 페이지는 캐시된 응답(바이트)이므로 .data 대신 json()으로 읽음
+            page = self.client.get(url).json()
+            numbers.extend(e['episode_number'] for e in page['results'])
+            url = page['next']
+        self.assertEqual(numbers, [1, 2, 3, 4, 5])
+
+    def test_cursor_uses_full_ordering_key(self):
+        from base64 import b64decode
+        from urllib.parse import parse_qs, urlparse
+
+        second = Season.objects.create(series=self.series, season_number=2)
+        for n in (2, 1):
+            Episode.objects.create(season=second, episode_number=n, episode_title=f'2-{n}화', content='본문')
+
+        keys, pages, url = [], [], '/api/episode/?page_size=2&fields=episode_number'
+        while url:
+            page = self.client.get(url).json()
+            pages.append(url)
+            keys.extend(e['episode_number'] for e in page['results'])
+            url = page['next']
+        self.assertEqual(keys, [1, 2, 3, 4, 5, 1, 2])
+
+        # 같은 시즌 안에서도 offset 없이 (시즌, 에피소드 번호) 위치로 이어짐
+        cursor = parse_qs(urlparse(pages[2]).query)['cursor'][0]
+        self.assertNotIn('o', parse_qs(b64decode(cursor).decode()))
+
+        previous = self.client.get(pages[-1]).json()['previous']
+        self.assertEqual([e['episode_number'] for e in self.client.get(previous).json()['results']], [5, 1])
+
+    def test_etag_uses_series_version(self):
+        episode = Episode.objects.filter(season=self.season).first()
+        urls = [f'/api/episode/?season={self.season.id}', f'/api/episode/{episode.id}/',
+                f'/api/season/{self.season.id}/']
+        etags = [self.client.get(url)['ETag'] for url in urls]
+        self.assertTrue(all(etag.startswith(f'"series:{self.series.id}.') for etag in etags))
+
+        # 다른 시리즈가 바뀌어도 304, 이 시리즈의 에피소드가 바뀌면 200
+        Series.objects.create(title='다른 애니메이션')
+        for url, etag in zip(urls, etags):
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        episode.episode_title = '변경'
+        episode.save()
+        for url, etag in zip(urls, etags):
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_sparse_fields_defer_content(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/episode/', {'fields': 'episode_number,episode_title'})
+        self.assertEqual(set(response.data['results'][0]), {'id', 'episode_number', 'episode_title'})
+        self.assertNotIn('content', queries.captured_queries[-1]['sql'])
+
+        response = self.client.get('/api/episode/', {'omit': 'content'})
+        self.assertEqual(set(response.data['results'][0]), {'id', 'season', 'episode_number', 'episode_title'})
+
+        response = self.client.get(f'/api/episode/{Episode.objects.first().id}/', {'fields': 'episode_title'})
+        self.assertEqual(set(response.data), {'id', 'episode_title'})
+
+        self.assertEqual(self.client.get('/api/episode/', {'fields': 'unknown'}).status_code, 400)
@@ -0,0 +1,275 @@
+"""
+에피소드 청크 임베딩 색인 (NumPy 코사인 검색)
+
+- build_episode_index 명령으로 시리즈별 청크 임베딩을 float32 행렬(.npy)로 저장합니다.
+- 검색 시 .npy 파일을 memory-map으로 열고, 시청 범위 이내의 행만 한 번의 행렬곱으로
+  코사인 유사도를 계산해 top-k를 고릅니다. (임베딩은 저장 시 L2 정규화)
+- 임베더는 EPISODE_EMBEDDER 설정(dotted path)으로 교체할 수 있으며, 기본값인
+  HashingEmbedder는 네트워크 없이 결정적으로 동작합니다.
+
+파일 구성 (EPISODE_VECTOR_INDEX_DIR):
+- series_<id>.json: 현재 색인 버전을 가리키는 포인터 ({"data": 데이터 디렉터리, "catalog_token": 빌드 시점 카탈로그 버전})
+- series_<id>/<버전>/vectors.npy: (청크 수, dim) float32 임베딩 행렬
+- series_<id>/<버전>/ordinals.npy: 청크별 에피소드 순번 (int32, 오름차순)
+- series_<id>/<버전>/meta.json: 임베더 정보와 청크 메타데이터
+
+빌드할 때마다 새 버전 디렉터리에 세 파일을 모두 쓴 뒤 포인터 하나만 os.replace로 교체하므로,
+읽는 쪽은 항상 같은 버전의 행렬/순번/메타를 함께 엽니다. (순번과 passage가 어긋나면 시청 범위를 넘는
+passage가 반환될 수 있음)
+
+에피소드가 바뀌면 시리즈 카탈로그 버전(series.catalog)이 오르므로, 포인터의 catalog_token이 현재 버전과
+다른 색인은 오래된 것으로 보고 사용하지 않습니다. (import_episode는 바뀐 시리즈의 색인이 있으면 다시 빌드함)
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import shutil
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from .retrieval import Passage, char_ngrams, iter_series_passages
+
+
+class HashingEmbedder:
+    """
+    문자 n-gram feature hashing 임베더
+
+    n-gram을 blake2b 해시로 dim 차원에 부호와 함께 누적하고 L2 정규화합니다.
+    외부 모델 없이 결정적으로 동작하므로 오프라인 빌드/테스트에 사용합니다.
+    """
+
+    def __init__(self, dim: int = 512):
+        self.dim = dim
+        self.name = f"hashing-{dim}"
+
+    def _bucket(self, gram: str) -> Tuple[int, float]:
+        digest = int.from_bytes(hashlib.blake2b(gram.encode("utf-8"), digest_size=8).digest(), "little")
+        return digest % self.dim, (1.0 if (digest >> 63) & 1 else -1.0)
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for gram, tf in Counter(char_ngrams(text)).items():
+                col, sign = self._bucket(gram)
+                matrix[row, col] += sign * (1.0 + math.log(tf))
+        return _normalize(matrix)
+
+
+class OpenAIEmbedder:
+    """OpenAI 임베딩 API를 사용하는 임베더"""
+
+    def __init__(self, model: str = "text-embedding-3-small", dim: int = 1536, batch_size: int = 128):
+        self.model = model
+        self.dim = dim
+        self.batch_size = batch_size
+        self.name = f"openai-{model}"
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        import openai
+
+        client = openai.OpenAI(api_key=settings.OPENAI_API_KEY)
+        rows = []
+        for start in range(0, len(texts), self.batch_size):
+            response = client.embeddings.create(model=self.model, input=list(texts[start:start + self.batch_size]))
+            rows.extend(item.embedding for item in response.data)
+        return _normalize(np.asarray(rows, dtype=np.float32).reshape(len(texts), self.dim))
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (matrix / norms).astype(np.float32, copy=False)
+
+
+def get_embedder():
+    """EPISODE_EMBEDDER 설정에 지정된 임베더 인스턴스를 반환합니다."""
+    path = getattr(settings, "EPISODE_EMBEDDER", "episode.vector_index.HashingEmbedder")
+    return import_string(path)()
+
+
+def index_dir() -> Path:
+    return Path(getattr(settings, "EPISODE_VECTOR_INDEX_DIR", Path(settings.BASE_DIR) / "vector_index"))
+
+
+def _pointer_path(series_id: int) -> Path:
+    return index_dir() / f"series_{series_id}.json"
+
+
+def _data_paths(data_dir: Path) -> Dict[str, Path]:
+    return {
+        "vectors": data_dir / "vectors.npy",
+        "ordinals": data_dir / "ordinals.npy",
+        "meta": data_dir / "meta.json",
+    }
+
+
+def _read_pointer(series_id: int) -> Optional[dict]:
+    try:
+        with open(_pointer_path(series_id), "rb") as f:
+            return json.loads(f.read().decode("utf-8"))
+    except FileNotFoundError:
+        return None
+
+
+def has_vector_index(series_id: int) -> bool:
+    return _pointer_path(series_id).exists()
+
+
+def _atomic_save(path: Path, writer) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        writer(f)
+    os.replace(tmp, path)
+
+
+def build_series_vectors(series_id: int, embedder=None, batch_size: int = 256) -> int:
+    """
+    시리즈의 에피소드 청크를 임베딩해 색인 파일로 저장합니다.
+
+    Returns:
+        int: 저장한 청크 수
+    """
+    from series.catalog import get_catalog_token
+
+    embedder = embedder or get_embedder()
+    # 읽기 전의 버전을 기록 (빌드 중에 바뀌면 다음 검색에서 오래된 색인으로 처리됨)
+    catalog_token = get_catalog_token(series_id)
+    passages: List[Passage] = list(iter_series_passages(series_id))
+
+    vectors = np.zeros((len(passages), embedder.dim), dtype=np.float32)
+    for start in range(0, len(passages), batch_size):
+        batch = passages[start:start + batch_size]
+        vectors[start:start + len(batch)] = embedder.embed([p.text for p in batch])
+    ordinals = np.asarray([p.ordinal for p in passages], dtype=np.int32)
+
+    meta = {
+        "series_id": series_id,
+        "embedder": embedder.name,
+        "dim": embedder.dim,
+        "passages": [
+            [p.episode_id, p.ordinal, p.season_number, p.episode_number, p.episode_title, p.text]
+            for p in passages
+        ],
+    }
+
+    # 새 버전 디렉터리에 모두 쓴 뒤 포인터만 교체 (포인터가 바뀌기 전까지 읽는 쪽에서는 보이지 않음)
+    version = f"{time.time_ns():x}-{os.getpid()}"
+    data_dir = index_dir() / f"series_{series_id}" / version
+    data_dir.mkdir(parents=True)
+    paths = _data_paths(data_dir)
+    np.save(paths["vectors"], vectors)
+    np.save(paths["ordinals"], ordinals)
+    paths["meta"].write_bytes(json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+
+    pointer = {"data": f"series_{series_id}/{version}", "catalog_token": catalog_token}
+    _atomic_save(_pointer_path(series_id), lambda f: f.write(json.dumps(pointer).encode("utf-8")))
+    _prune_versions(series_id, keep=2)
+    invalidate_vector_index(series_id)
+    return len(passages)
+
+
+def _prune_versions(series_id: int, keep: int = 2) -> None:
+    """
+    최근 keep개를 제외한 이전 버전 디렉터리를 삭제합니다.
+    (포인터를 읽은 직후 교체된 경우에도 파일을 열 수 있도록 직전 버전은 남겨둠)
+    """
+    # 버전 이름은 생성 시각(ns, 16진수)으로 시작하므로 이름순 = 생성순
+    versions = sorted((index_dir() / f"series_{series_id}").iterdir(), key=lambda p: p.name)
+    for old in versions[:-keep]:
+        shutil.rmtree(old, ignore_errors=True)
+
+
+class SeriesVectorIndex:
+    """memory-map으로 연 시리즈 임베딩 색인"""
+
+    def __init__(self, series_id: int, pointer: dict):
+        paths = _data_paths(index_dir() / pointer["data"])
+        with open(paths["meta"], "rb") as f:
+            meta = json.loads(f.read().decode("utf-8"))
+        self.series_id = series_id
+        self.data = pointer["data"]
+        self.catalog_token = pointer.get("catalog_token")
+        self.embedder_name = meta["embedder"]
+        self.passages = [Passage(*row) for row in meta["passages"]]
+        self.vectors = np.load(paths["vectors"], mmap_mode="r")
+        self.ordinals = np.load(paths["ordinals"])
+
+    def search(self, query_vector: np.ndarray, k: int = 5, max_ordinal: Optional[int] = None) -> List[Tuple[Passage, float]]:
+        """
+        코사인 유사도 상위 k개 (passage, score)를 반환합니다.
+        청크가 에피소드 순번 순으로 저장되어 있으므로 시청 범위 마스크는 앞쪽 행 슬라이스가 됩니다.
+        """
+        limit = len(self.passages) if max_ordinal is None else int(np.searchsorted(self.ordinals, max_ordinal, side="right"))
+        if limit == 0 or k <= 0:
+            return []
+
+        scores = self.vectors[:limit] @ query_vector.astype(np.float32, copy=False)
+        k = min(k, limit)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(self.passages[i], float(scores[i])) for i in top]
+
+
+_cache: Dict[int, SeriesVectorIndex] = {}
+_lock = threading.Lock()
+
+
+def get_vector_index(series_id: int) -> Optional[SeriesVectorIndex]:
+    """시리즈 임베딩 색인을 반환합니다. 색인 파일이 없으면 None."""
+    for _ in range(2):
+        pointer = _read_pointer(series_id)
+        if pointer is None:
+            return None
+
+        with _lock:
+            cached = _cache.get(series_id)
+        if cached and cached.data == pointer["data"]:
+            return cached
+        try:
+            index = SeriesVectorIndex(series_id, pointer)
+            break
+        except FileNotFoundError:
+            continue  # 포인터를 읽은 뒤 그 버전이 정리된 경우 새 포인터로 다시 시도
+    else:
+        return None
+
+    with _lock:
+        _cache[series_id] = index
+    return index
+
+
+def invalidate_vector_index(series_id: Optional[int] = None) -> None:
+    with _lock:
+        if series_id is None:
+            _cache.clear()
+        else:
+            _cache.pop(series_id, None)
+
+
+def search_vectors(series_id: int, query: str, k: int = None, max_ordinal: Optional[int] = None,
+                   embedder=None) -> Optional[List[Passage]]:
+    """
+    임베딩 색인에서 스포일러 경계 이내의 관련 passage 상위 k개를 반환합니다.
+    색인이 없거나, 현재 임베더와 다른 임베더로 만들어졌거나, 빌드 후 카탈로그가 바뀌었으면 None을 반환합니다.
+    """
+    from series.catalog import get_catalog_token
+
+    index = get_vector_index(series_id)
+    embedder = embedder or get_embedder()
+    if index is None or index.embedder_name != embedder.name:
+        return None
+    if index.catalog_token != get_catalog_token(series_id):
+        return None  # 오래된 색인 (BM25 검색으로 대체)
+    k = k or getattr(settings, "RETRIEVAL_TOP_K", 5)
+    query_vector = embedder.embed([query])[0]
+    return [passage for passage, _ in index.search(query_vector, k=k, max_ordinal=max_ordinal)]
@@ -1,18 +1,49 @@
 from rest_framework import viewsets, permissions
-from rest_framework.response import Response
 from .models import Episode
 from .serializers import EpisodeSerializer
+from season.models import Season
+from series.catalog import CatalogETagMixin
+from config.fieldsets import SparseFieldsetMixin, FIELDSET_PARAMETERS
+from config.pagination import KeysetCursorPagination, CURSOR_PARAMETERS
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
-class EpisodeViewSet(viewsets.ReadOnlyModelViewSet):
+
+class EpisodeCursorPagination(KeysetCursorPagination):
+    ordering = ('season_id', 'episode_number')
+
+
+class EpisodeViewSet(CatalogETagMixin, SparseFieldsetMixin, viewsets.ReadOnlyModelViewSet):
     queryset = Episode.objects.all()
     serializer_class = EpisodeSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    pagination_class = EpisodeCursorPagination
+
+    def get_catalog_series_id(self):
+        # 에피소드가 속한 시리즈의 버전을 사용 (기본 키 조회 한 번, 알 수 없으면 전체 버전)
+        if self.action == 'list':
+            season_id = self.request.query_params.get('season', '')
+            if season_id.isdigit():
+                return Season.objects.filter(pk=season_id).values_list('series_id', flat=True).first()
+        pk = str(self.kwargs.get('pk', ''))
+        if self.action == 'retrieve' and pk.isdigit():
+            return Episode.objects.filter(pk=pk).values_list('season__series_id', flat=True).first()
+        return None
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        season_id = self.request.query_params.get('season', None)
+        if self.action == 'list' and season_id:
+            queryset = queryset.filter(season_id=season_id)
+        return queryset
 
     @swagger_auto_schema(
         operation_summary="에피소드 목록 조회",
-        operation_description="모든 에피소드 목록을 반환합니다.",
+        operation_description=(
+            "에피소드 목록을 시즌, 에피소드 번호 순 cursor 페이지로 반환합니다.\n\n"
+            "에피소드 선택 화면처럼 본문이 필요 없으면 `omit=content` 또는 "
+            "`fields=episode_number,episode_title`로 본문 컬럼을 읽지 않도록 할 수 있습니다."
+        ),
         manual_parameters=[
             openapi.Parameter(
                 'season',
@@ -20,24 +51,20 @@ class EpisodeViewSet(viewsets.ReadOnlyModelViewSet):
                 description="시즌 ID로 필터링",
                 type=openapi.TYPE_INTEGER
             )
-        ],
+        ] + CURSOR_PARAMETERS + FIELDSET_PARAMETERS,
         responses={200: EpisodeSerializer(many=True)}
     )
     def list(self, request):
-        queryset = self.get_queryset()
-        season_id = request.query_params.get('season', None)
-        if season_id:
-            queryset = queryset.filter(season_id=season_id)
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        return super().list(request)
 
     @swagger_auto_schema(
         operation_summary="에피소드 상세 조회",
         operation_description="특정 에피소드의 상세 정보를 조회합니다.",
+        manual_parameters=FIELDSET_PARAMETERS,
         responses={
             200: EpisodeSerializer(),
             404: "에피소드를 찾을 수 없습니다."
         }
     )
     def retrieve(self, request, pk=None):
-        return super().retrieve(request, pk=pk)
\ No newline at end of file
+        return super().retrieve(request, pk=pk)
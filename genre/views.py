@@ -1,18 +1,27 @@
 from rest_framework import viewsets, permissions
 from .models import Genre
 from .serializers import GenreSerializer
+from series.catalog import CatalogETagMixin
+from config.fieldsets import SparseFieldsetMixin, FIELDSET_PARAMETERS
+from config.pagination import DefaultCursorPagination, CURSOR_PARAMETERS
 from drf_yasg.utils import swagger_auto_schema
 
 
-class GenreViewSet(viewsets.ReadOnlyModelViewSet):
+class GenreCursorPagination(DefaultCursorPagination):
+	ordering = ('id',)
+
+
+class GenreViewSet(CatalogETagMixin, SparseFieldsetMixin, viewsets.ReadOnlyModelViewSet):
 	"""장르 조회 전용 ViewSet"""
 	queryset = Genre.objects.all()
 	serializer_class = GenreSerializer
 	permission_classes = [permissions.AllowAny]
+	pagination_class = GenreCursorPagination
 
 	@swagger_auto_schema(
 		operation_summary="장르 목록 조회",
-		operation_description="모든 장르를 반환합니다.",
+		operation_description="장르를 ID 순 cursor 페이지로 반환합니다.",
+		manual_parameters=CURSOR_PARAMETERS + FIELDSET_PARAMETERS,
 		responses={200: GenreSerializer(many=True)}
 	)
 	def list(self, request):
@@ -21,6 +30,7 @@ class GenreViewSet(viewsets.ReadOnlyModelViewSet):
 	@swagger_auto_schema(
 		operation_summary="장르 상세 조회",
 		operation_description="특정 장르의 상세 정보를 조회합니다.",
+		manual_parameters=FIELDSET_PARAMETERS,
 		responses={200: GenreSerializer(), 404: '장르를 찾을 수 없습니다.'}
 	)
 	def retrieve(self, request, pk=None):
@@ -1,7 +1,8 @@
 from rest_framework import serializers
+from config.fieldsets import SparseFieldsetSerializerMixin
 from .models import Season
 
-class SeasonSerializer(serializers.ModelSerializer):
+class SeasonSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Season
         fields = ['id', 'series', 'season_number']
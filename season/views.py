@@ -1,21 +1,46 @@
 from rest_framework import viewsets, permissions
-from rest_framework.response import Response
 from .models import Season
 from .serializers import SeasonSerializer
+from series.catalog import CatalogETagMixin
+from config.fieldsets import SparseFieldsetMixin, FIELDSET_PARAMETERS
+from config.pagination import KeysetCursorPagination, CURSOR_PARAMETERS
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
-class SeasonViewSet(viewsets.ReadOnlyModelViewSet):
+
+class SeasonCursorPagination(KeysetCursorPagination):
+    ordering = ('series_id', 'season_number')
+
+
+class SeasonViewSet(CatalogETagMixin, SparseFieldsetMixin, viewsets.ReadOnlyModelViewSet):
     """
     시즌 정보를 관리하는 ViewSet
     """
     queryset = Season.objects.all()
     serializer_class = SeasonSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    pagination_class = SeasonCursorPagination
+
+    def get_catalog_series_id(self):
+        if self.action == 'list':
+            series_id = self.request.query_params.get('series', '')
+            return int(series_id) if series_id.isdigit() else None
+        pk = str(self.kwargs.get('pk', ''))
+        if self.action == 'retrieve' and pk.isdigit():
+            # 시즌은 한 시리즈에 속하므로 시리즈 버전만 비교 (없는 시즌은 전체 버전)
+            return Season.objects.filter(pk=pk).values_list('series_id', flat=True).first()
+        return None
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        series_id = self.request.query_params.get('series', None)
+        if self.action == 'list' and series_id:
+            queryset = queryset.filter(series_id=series_id)
+        return queryset
 
     @swagger_auto_schema(
         operation_summary="시즌 목록 조회",
-        operation_description="모든 시즌 목록을 반환합니다.",
+        operation_description="시즌 목록을 시리즈, 시즌 번호 순 cursor 페이지로 반환합니다.",
         manual_parameters=[
             openapi.Parameter(
                 'series',
@@ -23,20 +48,16 @@ class SeasonViewSet(viewsets.ReadOnlyModelViewSet):
                 description="시리즈 ID로 필터링",
                 type=openapi.TYPE_INTEGER
             )
-        ],
+        ] + CURSOR_PARAMETERS + FIELDSET_PARAMETERS,
         responses={200: SeasonSerializer(many=True)}
     )
     def list(self, request):
-        queryset = self.get_queryset()
-        series_id = request.query_params.get('series', None)
-        if series_id:
-            queryset = queryset.filter(series_id=series_id)
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        return super().list(request)
 
     @swagger_auto_schema(
         operation_summary="시즌 상세 조회",
         operation_description="특정 시즌의 상세 정보를 조회합니다.",
+        manual_parameters=FIELDSET_PARAMETERS,
         responses={
             200: SeasonSerializer(),
             404: "시즌을 찾을 수 없습니다."
@@ -0,0 +1,167 @@
+"""
+카탈로그 버전과 조건부 GET (ETag / If-None-Match)
+
+카탈로그 데이터는 import_episode를 실행할 때만 바뀌므로, 변경될 때마다 전체("global")와
+시리즈별("series:<id>") 버전을 올려두고 조회 API는 이 버전으로 강한 ETag를 만듭니다.
+클라이언트가 If-None-Match로 같은 ETag를 보내면 catalog_version 테이블만 읽고 304를 응답합니다.
+
+- 모델 저장/삭제 시 signal로 버전을 올립니다. (series.signals)
+- import처럼 많은 행을 바꾸는 작업은 catalog_batch() 안에서 실행해 끝날 때 한 번만 올립니다.
+
+200 응답은 렌더링된 바이트 그대로 Django 캐시(CATALOG_CACHE_ALIAS)에 저장합니다.
+캐시 키에 버전이 들어가므로 버전이 오르면 해당 시리즈(또는 전체) 범위의 키만 자연히 무효화됩니다.
+"""
+import hashlib
+import threading
+from contextlib import contextmanager
+from typing import Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import F
+from django.http import HttpResponse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.response import Response
+
+from .models import CatalogVersion
+
+GLOBAL_KEY = "global"
+
+_batch = threading.local()
+
+
+def series_key(series_id: int) -> str:
+    return f"series:{series_id}"
+
+
+def get_catalog_version(series_id: Optional[int] = None) -> int:
+    """카탈로그 버전 (series_id가 없으면 전체 버전)"""
+    key = GLOBAL_KEY if series_id is None else series_key(series_id)
+    version = CatalogVersion.objects.filter(key=key).values_list("version", flat=True).first()
+    return version or 0
+
+
+def get_catalog_token(series_id: Optional[int] = None) -> str:
+    """
+    ETag/캐시 키에 쓰는 버전 문자열 ("<version>-<updated_at>")
+
+    DB를 초기화하면 version이 다시 0부터 시작하므로, 갱신 시각을 함께 넣어
+    초기화 전에 만든 ETag나 캐시와 겹치지 않게 합니다.
+    """
+    key = GLOBAL_KEY if series_id is None else series_key(series_id)
+    row = CatalogVersion.objects.filter(key=key).values_list("version", "updated_at").first()
+    if row is None:
+        return "0"
+    version, updated_at = row
+    return f"{version}-{int(updated_at.timestamp() * 1_000_000):x}"
+
+
+def bump_catalog_version(series_ids: Iterable[Optional[int]] = ()) -> None:
+    """
+    전체 버전과 주어진 시리즈들의 버전을 1씩 올립니다.
+    catalog_batch() 안에서 호출되면 블록이 끝날 때 모아서 한 번만 올립니다.
+    """
+    series_ids = {pk for pk in series_ids if pk is not None}
+    pending = getattr(_batch, "series_ids", None)
+    if pending is not None:
+        pending.update(series_ids)
+        _batch.dirty = True
+        return
+
+    keys = [GLOBAL_KEY] + [series_key(pk) for pk in sorted(series_ids)]
+    CatalogVersion.objects.bulk_create([CatalogVersion(key=key) for key in keys], ignore_conflicts=True)
+    CatalogVersion.objects.filter(key__in=keys).update(version=F("version") + 1, updated_at=timezone.now())
+
+
+@contextmanager
+def catalog_batch():
+    """블록 안의 버전 변경을 모아 블록이 끝날 때 한 번만 버전을 올립니다. (중첩 가능)"""
+    if getattr(_batch, "series_ids", None) is not None:
+        yield
+        return
+
+    _batch.series_ids, _batch.dirty = set(), False
+    try:
+        yield
+    finally:
+        series_ids, _batch.series_ids = _batch.series_ids, None
+        if _batch.dirty:
+            bump_catalog_version(series_ids)
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match는 약한 비교 (W/ 접두사 무시)
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag in candidates
+
+
+def catalog_cache():
+    return caches[getattr(settings, "CATALOG_CACHE_ALIAS", "default")]
+
+
+class CatalogETagMixin:
+    """
+    카탈로그 ReadOnlyModelViewSet의 list/retrieve에 ETag, If-None-Match(304), 응답 캐시를 적용하는 믹스인
+
+    get_catalog_series_id()가 시리즈 ID를 반환하면 그 시리즈 버전을, 아니면 전체 버전을 사용합니다.
+    (응답 전체가 한 시리즈에 속할 때만 반환하며, 304 경로가 가볍도록 기본 키 조회 정도로 구해야 함)
+    """
+    _catalog_cache_key = None
+
+    def get_catalog_series_id(self) -> Optional[int]:
+        return None
+
+    def _catalog_scope(self):
+        series_id = self.get_catalog_series_id()
+        scope = GLOBAL_KEY if series_id is None else series_key(series_id)
+        return scope, get_catalog_token(series_id)
+
+    def get_catalog_etag(self) -> str:
+        scope, token = self._catalog_scope()
+        fmt = getattr(self.request.accepted_renderer, "format", "json")
+        return f'"{scope}.{token}.{fmt}"'
+
+    def get_catalog_cache_key(self, etag: str) -> str:
+        # 이미지 URL 등은 호스트에 따라 달라지므로 전체 URL(경로 + 쿼리)로 구분
+        url = hashlib.sha256(self.request.build_absolute_uri().encode()).hexdigest()
+        return "catalog:%s:%s" % (etag.strip('"'), url)
+
+    def _conditional(self, handler, request, *args, **kwargs):
+        etag = self.get_catalog_etag()
+        if _etag_matches(request.headers.get("If-None-Match", ""), etag):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            key = self.get_catalog_cache_key(etag)
+            cached = catalog_cache().get(key)
+            if cached is not None:
+                content, content_type = cached
+                response = HttpResponse(content, content_type=content_type)
+            else:
+                response = handler(request, *args, **kwargs)
+                self._catalog_cache_key = key  # finalize_response에서 렌더링 후 저장
+        if response.status_code in (status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED):
+            response["ETag"] = etag
+            response["Cache-Control"] = "no-cache"  # 매번 ETag로 재검증
+        return response
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if self._catalog_cache_key and response.status_code == status.HTTP_200_OK:
+            response.render()
+            catalog_cache().set(
+                self._catalog_cache_key,
+                (response.content, response["Content-Type"]),
+                getattr(settings, "CATALOG_CACHE_TIMEOUT", 3600),
+            )
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self._conditional(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._conditional(super().retrieve, request, *args, **kwargs)
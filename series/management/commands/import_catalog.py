@@ -0,0 +1,113 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from io import StringIO
+import glob
+import os
+import time
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+
+IMAGE_EXTENSIONS = (".webp", ".jpg", ".jpeg", ".png")
+
+
+def find_image(csv_path):
+    """CSV와 같은 이름의 이미지 파일 (예: naruto.csv → naruto.webp)"""
+    stem = os.path.splitext(csv_path)[0]
+    for ext in IMAGE_EXTENSIONS:
+        if os.path.exists(stem + ext):
+            return stem + ext
+    return None
+
+
+def import_file(csv_path, image_path, update, force=False):
+    """
+    CSV 파일 하나를 import_episode(--bulk)로 import (워커 프로세스에서 실행)
+
+    파일마다 트랜잭션이 따로이므로 실패해도 다른 파일에는 영향이 없고, 예외는 결과로 반환합니다.
+    """
+    from series.management.commands.import_episode import Command as ImportEpisodeCommand
+
+    command = ImportEpisodeCommand()
+    started = time.monotonic()
+    result = {
+        "file": os.path.basename(csv_path), "ok": False, "rows": 0, "created": 0, "updated": 0,
+        "skipped": False, "changed": [], "error": "",
+    }
+    try:
+        call_command(command, csv_path, image=image_path, update=update, force=force, bulk=True, stdout=StringIO())
+        result.update(command.result, ok=True)
+    except Exception as e:  # 한 파일의 실패가 전체 import를 멈추지 않도록 결과로 기록
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["seconds"] = time.monotonic() - started
+    return result
+
+
+def _init_worker():
+    # spawn/forkserver 방식으로 시작된 프로세스는 Django 설정이 되어 있지 않음
+    import django
+    django.setup()
+
+
+class Command(BaseCommand):
+    help = "디렉터리의 *.csv(+ 같은 이름의 이미지)를 시리즈별로 병렬 import"
+
+    def add_arguments(self, parser):
+        parser.add_argument("directory", type=str, help="CSV/이미지 디렉터리 (예: raw_data)")
+        parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                            help="동시에 import할 파일 수 (프로세스 수, 1이면 현재 프로세스에서 순서대로)")
+        parser.add_argument("--update", action="store_true", help="기존 에피소드 제목/내용/시리즈 설명/장르 업데이트")
+        parser.add_argument("--force", action="store_true", help="마지막 import와 같은 파일도 다시 import")
+
+    def handle(self, *args, **options):
+        directory = options["directory"]
+        csv_paths = sorted(glob.glob(os.path.join(directory, "*.csv")))
+        if not csv_paths:
+            raise CommandError(f"{directory}에 CSV 파일이 없습니다.")
+
+        workers = max(1, min(options["workers"], len(csv_paths)))
+        if workers > 1 and connection.vendor == "sqlite":
+            # SQLite는 동시에 한 프로세스만 쓸 수 있어 병렬로 실행하면 database is locked 오류가 남
+            self.stdout.write(self.style.WARNING("SQLite에서는 workers=1로 순서대로 import합니다."))
+            workers = 1
+        self.stdout.write(f"{len(csv_paths)}개 파일 import (workers={workers})")
+
+        started = time.monotonic()
+        jobs = [(path, find_image(path), options["update"], options["force"]) for path in csv_paths]
+        if workers == 1:
+            results = [import_file(*job) for job in jobs]
+        else:
+            # fork된 프로세스가 부모의 DB 연결을 같이 쓰지 않도록 먼저 닫음
+            connections.close_all()
+            results = []
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+                futures = [pool.submit(import_file, *job) for job in jobs]
+                for future in as_completed(futures):
+                    results.append(future.result())
+        elapsed = time.monotonic() - started
+
+        failed = self.report(sorted(results, key=lambda r: r["file"]), elapsed)
+        if failed:
+            raise CommandError(f"{len(failed)}개 파일 import 실패: {', '.join(r['file'] for r in failed)}")
+
+    def report(self, results, elapsed):
+        """파일별 소요 시간/행 수 표 출력 (실패한 결과 목록 반환)"""
+        width = max(len(r["file"]) for r in results)
+        for r in results:
+            line = f"{r['file']:<{width}}  {r['seconds']:7.2f}s  {r['rows']:6d}행"
+            if r["skipped"]:
+                self.stdout.write(line + "  변경 없음 (건너뜀)")
+            elif r["ok"]:
+                self.stdout.write(line + f"  생성 {r['created']}개, 업데이트 {r['updated']}개")
+            else:
+                self.stdout.write(self.style.ERROR(line + f"  실패 ({r['error']})"))
+
+        rows = sum(r["rows"] for r in results)
+        self.stdout.write(self.style.SUCCESS(
+            f"완료: {len(results)}개 파일, {rows}행, {elapsed:.2f}s ({rows / elapsed if elapsed else 0:.0f} rows/s)"
+        ))
+        changed = [r for r in results if r["created"] or r["updated"]]
+        if changed:
+            # 캐시/검색 색인 무효화 대상
+            self.stdout.write("변경된 시리즈: " + ", ".join(f"{r['file']}({r['created'] + r['updated']}개)" for r in changed))
+        return [r for r in results if not r["ok"]]
@@ -3,11 +3,21 @@ from django.core.files import File
 from django.db import transaction
 from series.models import Series
 from season.models import Season
-from episode.models import Episode
+from episode.models import Episode, episode_content_hash
 from genre.models import Genre
+from config.storage import content_addressed_name
+from episode.vector_index import build_series_vectors, has_vector_index
+from series.catalog import bump_catalog_version, catalog_batch
 import csv
+import hashlib
+import itertools
+import json
 import os
 import re
+import time
+
+# 결과/로그에 남길 변경 에피소드 목록의 최대 길이
+CHANGED_SAMPLE_SIZE = 100
 
 class Command(BaseCommand):
     help = "CSV(title,description,season,episode,episode_title,content,genre)와 이미지를 Series/Episodes로 import"
@@ -16,6 +26,18 @@ class Command(BaseCommand):
         parser.add_argument("csv_path", type=str)
         parser.add_argument("--image", help="시리즈 이미지 파일 경로")
         parser.add_argument("--update", action="store_true", help="기존 에피소드 제목/내용/시리즈 설명/장르 업데이트")
+        parser.add_argument("--skip-vector-index", action="store_true",
+                            help="에피소드가 바뀌어도 임베딩 색인을 다시 빌드하지 않음 (build_episode_index로 따로 빌드)")
+        parser.add_argument("--force", action="store_true",
+                            help="원본 파일이 마지막 import와 같아도 건너뛰지 않고 다시 import")
+        parser.add_argument("--bulk", action="store_true",
+                            help="시즌/에피소드를 행마다 조회하지 않고 한 번에 읽어 bulk_create/bulk_update로 저장")
+        parser.add_argument("--batch-size", type=int, default=500, help="--bulk/--stream 사용 시 INSERT/UPDATE 한 번에 보낼 행 수")
+        parser.add_argument("--stream", action="store_true",
+                            help="CSV를 한 번에 읽지 않고 --chunk-size 행씩 나눠 커밋 (대용량 파일용)")
+        parser.add_argument("--chunk-size", type=int, default=1000, help="--stream 사용 시 한 트랜잭션에서 처리할 행 수")
+        parser.add_argument("--checkpoint", help="--stream 진행 상황 파일 (기본: <csv_path>.checkpoint)")
+        parser.add_argument("--resume", action="store_true", help="--stream 사용 시 checkpoint에 기록된 행까지 건너뛰고 이어서 import")
 
     def open_csv(self, path):
         for enc in ("utf-8-sig", "cp949", "utf-8"):
@@ -31,41 +53,51 @@ class Command(BaseCommand):
         parts = [p.strip() for p in re.split(r"[,\;，]", raw) if p.strip()]
         return parts
 
-    @transaction.atomic
     def handle(self, *args, **options):
-        csv_path = options["csv_path"]
-        image_path = options.get("image")
-        do_update = options["update"]
+        self.verbosity = options.get("verbosity", 1)
+        self.result = None
+        if options.get("stream"):
+            # chunk마다 커밋하므로 버전도 chunk 트랜잭션 안에서 올림 (import_stream)
+            self.import_stream(**options)
+        else:
+            # 행마다 signal로 카탈로그 버전을 올리지 않고, import가 커밋된 뒤 한 번만 올림
+            with catalog_batch():
+                self.import_csv(**options)
+
+        # 임베딩 색인은 카탈로그 버전이 바뀌면 쓰지 않으므로, 색인이 있던 시리즈는 버전을 올린 뒤 다시 빌드
+        result = self.result
+        if (result and (result["created"] or result["updated"]) and not options.get("skip_vector_index")
+                and has_vector_index(result["series_id"])):
+            count = build_series_vectors(result["series_id"])
+            self.stdout.write(f"임베딩 색인 재빌드: 청크 {count}개")
 
+    def open_reader(self, csv_path):
         f = self.open_csv(csv_path)
         reader = csv.DictReader(f)
         required = {"title", "description", "season", "episode", "episode_title", "content"}
         if not required.issubset(set(reader.fieldnames or [])):
+            f.close()
             raise CommandError(f"CSV 헤더는 {required} 가 모두 필요합니다. 현재: {reader.fieldnames}")
+        return f, reader
 
-        rows = list(reader)
-        if not rows:
-            raise CommandError("CSV에 데이터 행이 없습니다.")
+    def collect_genres(self, rows, genre_names_set):
+        # genre 컬럼 수집 (빈값 무시)
+        for r in rows:
+            raw = r.get("genre", "") or ""
+            for g in self.parse_genres(raw):
+                genre_names_set.add(g)
 
+    def get_series(self, first_row, do_update):
         # 시리즈 정보은 첫 행의 title/description 사용
-        first_row = rows[0]
         series_title = (first_row.get("title") or "").strip()
         series_description = (first_row.get("description") or "").strip()
 
-        # 모든 행에서 genre 컬럼 수집 (빈값 무시)
-        genre_names_set = set()
-        if "genre" in (reader.fieldnames or []):
-            for r in rows:
-                raw = r.get("genre", "") or ""
-                for g in self.parse_genres(raw):
-                    genre_names_set.add(g)
-
-        # Series 생성 및 업데이트
+        # Series 생성 및 업데이트 (series, 생성 여부)
         series, created = Series.objects.get_or_create(
             title=series_title,
             defaults={"description": series_description}
         )
-        if not created and do_update:
+        if not created and do_update and series.description != series_description:
             series.description = series_description
             series.save()
         elif created:
@@ -73,65 +105,315 @@ class Command(BaseCommand):
             if series.description != series_description:
                 series.description = series_description
                 series.save()
+        return series, created
 
-        # 장르 처리: through 테이블에 series_id, genre_id로 매핑 (기존 매핑 삭제 후 재생성)
-        if genre_names_set:
-            genre_objs = []
-            for gname in genre_names_set:
-                obj, _ = Genre.objects.get_or_create(name=gname)
-                genre_objs.append(obj)
+    def source_hash(self, csv_path, image_path):
+        """원본 CSV(+이미지) 파일 해시 (파일 크기와 관계없이 1MB씩 읽음)"""
+        digest = hashlib.sha256()
+        for path in filter(None, [csv_path, image_path if image_path and os.path.exists(image_path) else None]):
+            with open(path, "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(block)
+        return digest.hexdigest()
 
-            through_model = series.genres.through
-            # 기존 매핑 삭제
-            through_model.objects.filter(series_id=series.pk).delete()
-            # 새로 삽입
-            for g in genre_objs:
-                through_model.objects.get_or_create(series_id=series.pk, genre_id=g.pk)
+    def skip_unchanged(self, first_row, source_hash, options):
+        """마지막으로 전부 반영한 원본 파일과 같으면 결과를 남기고 True (--force면 항상 False)"""
+        if options.get("force"):
+            return False
+        title = (first_row.get("title") or "").strip()
+        series = Series.objects.filter(title=title, source_hash=source_hash).only("id").first()
+        if series is None:
+            return False
+        self.result = {"series_id": series.pk, "rows": 0, "created": 0, "updated": 0, "skipped": True, "changed": []}
+        self.stdout.write(self.style.SUCCESS("변경 없음: 원본 파일이 마지막 import와 같아 건너뜀"))
+        return True
 
-        # 이미지 처리
+    def save_source_hash(self, series, source_hash, created, do_update):
+        """
+        새 시리즈이거나 --update로 모든 행을 반영했을 때만 기록하고, 값이 바뀌었으면 True
+        (--update 없이 import하면 기존 에피소드가 파일과 다를 수 있으므로 다음 --update를 건너뛰면 안 됨)
+        """
+        if not (created or do_update):
+            return False
+        return bool(Series.objects.filter(pk=series.pk).exclude(source_hash=source_hash).update(source_hash=source_hash))
+
+    def save_image(self, series, image_path):
         if image_path and os.path.exists(image_path):
             with open(image_path, 'rb') as img_file:
-                series.photo.save(
-                    os.path.basename(image_path),
-                    File(img_file),
-                    save=True
-                )
+                image = File(img_file, name=os.path.basename(image_path))
+                # 사진은 내용 해시 이름으로 저장되므로, 이름이 같으면 같은 이미지라 다시 쓰지 않음
+                name = content_addressed_name(series.photo.field.generate_filename(series, image.name), image)
+                if series.photo.name == name:
+                    return
+                series.photo.save(image.name, image, save=True)
+
+    def report(self, series, rows, created, updated, changed, do_update):
+        """
+        created/updated: 생성/변경된 에피소드 수
+        changed: 생성/변경된 (시즌 번호, 에피소드 번호) 중 앞쪽 CHANGED_SAMPLE_SIZE개
+
+        import_catalog 등에서 call_command(Command(), ...) 후 self.result로 결과를 읽을 수 있습니다.
+        """
+        changed = sorted(changed)
+        self.result = {
+            "series_id": series.pk, "rows": rows, "created": created, "updated": updated,
+            "skipped": False, "changed": changed,
+        }
+        self.stdout.write(self.style.SUCCESS(
+            f"완료: 생성 {created}개" + (f", 업데이트 {updated}개" if do_update else "")
+        ))
+        if changed and self.verbosity >= 2:
+            more = created + updated - len(changed)
+            self.stdout.write(
+                "변경된 에피소드: " + ", ".join(f"S{s}E{e}" for s, e in changed) + (f" 외 {more}개" if more > 0 else "")
+            )
+
+    @transaction.atomic
+    def import_csv(self, **options):
+        csv_path = options["csv_path"]
+        image_path = options.get("image")
+        do_update = options["update"]
+
+        f, reader = self.open_reader(csv_path)
+        with f:
+            first_row = next(reader, None)
+            if first_row is None:
+                raise CommandError("CSV에 데이터 행이 없습니다.")
+            source_hash = self.source_hash(csv_path, image_path)
+            if self.skip_unchanged(first_row, source_hash, options):
+                return
+            rows = [first_row, *reader]
+
+        # 모든 행에서 genre 컬럼 수집
+        genre_names_set = set()
+        self.collect_genres(rows, genre_names_set)
+
+        series, created = self.get_series(rows[0], do_update)
+
+        # 장르 처리: through 테이블에 series_id, genre_id로 매핑 (바뀌었으면 기존 매핑 삭제 후 재생성)
+        genres_changed = bool(genre_names_set) and self.sync_genres(series, genre_names_set)
+
+        # 이미지 처리
+        self.save_image(series, image_path)
 
         # 에피소드 처리 (모든 행 순회)
-        created_eps = 0
-        updated_eps = 0
+        if options.get("bulk"):
+            created_eps, updated_eps = self.import_episodes_bulk(series, rows, do_update, options.get("batch_size") or 500)
+        else:
+            created_eps, updated_eps = self.import_episodes(series, rows, do_update)
 
-        for i, row in enumerate(rows, start=1):
-            try:
-                season_number = int(row["season"])
-                episode_number = int(row["episode"])
-            except (ValueError, TypeError):
-                raise CommandError(f"{i}행: season/episode가 정수가 아닙니다. 값={row}")
+        hash_changed = self.save_source_hash(series, source_hash, created, do_update)
+        # signal을 보내지 않는 bulk 작업으로 바뀐 것이 있을 때만 버전을 올림 (시리즈 저장은 signal로 반영)
+        if created_eps or updated_eps or genres_changed or hash_changed:
+            bump_catalog_version([series.pk])
+        changed = [*created_eps, *updated_eps][:CHANGED_SAMPLE_SIZE]
+        self.report(series, len(rows), len(created_eps), len(updated_eps), changed, do_update)
+
+    def import_stream(self, **options):
+        """
+        CSV를 한 행씩 읽어 chunk_size 행마다 따로 커밋 (파일 크기와 관계없이 chunk 만큼의 메모리만 사용)
+
+        chunk를 커밋할 때마다 처리한 행 수를 checkpoint 파일에 기록하고,
+        --resume으로 다시 실행하면 같은 파일에 대해 기록된 행까지 건너뜁니다.
+        장르 매핑은 모든 행을 읽은 뒤 마지막에 다시 만듭니다.
 
-            title = (row.get("episode_title") or "").strip()
-            content = row.get("content") or ""
+        카탈로그 버전은 바뀐 행이 있는 chunk의 트랜잭션 안에서 올리므로, 중간에 실패해도
+        이미 커밋된 행은 캐시/ETag에 반영됩니다. 변경 목록은 일부만 보관합니다. (행 수와 무관한 메모리)
+        """
+        csv_path = options["csv_path"]
+        do_update = options["update"]
+        chunk_size = max(1, options.get("chunk_size") or 1000)
+        batch_size = options.get("batch_size") or 500
+        checkpoint_path = options.get("checkpoint") or f"{csv_path}.checkpoint"
+
+        f, reader = self.open_reader(csv_path)
+        with f:
+            first_row = next(reader, None)
+            if first_row is None:
+                raise CommandError("CSV에 데이터 행이 없습니다.")
+            source_hash = self.source_hash(csv_path, options.get("image"))
+            if self.skip_unchanged(first_row, source_hash, options):
+                return
+
+            resume_from = self.load_checkpoint(checkpoint_path, csv_path) if options.get("resume") else 0
+            if resume_from:
+                self.stdout.write(f"checkpoint: {resume_from}행까지 건너뜀")
+
+            # catalog_batch를 트랜잭션 안쪽에 두어 signal로 인한 버전 변경도 같은 트랜잭션에서 한 번만 반영
+            with transaction.atomic(), catalog_batch():
+                series, created = self.get_series(first_row, do_update)
+                self.save_image(series, options.get("image"))
+
+            genre_names_set = set()
+            created_count, updated_count, changed, done = 0, 0, [], 0
+            started = time.monotonic()
+            for chunk in self.iter_chunks(itertools.chain([first_row], reader), chunk_size):
+                self.collect_genres(chunk, genre_names_set)
+                skip = min(len(chunk), max(0, resume_from - done))
+                if skip < len(chunk):
+                    with transaction.atomic():
+                        chunk_created, chunk_updated = self.import_episodes_bulk(
+                            series, chunk[skip:], do_update, batch_size, start=done + skip + 1
+                        )
+                        if chunk_created or chunk_updated:
+                            bump_catalog_version([series.pk])
+                    created_count += len(chunk_created)
+                    updated_count += len(chunk_updated)
+                    changed.extend([*chunk_created, *chunk_updated][:CHANGED_SAMPLE_SIZE - len(changed)])
+                done += len(chunk)
+                self.save_checkpoint(checkpoint_path, csv_path, done)
+
+                elapsed = time.monotonic() - started
+                self.stdout.write(f"{done}행 처리 ({done / elapsed if elapsed else 0:.0f} rows/s)")
+
+        with transaction.atomic(), catalog_batch():
+            genres_changed = bool(genre_names_set) and self.sync_genres(series, genre_names_set)
+            if self.save_source_hash(series, source_hash, created, do_update) or genres_changed:
+                bump_catalog_version([series.pk])
+
+        if os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+        self.report(series, done, created_count, updated_count, changed, do_update)
+
+    def iter_chunks(self, rows, size):
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def file_signature(self, csv_path):
+        stat = os.stat(csv_path)
+        return {"path": os.path.abspath(csv_path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def load_checkpoint(self, checkpoint_path, csv_path):
+        """같은 파일(경로/크기/수정 시각)의 checkpoint가 있으면 커밋된 행 수, 아니면 0"""
+        try:
+            with open(checkpoint_path, "r", encoding="utf-8") as f:
+                checkpoint = json.load(f)
+        except (OSError, ValueError):
+            return 0
+        if checkpoint.get("file") != self.file_signature(csv_path):
+            self.stdout.write(self.style.WARNING("checkpoint의 파일 정보가 달라 처음부터 import합니다."))
+            return 0
+        return int(checkpoint.get("rows", 0))
+
+    def save_checkpoint(self, checkpoint_path, csv_path, rows):
+        # 중간에 종료되어도 checkpoint가 깨지지 않도록 임시 파일에 쓴 뒤 교체
+        tmp_path = f"{checkpoint_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"file": self.file_signature(csv_path), "rows": rows}, f)
+        os.replace(tmp_path, checkpoint_path)
+
+    def sync_genres(self, series, genre_names):
+        """없는 장르만 한 번에 생성한 뒤, 시리즈-장르 매핑이 다르면 한 번의 INSERT로 다시 만들고 True"""
+        Genre.objects.bulk_create([Genre(name=name) for name in genre_names], ignore_conflicts=True)
+        genre_ids = set(Genre.objects.filter(name__in=genre_names).values_list("pk", flat=True))
+
+        through_model = series.genres.through
+        mappings = through_model.objects.filter(series_id=series.pk)
+        if set(mappings.values_list("genre_id", flat=True)) == genre_ids:
+            return False
+        mappings.delete()
+        through_model.objects.bulk_create([through_model(series_id=series.pk, genre_id=pk) for pk in sorted(genre_ids)])
+        return True
+
+    def parse_row(self, i, row):
+        try:
+            season_number = int(row["season"])
+            episode_number = int(row["episode"])
+        except (ValueError, TypeError):
+            raise CommandError(f"{i}행: season/episode가 정수가 아닙니다. 값={row}")
+
+        title = (row.get("episode_title") or "").strip()
+        content = row.get("content") or ""
+        return season_number, episode_number, title, content
+
+    def import_episodes(self, series, rows, do_update):
+        """행마다 시즌/에피소드를 get_or_create (생성된 목록, 업데이트된 목록)"""
+        created_eps = []
+        updated_eps = []
+
+        for i, row in enumerate(rows, start=1):
+            season_number, episode_number, title, content = self.parse_row(i, row)
 
             season, _ = Season.objects.get_or_create(series=series, season_number=season_number)
-            ep, ep_created = Episode.objects.get_or_create(
+            # 본문은 읽지 않고 content_hash로 비교 (import_episodes_bulk와 같은 방식)
+            ep, ep_created = Episode.objects.only(
+                "id", "season_id", "episode_number", "episode_title", "content_hash"
+            ).get_or_create(
                 season=season,
                 episode_number=episode_number,
                 defaults={"episode_title": title, "content": content},
             )
             if ep_created:
-                created_eps += 1
-            else:
-                if do_update:
-                    changed = False
-                    if title and ep.episode_title != title:
-                        ep.episode_title = title
-                        changed = True
-                    if ep.content != content:
-                        ep.content = content
-                        changed = True
-                    if changed:
-                        ep.save()
-                        updated_eps += 1
+                created_eps.append((season_number, episode_number))
+            elif do_update:
+                title = title or ep.episode_title
+                if episode_content_hash(title, content) != ep.content_hash:
+                    ep.episode_title, ep.content = title, content
+                    ep.save(update_fields=["episode_title", "content"])  # content_hash는 save()에서 함께 갱신
+                    updated_eps.append((season_number, episode_number))
 
-        self.stdout.write(self.style.SUCCESS(
-            f"완료: 생성 {created_eps}개" + (f", 업데이트 {updated_eps}개" if do_update else "")
-        ))
\ No newline at end of file
+        return created_eps, updated_eps
+
+    def import_episodes_bulk(self, series, rows, do_update, batch_size, start=1):
+        """
+        rows에 나온 기존 시즌/에피소드를 한 번씩 읽어두고, 새 행은 bulk_create, content_hash가 바뀐 행만 bulk_update
+        (행 수와 관계없이 batch 수만큼의 쿼리, post_save signal은 발생하지 않음)
+
+        생성/변경된 (시즌 번호, 에피소드 번호) 목록을 반환합니다.
+        """
+        # 같은 (시즌, 에피소드)가 여러 번 나오면 행 단위 import와 같게 처음 행으로 만들고 이후 행으로 업데이트
+        parsed = {}
+        for i, row in enumerate(rows, start=start):
+            season_number, episode_number, title, content = self.parse_row(i, row)
+            key = (season_number, episode_number)
+            if key in parsed and not do_update:
+                continue
+            previous_title = parsed[key][0] if key in parsed else ""
+            parsed[key] = (title or previous_title, content)
+
+        season_numbers = {season_number for season_number, _ in parsed}
+        season_qs = Season.objects.filter(series=series, season_number__in=season_numbers)
+        seasons = {s.season_number: s for s in season_qs}
+        missing = sorted(season_numbers - set(seasons))
+        if missing:
+            Season.objects.bulk_create(
+                [Season(series=series, season_number=n) for n in missing], batch_size=batch_size
+            )
+            # DB에 따라 bulk_create가 pk를 채우지 않을 수 있으므로 다시 읽음
+            seasons = {s.season_number: s for s in season_qs.all()}
+
+        existing_qs = Episode.objects.filter(
+            season__in=[seasons[n] for n in season_numbers],
+            episode_number__in={episode_number for _, episode_number in parsed},
+        ).only("id", "season_id", "episode_number", "episode_title", "content_hash")  # 본문은 해시로 비교
+        existing = {(ep.season_id, ep.episode_number): ep for ep in existing_qs}
+        to_create, to_update = [], []
+        created_eps, updated_eps = [], []
+        for (season_number, episode_number), (title, content) in parsed.items():
+            season = seasons[season_number]
+            ep = existing.get((season.pk, episode_number))
+            if ep is None:
+                to_create.append(Episode(season=season, episode_number=episode_number, episode_title=title,
+                                         content=content, content_hash=episode_content_hash(title, content)))
+                created_eps.append((season_number, episode_number))
+                continue
+            if not do_update:
+                continue
+            title = title or ep.episode_title
+            content_hash = episode_content_hash(title, content)
+            if content_hash != ep.content_hash:
+                ep.episode_title, ep.content, ep.content_hash = title, content, content_hash
+                to_update.append(ep)
+                updated_eps.append((season_number, episode_number))
+
+        Episode.objects.bulk_create(to_create, batch_size=batch_size)
+        if to_update:
+            Episode.objects.bulk_update(to_update, ["episode_title", "content", "content_hash"], batch_size=batch_size)
+        # bulk 작업은 signal을 보내지 않지만, 검색 색인은 카탈로그 버전이 오르면 각 프로세스에서 다시 만들어짐
+        return created_eps, updated_eps
\ No newline at end of file
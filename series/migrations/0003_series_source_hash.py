@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-17 22:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('series', '0002_catalog_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='series',
+            name='source_hash',
+            field=models.CharField(blank=True, default='', editable=False, max_length=64),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.8 on 2026-10-17 22:35
+
+import config.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('series', '0003_series_source_hash'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='series',
+            name='photo',
+            field=models.ImageField(blank=True, null=True, storage=config.storage.content_addressed_storage, upload_to='series_photos/'),
+        ),
+    ]
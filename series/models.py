@@ -1,4 +1,5 @@
 from django.db import models
+from config.storage import content_addressed_storage
 from genre.models import Genre
 
 # Create your models here.
@@ -6,11 +7,32 @@ class Series(models.Model):
     title = models.CharField(max_length=255)  # NOT NULL
     photo = models.ImageField(
         upload_to="series_photos/",
+        storage=content_addressed_storage,  # 같은 이미지는 한 파일만 저장
         blank=True,
         null=True,
     )
     description = models.TextField(blank=True, null=True)
     genres = models.ManyToManyField( Genre, blank=True, related_name="series")
+    # 마지막으로 import한 원본 CSV(+이미지) 해시, 같으면 다시 import하지 않음
+    source_hash = models.CharField(max_length=64, blank=True, default="", editable=False)
 
     def __str__(self):
-        return self.title
\ No newline at end of file
+        return self.title
+
+
+class CatalogVersion(models.Model):
+    """
+    카탈로그(시리즈/시즌/에피소드/장르) 변경 버전
+
+    key가 "global"인 행은 카탈로그 전체, "series:<id>"인 행은 해당 시리즈가 바뀔 때마다 1씩 올라갑니다.
+    조회 API는 이 값으로 ETag를 만들어 본 테이블을 읽지 않고 304를 응답합니다. (series.catalog 참고)
+    """
+    key = models.CharField(max_length=64, unique=True)
+    version = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'catalog_version'
+
+    def __str__(self):
+        return f"{self.key}@{self.version}"
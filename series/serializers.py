@@ -1,8 +1,12 @@
 from rest_framework import serializers
+from config.fieldsets import SparseFieldsetSerializerMixin
 from .models import Series
 from genre.models import Genre
+from genre.serializers import GenreSerializer
+from season.models import Season
+from episode.models import Episode
 
-class SeriesSerializer(serializers.ModelSerializer):
+class SeriesSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     genres = serializers.PrimaryKeyRelatedField(
         many=True,
         queryset=Genre.objects.all(),
@@ -11,4 +15,29 @@ class SeriesSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Series
-        fields = ['id', 'title', 'photo', 'description', 'genres']
\ No newline at end of file
+        fields = ['id', 'title', 'photo', 'description', 'genres']
+
+
+class EpisodeHeaderSerializer(serializers.ModelSerializer):
+    """트리 응답용 에피소드 헤더 (본문 제외)"""
+    class Meta:
+        model = Episode
+        fields = ['id', 'episode_number', 'episode_title']
+
+
+class SeasonTreeSerializer(serializers.ModelSerializer):
+    episodes = EpisodeHeaderSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = Season
+        fields = ['id', 'season_number', 'episodes']
+
+
+class SeriesTreeSerializer(serializers.ModelSerializer):
+    """시리즈 페이지 한 번에 그리기용 (시리즈 + 장르 + 시즌 + 에피소드 헤더)"""
+    genres = GenreSerializer(many=True, read_only=True)
+    seasons = SeasonTreeSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = Series
+        fields = ['id', 'title', 'photo', 'description', 'genres', 'seasons']
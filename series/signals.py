@@ -0,0 +1,57 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from episode.models import Episode
+from genre.models import Genre
+from season.models import Season
+from .catalog import bump_catalog_version
+from .models import Series
+
+
+@receiver([post_save, post_delete], sender=Series)
+def bump_series_version(sender, instance, **kwargs):
+    bump_catalog_version([instance.pk])
+
+
+@receiver([post_save, post_delete], sender=Season)
+def bump_season_version(sender, instance, **kwargs):
+    bump_catalog_version([instance.series_id])
+
+
+@receiver([post_save, post_delete], sender=Episode)
+def bump_episode_version(sender, instance, **kwargs):
+    # 시즌이 함께 삭제된 경우 시리즈를 알 수 없으므로 전체 버전만 올림
+    series_id = Season.objects.filter(pk=instance.season_id).values_list("series_id", flat=True).first()
+    bump_catalog_version([series_id])
+
+
+@receiver(pre_delete, sender=Genre)
+def remember_genre_series(sender, instance, **kwargs):
+    # 삭제 후에는 연결된 시리즈를 조회할 수 없으므로 미리 기록
+    instance._catalog_series_ids = list(instance.series.values_list("id", flat=True))
+
+
+@receiver([post_save, post_delete], sender=Genre)
+def bump_genre_version(sender, instance, **kwargs):
+    # 시리즈 트리 응답에 장르 이름이 들어가므로 연결된 시리즈의 버전도 올림
+    series_ids = instance.__dict__.pop("_catalog_series_ids", None)
+    if series_ids is None:
+        series_ids = instance.series.values_list("id", flat=True)
+    bump_catalog_version(series_ids)
+
+
+@receiver(m2m_changed, sender=Series.genres.through)
+def bump_series_genres_version(sender, instance, action, reverse, pk_set, **kwargs):
+    if reverse and action == "pre_clear":
+        # genre.series.clear()는 post_clear에 pk_set이 없으므로 지워지기 전에 대상 시리즈를 기록
+        instance._catalog_series_ids = list(instance.series.values_list("id", flat=True))
+        return
+    if not action.startswith("post_"):
+        return
+    if reverse:
+        # genre.series.add(...) 처럼 장르 쪽에서 바꾼 경우
+        if action == "post_clear":
+            pk_set = instance.__dict__.pop("_catalog_series_ids", ())
+        bump_catalog_version(pk_set or ())
+    else:
+        bump_catalog_version([instance.pk])
@@ -26,3 +26,388 @@ class SeriesModelTest(TestCase):
         """시리즈 사진 필드가 선택사항인지 테스트"""
         series = Series.objects.create(title='사진없는 애니메이션')
         self.assertTrue(series.photo in (None, ''))  # photo가 None이거나 빈 문자열
+
+
+class SeriesAPITest(TestCase):
+    """시리즈 목록 API 테스트"""
+
+    def setUp(self):
+        from rest_framework.test import APIClient
+
+        self.client = APIClient()
+        genre = Genre.objects.create(name='액션')
+        for n in range(3):
+            Series.objects.create(title=f'시리즈{n}').genres.add(genre)
+
+    def test_list_prefetches_genres(self):
+        # 시리즈 수와 관계없이 (카탈로그 버전 + 시리즈 + 장르 prefetch) 3개 쿼리
+        with self.assertNumQueries(3):
+            response = self.client.get('/api/series/')
+        self.assertEqual(len(response.data['results']), 3)
+        self.assertEqual(len(response.data['results'][0]['genres']), 1)
+
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/series/', {'fields': 'title'})
+        self.assertEqual(response.data['results'][0], {'id': Series.objects.first().id, 'title': '시리즈0'})
+
+
+class CatalogETagTest(TestCase):
+    """카탈로그 버전과 조건부 GET 테스트"""
+
+    def setUp(self):
+        from rest_framework.test import APIClient
+
+        self.client = APIClient()
+        self.series = Series.objects.create(title='시리즈')
+        self.other = Series.objects.create(title='다른 시리즈')
+
+    def test_save_bumps_global_and_series_version(self):
+        from season.models import Season
+        from episode.models import Episode
+        from .catalog import get_catalog_version
+
+        before = (get_catalog_version(), get_catalog_version(self.series.id), get_catalog_version(self.other.id))
+        season = Season.objects.create(series=self.series, season_number=1)
+        Episode.objects.create(season=season, episode_number=1, content='본문')
+        after = (get_catalog_version(), get_catalog_version(self.series.id), get_catalog_version(self.other.id))
+        self.assertEqual(after, (before[0] + 2, before[1] + 2, before[2]))
+
+    def test_catalog_batch_bumps_once(self):
+        from .catalog import catalog_batch, get_catalog_version
+
+        before = get_catalog_version()
+        with catalog_batch():
+            for n in range(5):
+                Series.objects.create(title=f'일괄{n}')
+            self.assertEqual(get_catalog_version(), before)
+        self.assertEqual(get_catalog_version(), before + 1)
+
+    def test_if_none_match_returns_304(self):
+        response = self.client.get(f'/api/series/{self.series.id}/')
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+
+        # 버전 조회 1개 쿼리만 실행하고 본 테이블은 읽지 않음
+        with self.assertNumQueries(1):
+            response = self.client.get(f'/api/series/{self.series.id}/', HTTP_IF_NONE_MATCH=f'"x", W/{etag}')
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+
+        # 다른 시리즈가 바뀌어도 시리즈 ETag는 그대로
+        self.other.title = '변경'
+        self.other.save()
+        response = self.client.get(f'/api/series/{self.series.id}/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        self.series.title = '변경'
+        self.series.save()
+        response = self.client.get(f'/api/series/{self.series.id}/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response.data['title'], '변경')
+
+    def test_response_cache(self):
+        response = self.client.get('/api/series/')
+        self.assertEqual(response.status_code, 200)
+
+        # 같은 버전이면 직렬화된 응답을 캐시에서 그대로 반환 (버전 조회 1개 쿼리)
+        with self.assertNumQueries(1):
+            cached = self.client.get('/api/series/')
+        self.assertEqual(cached.content, response.content)
+        self.assertEqual(cached['ETag'], response['ETag'])
+
+        # 저장하면 버전이 바뀌어 다른 키를 사용
+        self.series.title = '변경'
+        self.series.save()
+        response = self.client.get('/api/series/')
+        self.assertEqual(response.json()['results'][0]['title'], '변경')
+
+
+class SeriesTreeAPITest(TestCase):
+    """시리즈 트리 API 테스트"""
+
+    def setUp(self):
+        from rest_framework.test import APIClient
+        from season.models import Season
+        from episode.models import Episode
+
+        self.client = APIClient()
+        self.series = Series.objects.create(title='나루토')
+        self.series.genres.add(Genre.objects.create(name='액션'))
+        for season_number in (2, 1):
+            season = Season.objects.create(series=self.series, season_number=season_number)
+            for n in (2, 1):
+                Episode.objects.create(season=season, episode_number=n, episode_title=f'{season_number}-{n}', content='본문')
+
+    def test_tree(self):
+        # 버전 조회 + 시리즈 + 장르/시즌/에피소드 prefetch
+        with self.assertNumQueries(5):
+            response = self.client.get(f'/api/series/{self.series.id}/tree/')
+        self.assertEqual(response.status_code, 200)
+        data = response.data
+        self.assertEqual(data['genres'][0]['name'], '액션')
+        self.assertEqual([s['season_number'] for s in data['seasons']], [1, 2])
+        self.assertEqual([e['episode_title'] for e in data['seasons'][0]['episodes']], ['1-1', '1-2'])
+        self.assertNotIn('content', data['seasons'][0]['episodes'][0])
+
+        # 같은 버전이면 캐시된 응답, ETag가 같으면 304
+        with self.assertNumQueries(1):
+            cached = self.client.get(f'/api/series/{self.series.id}/tree/')
+        self.assertEqual(cached.content, response.content)
+        response = self.client.get(f'/api/series/{self.series.id}/tree/', HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_tree_reflects_genre_rename(self):
+        url = f'/api/series/{self.series.id}/tree/'
+        etag = self.client.get(url)['ETag']
+
+        genre = self.series.genres.get()
+        genre.name = '모험'
+        genre.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['genres'][0]['name'], '모험')
+
+        # 장르 쪽에서 clear해도 시리즈 버전이 오름
+        etag = response['ETag']
+        genre.series.clear()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['genres'], [])
+
+    def test_tree_not_found(self):
+        self.assertEqual(self.client.get('/api/series/999999/tree/').status_code, 404)
+
+
+class ImportEpisodeCommandTest(TestCase):
+    """import_episode 명령 (행 단위 / bulk) 테스트"""
+
+    HEADER = 'title,description,season,episode,episode_title,content,genre\n'
+
+    def write_csv(self, rows):
+        import os
+        import tempfile
+
+        f = tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False, encoding='utf-8')
+        f.write(self.HEADER + ''.join(rows))
+        f.close()
+        self.addCleanup(os.unlink, f.name)
+        return f.name
+
+    def run_import(self, path, *args):
+        from io import StringIO
+        from django.core.management import call_command
+
+        out = StringIO()
+        call_command('import_episode', path, *args, stdout=out)
+        return out.getvalue()
+
+    def snapshot(self):
+        from episode.models import Episode
+
+        return sorted(Episode.objects.values_list(
+            'season__series__title', 'season__season_number', 'episode_number', 'episode_title', 'content'))
+
+    def test_bulk_matches_row_import(self):
+        rows = [f'프렌즈,시트콤,{s},{e},제목{s}-{e},본문{s}-{e},"코미디, 드라마"\n' for s in (1, 2) for e in range(1, 31)]
+        path = self.write_csv(rows)
+
+        self.run_import(path)
+        expected = self.snapshot()
+        Series.objects.all().delete()
+
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        with CaptureQueriesContext(connection) as queries:
+            out = self.run_import(path, '--bulk', '--batch-size', '25')
+        self.assertIn('생성 60개', out)
+        self.assertEqual(self.snapshot(), expected)
+        # 행 수(60)와 관계없이 수십 개 미만의 쿼리
+        self.assertLess(len(queries), 25)
+        series = Series.objects.get(title='프렌즈')
+        self.assertEqual(sorted(series.genres.values_list('name', flat=True)), ['드라마', '코미디'])
+
+    def test_bulk_update(self):
+        path = self.write_csv(['나루토,닌자,1,1,시험,낙제\n', '나루토,닌자,1,2,라멘,이루카\n'])
+        self.run_import(path, '--bulk')
+
+        path = self.write_csv(['나루토,닌자,1,1,시험,합격\n', '나루토,닌자,1,2,라멘,이루카\n', '나루토,닌자,2,1,결전,사스케\n'])
+        out = self.run_import(path, '--bulk', '--update')
+        self.assertIn('생성 1개, 업데이트 1개', out)
+        self.assertEqual([row[-1] for row in self.snapshot()], ['합격', '이루카', '사스케'])
+
+    def test_row_update_compares_content_hash(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from episode.models import Episode, episode_content_hash
+
+        self.run_import(self.write_csv(['나루토,닌자,1,1,시험,낙제\n', '나루토,닌자,1,2,라멘,이루카\n']))
+
+        path = self.write_csv(['나루토,닌자,1,1,시험,합격\n', '나루토,닌자,1,2,라멘,이루카\n'])
+        with CaptureQueriesContext(connection) as queries:
+            out = self.run_import(path, '--update')
+        self.assertIn('생성 0개, 업데이트 1개', out)
+        # 기존 에피소드의 본문은 읽지 않음 (변경된 행의 UPDATE에만 포함)
+        selects = [q['sql'] for q in queries.captured_queries if q['sql'].startswith('SELECT')]
+        self.assertFalse(any('."content",' in sql or '."content" ' in sql for sql in selects))
+        episode = Episode.objects.get(episode_number=1)
+        self.assertEqual((episode.content, episode.content_hash), ('합격', episode_content_hash('시험', '합격')))
+
+    def test_stream_resume_after_failure(self):
+        import os
+        from unittest import mock
+        from series.management.commands.import_episode import Command
+
+        rows = [f'나루토,닌자,1,{e},{e}화,본문{e},액션\n' for e in range(1, 8)]
+        path = self.write_csv(rows)
+        checkpoint = f'{path}.checkpoint'
+        self.addCleanup(lambda: os.path.exists(checkpoint) and os.unlink(checkpoint))
+
+        # 세 번째 chunk에서 실패하면 앞의 두 chunk(4행)만 커밋되고 checkpoint가 남음
+        original = Command.import_episodes_bulk
+        calls = []
+
+        def flaky(command, *args, **kwargs):
+            calls.append(kwargs['start'])
+            if len(calls) == 3:
+                raise RuntimeError('중단')
+            return original(command, *args, **kwargs)
+
+        with mock.patch.object(Command, 'import_episodes_bulk', flaky), self.assertRaises(RuntimeError):
+            self.run_import(path, '--stream', '--chunk-size', '2')
+        self.assertEqual(len(self.snapshot()), 4)
+        self.assertTrue(os.path.exists(checkpoint))
+        # 커밋된 chunk마다 시리즈 버전이 올라 있음 (생성 1 + chunk 2)
+        from .catalog import get_catalog_version
+        self.assertEqual(get_catalog_version(Series.objects.get(title='나루토').id), 3)
+
+        with mock.patch.object(Command, 'import_episodes_bulk', autospec=True, side_effect=original) as bulk:
+            out = self.run_import(path, '--stream', '--chunk-size', '2', '--resume')
+        self.assertIn('4행까지 건너뜀', out)
+        self.assertIn('rows/s', out)
+        self.assertIn('생성 3개', out)
+        self.assertEqual([call.kwargs['start'] for call in bulk.call_args_list], [5, 7])
+        self.assertEqual([row[2] for row in self.snapshot()], list(range(1, 8)))
+        self.assertFalse(os.path.exists(checkpoint))
+        self.assertEqual(list(Series.objects.get(title='나루토').genres.values_list('name', flat=True)), ['액션'])
+
+    def test_skips_unchanged_file_and_rows(self):
+        from episode.models import Episode, episode_content_hash
+
+        rows = ['나루토,닌자,1,1,시험,낙제\n', '나루토,닌자,1,2,라멘,이루카\n']
+        path = self.write_csv(rows)
+        self.run_import(path, '--bulk', '--update')
+        episode = Episode.objects.get(episode_number=1)
+        self.assertEqual(episode.content_hash, episode_content_hash('시험', '낙제'))
+
+        # 같은 파일은 시리즈만 확인하고 건너뜀 (SAVEPOINT/RELEASE + SELECT 1개, 카탈로그 버전도 그대로)
+        with self.assertNumQueries(3):
+            out = self.run_import(path, '--bulk', '--update')
+        self.assertIn('변경 없음', out)
+
+        # 바뀐 행만 업데이트하고 변경 목록을 보고
+        path = self.write_csv(['나루토,닌자,1,1,시험,합격\n', '나루토,닌자,1,2,라멘,이루카\n'])
+        out = self.run_import(path, '--bulk', '--update', '--verbosity', '2')
+        self.assertIn('생성 0개, 업데이트 1개', out)
+        self.assertIn('변경된 에피소드: S1E1', out)
+        episode.refresh_from_db()
+        self.assertEqual((episode.content, episode.content_hash), ('합격', episode_content_hash('시험', '합격')))
+
+        # --force로 다시 import해도 바뀐 것이 없으면 카탈로그 버전은 그대로
+        from .catalog import get_catalog_version
+        version = get_catalog_version(episode.season.series_id)
+        out = self.run_import(path, '--bulk', '--update', '--force')
+        self.assertIn('생성 0개, 업데이트 0개', out)
+        self.assertEqual(get_catalog_version(episode.season.series_id), version)
+
+    def test_rebuilds_existing_vector_index(self):
+        import tempfile
+        from django.test import override_settings
+        from episode.vector_index import build_series_vectors, get_vector_index, search_vectors
+
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        override = override_settings(EPISODE_VECTOR_INDEX_DIR=tmpdir.name)
+        override.enable()
+        self.addCleanup(override.disable)
+
+        path = self.write_csv(['나루토,닌자,1,1,시험,낙제\n'])
+        self.run_import(path, '--bulk')
+        series = Series.objects.get(title='나루토')
+        build_series_vectors(series.id)
+
+        path = self.write_csv(['나루토,닌자,1,1,시험,낙제\n', '나루토,닌자,1,2,라멘,이루카가 라멘을 사준다\n'])
+        out = self.run_import(path, '--bulk')
+        self.assertIn('임베딩 색인 재빌드', out)
+        self.assertEqual(len(get_vector_index(series.id).passages), 2)
+        self.assertEqual(search_vectors(series.id, '라멘', k=1)[0].episode_number, 2)
+
+    def test_image_is_stored_once(self):
+        import os
+        import tempfile
+        from unittest import mock
+        from django.db.models.fields.files import FieldFile
+        from django.test import override_settings
+
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        override = override_settings(MEDIA_ROOT=media.name)
+        override.enable()
+        self.addCleanup(override.disable)
+
+        images = []
+        for name in ('naruto.webp', 'naruto_copy.webp'):
+            path = os.path.join(media.name, name)
+            with open(path, 'wb') as f:
+                f.write(b'same image bytes')
+            images.append(path)
+
+        path = self.write_csv(['나루토,닌자,1,1,시험,낙제\n'])
+        self.run_import(path, '--image', images[0])
+        photo = Series.objects.get(title='나루토').photo.name
+
+        # 같은 내용의 이미지는 파일을 다시 쓰지 않음
+        with mock.patch.object(FieldFile, 'save') as save:
+            self.run_import(path, '--image', images[1], '--force')
+        save.assert_not_called()
+        self.assertEqual(Series.objects.get(title='나루토').photo.name, photo)
+        self.assertEqual(len(os.listdir(os.path.join(media.name, 'series_photos'))), 1)
+
+
+class ImportCatalogCommandTest(TestCase):
+    """import_catalog 명령 테스트"""
+
+    def setUp(self):
+        import tempfile
+
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        header = 'title,description,season,episode,episode_title,content,genre\n'
+        files = {
+            'naruto.csv': '나루토,닌자,1,1,시험,낙제,액션\n나루토,닌자,1,2,라멘,이루카,액션\n',
+            'friends.csv': '프렌즈,시트콤,1,1,시작,커피,코미디\n',
+            'broken.csv': '망가진,설명,1,1,첫화,본문,\n망가진,설명,일,2,둘째화,본문,\n',
+        }
+        for name, body in files.items():
+            with open(f'{self.tmpdir.name}/{name}', 'w', encoding='utf-8') as f:
+                f.write(header + body)
+
+    def test_isolates_failures_and_reports(self):
+        from io import StringIO
+        from django.core.management import call_command
+        from django.core.management.base import CommandError
+        from episode.models import Episode
+
+        out = StringIO()
+        with self.assertRaisesMessage(CommandError, '1개 파일 import 실패: broken.csv'):
+            call_command('import_catalog', self.tmpdir.name, workers=1, stdout=out)
+        report = out.getvalue()
+        self.assertRegex(report, r'naruto\.csv\s+\d+\.\d+s\s+2행  생성 2개')
+        self.assertRegex(report, r'friends\.csv\s+\d+\.\d+s\s+1행  생성 1개')
+        self.assertIn('broken.csv', report)
+        self.assertIn('완료: 3개 파일, 3행', report)
+
+        # 실패한 파일은 롤백되고 나머지는 유지
+        self.assertEqual(sorted(Series.objects.values_list('title', flat=True)), ['나루토', '프렌즈'])
+        self.assertEqual(Episode.objects.count(), 3)
@@ -1,21 +1,52 @@
+from django.db.models import Prefetch
+from django.shortcuts import get_object_or_404
 from rest_framework import viewsets, permissions
+from rest_framework.decorators import action
 from rest_framework.response import Response
 from .models import Series
-from .serializers import SeriesSerializer
+from .serializers import SeriesSerializer, SeriesTreeSerializer
+from season.models import Season
+from episode.models import Episode
+from .catalog import CatalogETagMixin
+from config.fieldsets import SparseFieldsetMixin, FIELDSET_PARAMETERS
+from config.pagination import DefaultCursorPagination, CURSOR_PARAMETERS
 from drf_yasg.utils import swagger_auto_schema
-from drf_yasg import openapi
 
-class SeriesViewSet(viewsets.ReadOnlyModelViewSet):
+
+class SeriesCursorPagination(DefaultCursorPagination):
+    ordering = ('id',)
+
+
+class SeriesViewSet(CatalogETagMixin, SparseFieldsetMixin, viewsets.ReadOnlyModelViewSet):
     """
     시리즈(애니메이션) 정보를 관리하는 ViewSet
     """
     queryset = Series.objects.all()
     serializer_class = SeriesSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    pagination_class = SeriesCursorPagination
+
+    def get_catalog_series_id(self):
+        pk = self.kwargs.get('pk')
+        return int(pk) if self.action in ('retrieve', 'tree') and str(pk).isdigit() else None
+
+    def get_serializer_class(self):
+        if self.action == 'tree':
+            return SeriesTreeSerializer
+        return super().get_serializer_class()
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        fields = self.get_sparse_fields()
+        if fields is None or 'genres' in fields:
+            # 시리즈마다 장르를 따로 조회하지 않도록 한 번에 가져옴
+            queryset = queryset.prefetch_related('genres')
+        return queryset
 
     @swagger_auto_schema(
         operation_summary="시리즈 목록 조회",
-        operation_description="등록된 모든 시리즈(애니메이션) 목록을 반환합니다.",
+        operation_description="등록된 시리즈(애니메이션) 목록을 ID 순 cursor 페이지로 반환합니다.",
+        manual_parameters=CURSOR_PARAMETERS + FIELDSET_PARAMETERS,
         responses={200: SeriesSerializer(many=True)}
     )
     def list(self, request):
@@ -24,10 +55,34 @@ class SeriesViewSet(viewsets.ReadOnlyModelViewSet):
     @swagger_auto_schema(
         operation_summary="시리즈 상세 조회",
         operation_description="특정 시리즈의 상세 정보를 조회합니다.",
+        manual_parameters=FIELDSET_PARAMETERS,
         responses={
             200: SeriesSerializer(),
             404: "시리즈를 찾을 수 없습니다."
         }
     )
     def retrieve(self, request, pk=None):
-        return super().retrieve(request, pk=pk)
\ No newline at end of file
+        return super().retrieve(request, pk=pk)
+
+    @swagger_auto_schema(
+        operation_summary="시리즈 트리 조회",
+        operation_description=(
+            "시리즈 정보, 장르, 시즌과 시즌별 에피소드 헤더(번호, 제목)를 한 번에 반환합니다. (에피소드 본문 제외)\n\n"
+            "시리즈 페이지를 그릴 때 시리즈/시즌/에피소드 목록을 따로 호출하지 않아도 됩니다."
+        ),
+        responses={
+            200: SeriesTreeSerializer(),
+            404: "시리즈를 찾을 수 없습니다."
+        }
+    )
+    @action(detail=True, methods=['get'])
+    def tree(self, request, pk=None):
+        return self._conditional(self._tree, request, pk=pk)
+
+    def _tree(self, request, pk=None):
+        # 시리즈 1개 + 장르/시즌/에피소드 prefetch 3개 쿼리
+        episodes = Episode.objects.only('id', 'season_id', 'episode_number', 'episode_title').order_by('episode_number')
+        seasons = Season.objects.order_by('season_number').prefetch_related(Prefetch('episodes', queryset=episodes))
+        queryset = Series.objects.prefetch_related('genres', Prefetch('seasons', queryset=seasons))
+        series = get_object_or_404(queryset, pk=pk)
+        return Response(self.get_serializer(series).data)
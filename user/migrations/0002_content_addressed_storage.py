@@ -0,0 +1,19 @@
+# Generated by Django 5.2.8 on 2026-10-17 22:35
+
+import config.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='profile_image',
+            field=models.ImageField(blank=True, help_text='프로필 이미지', null=True, storage=config.storage.content_addressed_storage, upload_to='profile_images/'),
+        ),
+    ]
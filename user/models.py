@@ -1,12 +1,13 @@
 from django.db import models
 from django.contrib.auth.models import AbstractUser
+from config.storage import content_addressed_storage
 
 class User(AbstractUser):
     """
     사용자 모델
     """
     nickname = models.CharField(max_length=50, unique=True, help_text="사용자의 닉네임")
-    profile_image = models.ImageField(upload_to='profile_images/', null=True, blank=True, help_text="프로필 이미지")
+    profile_image = models.ImageField(upload_to='profile_images/', storage=content_addressed_storage, null=True, blank=True, help_text="프로필 이미지")
     
     # 소셜 로그인 필드
     kakao_id = models.CharField(max_length=100, null=True, blank=True, unique=True, help_text="카카오 소셜 ID")
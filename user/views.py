@@ -8,6 +8,7 @@ from rest_framework.views import APIView
 from rest_framework_simplejwt.views import TokenObtainPairView
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from config.http import http_client
 from .serializers import RegisterSerializer, UserSerializer, KakaoUserSerializer
 
 User = get_user_model()
@@ -182,7 +183,12 @@ class KakaoCallbackView(APIView):
             'code': code,
         }
         
-        token_response = requests.post(token_url, data=data)
+        # 카카오 API는 공유 HTTP 클라이언트로 호출 (keep-alive 연결 재사용, 기본 timeout)
+        try:
+            token_response = http_client.post(token_url, data=data)
+        except requests.RequestException:
+            return Response({'error': 'Failed to get access token'},
+                          status=status.HTTP_502_BAD_GATEWAY)
         if not token_response.ok:
             return Response({'error': 'Failed to get access token'}, 
                           status=status.HTTP_400_BAD_REQUEST)
@@ -196,7 +202,11 @@ class KakaoCallbackView(APIView):
             'Content-type': 'application/x-www-form-urlencoded;charset=utf-8'
         }
         
-        user_response = requests.get(user_url, headers=headers)
+        try:
+            user_response = http_client.get(user_url, headers=headers)
+        except requests.RequestException:
+            return Response({'error': 'Failed to get user info'},
+                          status=status.HTTP_502_BAD_GATEWAY)
         if not user_response.ok:
             return Response({'error': 'Failed to get user info'}, 
                           status=status.HTTP_400_BAD_REQUEST)
@@ -215,7 +225,7 @@ class KakaoCallbackView(APIView):
             if not url:
                 return None
             try:
-                response = requests.get(url)
+                response = http_client.get(url)
                 if response.ok:
                     from django.core.files.base import ContentFile
                     from io import BytesIO